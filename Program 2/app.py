@@ -3,17 +3,34 @@ Streamlit Web Interface for SLA Genetic Algorithm Scheduler
 Modern, interactive UI with real-time visualizations and controls.
 """
 import streamlit as st
+import altair as alt
+import numpy as np
+from numba import config, set_num_threads
 import pandas as pd
-import matplotlib.pyplot as plt
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import io
+import multiprocessing
 import os
+import queue
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
 
-# Ensure output directory exists
-os.makedirs("output", exist_ok=True)
+# Streamlit runs this script on its own threads, not the main thread. Numba's
+# TBB layer, its first choice, keeps the interpreter from exiting once it has
+# started on such a thread, so the server process prefers OpenMP. Spawned GA
+# workers run this script as __mp_main__ and keep Numba's default selection.
+if __name__ == "__main__":
+    config.THREADING_LAYER_PRIORITY = ["omp", "workqueue", "tbb"]
 
 # Import GA components from gen module
-from gen.algorithm_engine import execute_genetic_algorithm
-from gen.fitness_evaluator import fitness_calculator
+from gen.algorithm_engine import IMPROVEMENT_WINDOW, QueueProgressReporter
+from gen.fitness_evaluator import fitness_calculator, warm_up_kernels
+from gen.result_cache import get_or_compute, load_cached_result
 
 # ============================================================================
 # PAGE CONFIGURATION AND STYLING
@@ -31,289 +48,202 @@ st.set_page_config(
     }
 )
 
-# Custom CSS with PINK theme
-st.markdown("""
-    <style>
-    /* Main container styling */
-    .main {
-        padding: 2rem;
-        background-color: #fff5f7;
-    }
+# Custom CSS with PINK theme (kept in styles/pink_theme.css)
+THEME_STYLESHEET = Path(__file__).parent / "styles" / "pink_theme.css"
 
-    /* Button styling - PINK gradient */
-    .stButton > button {
-        background: linear-gradient(135deg, #ff6b9d 0%, #ff8fab 100%);
-        color: white;
-        font-weight: 600;
-        border: none;
-        border-radius: 12px;
-        padding: 0.75rem 1.5rem;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 12px rgba(255, 107, 157, 0.3);
-    }
 
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(255, 107, 157, 0.4);
-        background: linear-gradient(135deg, #ff4d8d 0%, #ff7ba3 100%);
-    }
+@st.cache_data
+def _theme_css():
+    """Read the theme stylesheet once instead of on every rerun."""
+    return f"<style>\n{THEME_STYLESHEET.read_text(encoding='utf-8')}</style>"
 
-    /* Metric card styling - PINK theme */
-    .metric-card {
-        background: linear-gradient(135deg, #fff0f6 0%, #ffe4ec 100%);
-        border-radius: 15px;
-        padding: 1.5rem;
-        box-shadow: 0 4px 15px rgba(255, 107, 157, 0.15);
-        border-left: 5px solid #ff6b9d;
-        margin: 1rem 0;
-        color: #5a2d47 !important;
-        border: 1px solid #ffd6e3;
-    }
 
-    .metric-card h4 {
-        color: #9c4665 !important;
-        margin-bottom: 1rem;
-        border-bottom: 2px solid #ffb8d1;
-        padding-bottom: 0.5rem;
-        font-size: 1.1rem;
-    }
-
-    .metric-card p {
-        color: #5a2d47 !important;
-        margin-bottom: 0.5rem;
-        font-size: 0.95rem;
-    }
-
-    .metric-card strong {
-        color: #9c4665 !important;
-    }
+# Streamlit drops elements a rerun does not emit, so the style block is sent every run
+st.markdown(_theme_css(), unsafe_allow_html=True)
 
-    /* Tab styling - PINK */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-        background-color: #fff5f7;
-    }
-
-    .stTabs [data-baseweb="tab"] {
-        border-radius: 12px 12px 0 0;
-        padding: 10px 20px;
-        font-weight: 500;
-        background-color: #ffe4ec;
-        color: #9c4665;
-        border: 1px solid #ffb8d1;
-        margin-right: 5px;
-    }
+# ============================================================================
+# OUTPUT DIRECTORY
+# ============================================================================
 
-    .stTabs [data-baseweb="tab"][aria-selected="true"] {
-        background-color: #ff6b9d;
-        color: white;
-        border-color: #ff6b9d;
-    }
 
-    /* Dataframe styling */
-    .dataframe {
-        border-radius: 12px;
-        overflow: hidden;
-        box-shadow: 0 2px 10px rgba(255, 107, 157, 0.1);
-        border: 1px solid #ffd6e3;
-    }
+@st.cache_resource
+def _ensure_output_dir():
+    """Create the output directory once per server, on first use."""
+    os.makedirs("output", exist_ok=True)
+    return "output"
 
-    /* Success message styling - PINK */
-    .stSuccess {
-        border-radius: 12px;
-        padding: 1rem;
-        background-color: #ffe4ec;
-        color: #9c4665;
-        border: 1px solid #ffb8d1;
-    }
 
-    /* Info message styling */
-    .stInfo {
-        border-radius: 12px;
-        padding: 1rem;
-        background-color: #e8f4f8;
-        color: #2c5282;
-        border: 1px solid #90cdf4;
-    }
-
-    /* Warning message styling */
-    .stWarning {
-        border-radius: 12px;
-        padding: 1rem;
-        background-color: #fff5e6;
-        color: #975a16;
-        border: 1px solid #fed7aa;
-    }
+# ============================================================================
+# SESSION STATE INITIALIZATION
+# ============================================================================
 
-    /* Error message styling */
-    .stError {
-        border-radius: 12px;
-        padding: 1rem;
-        background-color: #ffe4e6;
-        color: #9b2c2c;
-        border: 1px solid #feb2b2;
-    }
+if "algorithm_results" not in st.session_state:
+    st.session_state.algorithm_results = None
 
-    /* Sidebar styling - PINK gradient */
-    .sidebar .sidebar-content {
-        background: linear-gradient(180deg, #fff5f7 0%, #ffe4ec 100%);
-        border-right: 3px solid #ffb8d1;
-    }
+if "execution_timestamp" not in st.session_state:
+    st.session_state.execution_timestamp = None  # time.time() of the last completed run
 
-    /* Slider styling */
-    .stSlider > div > div {
-        background-color: #ffd6e3;
-    }
+if "ga_run" not in st.session_state:
+    st.session_state.ga_run = None  # In-flight background run, if any
 
-    .stSlider > div > div > div {
-        background-color: #ff6b9d;
-    }
+if "results_id" not in st.session_state:
+    st.session_state.results_id = None  # Identifies the displayed results for view caches
 
-    /* Checkbox styling */
-    .stCheckbox > label {
-        color: #5a2d47;
-    }
+# ============================================================================
+# CACHED ALGORITHM EXECUTION
+# ============================================================================
 
-    .stCheckbox > div > div {
-        background-color: #ffd6e3;
-        border-color: #ffb8d1;
-    }
 
-    .stCheckbox > div > div[aria-checked="true"] {
-        background-color: #ff6b9d;
-        border-color: #ff6b9d;
-    }
+# Number of completed runs kept in memory
+GA_CACHE_MAX_ENTRIES = 32
 
-    /* Radio button styling */
-    .stRadio > div {
-        background-color: #ffe4ec;
-        border-radius: 10px;
-        padding: 10px;
-        border: 1px solid #ffb8d1;
-    }
 
-    .stRadio > div > label {
-        color: #5a2d47;
-    }
+@st.cache_resource
+def _ga_result_cache():
+    """Completed GA runs keyed on their parameters, shared across reruns and sessions."""
+    return {"results": OrderedDict(), "hits": 0, "disk_hits": 0, "misses": 0}
 
-    .stRadio > div > div[data-baseweb="radio"] > div {
-        background-color: #ffd6e3;
-        border-color: #ffb8d1;
-    }
 
-    .stRadio > div > div[data-baseweb="radio"] > div[aria-checked="true"] {
-        background-color: #ff6b9d;
-        border-color: #ff6b9d;
-    }
+def _remember_result(cache_key, results):
+    """Store a completed run in the in-memory LRU cache."""
+    # Partial runs must not stand in for the full result of these parameters
+    if results["stopped_early"]:
+        return
 
-    /* Violation styling - PINK theme */
-    .violation-perfect {
-        color: #48bb78 !important;
-        font-weight: bold;
-    }
+    cache = _ga_result_cache()
+    cache["results"][cache_key] = results
+    if len(cache["results"]) > GA_CACHE_MAX_ENTRIES:
+        cache["results"].popitem(last=False)
 
-    .violation-good {
-        color: #ff6b9d !important;
-        font-weight: bold;
-    }
 
-    .violation-warning {
-        color: #ed8936 !important;
-        font-weight: bold;
-    }
+def _publish_results(results):
+    """Show a completed run, giving it a fresh id so derived views are rebuilt once."""
+    st.session_state.algorithm_results = results
+    st.session_state.execution_timestamp = time.time()
+    st.session_state.results_id = uuid.uuid4().hex
 
-    .violation-danger {
-        color: #f56565 !important;
-        font-weight: bold;
-    }
 
-    /* Ensure all text is visible */
-    .stMarkdown, .stText, .stDataFrame, .stMetric {
-        color: #5a2d47 !important;
+# ============================================================================
+# BACKGROUND EXECUTION
+# ============================================================================
+# Runs execute in worker processes so the script thread keeps serving the UI.
+# Workers and the manager are spawned rather than forked from the
+# multi-threaded server. Streamlit installs this script as __main__, so every
+# spawned process re-executes it as __mp_main__; code that starts processes
+# must therefore never run at module level unguarded.
+# Lookups go memory -> disk (gen.result_cache) -> background computation.
+
+
+# Concurrent runs beyond this queue for a free worker. Each worker's compiled
+# kernel gets an equal share of the cores, so however many sessions are running,
+# the machine never has more kernel threads than cores.
+GA_WORKER_PROCESSES = min(2, os.cpu_count() or 1)
+GA_KERNEL_THREADS_PER_WORKER = max(1, (os.cpu_count() or 1) // GA_WORKER_PROCESSES)
+
+
+@st.cache_resource
+def _ga_executor():
+    """Worker processes that run the GA off the Streamlit script thread."""
+    executor = ProcessPoolExecutor(
+        max_workers=GA_WORKER_PROCESSES,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=set_num_threads,
+        initargs=(GA_KERNEL_THREADS_PER_WORKER,)
+    )
+    # Load the compiled fitness kernels in a worker now rather than on the first click
+    executor.submit(warm_up_kernels)
+    return executor
+
+
+@st.cache_resource
+def _ga_progress_manager():
+    """Manager process hosting the progress queues and stop events shared with workers."""
+    return multiprocessing.get_context("spawn").Manager()
+
+
+if __name__ == "__main__":
+    # Start the workers with the app, not on the first click
+    _ga_executor()
+
+
+def _start_background_run(cache_key, run_parameters):
+    """Submit a GA run to the worker pool and record it in session state."""
+    manager = _ga_progress_manager()
+    progress_queue = manager.Queue()
+    stop_event = manager.Event()
+
+    future = _ga_executor().submit(
+        get_or_compute,
+        run_parameters,
+        progress_callback=QueueProgressReporter(progress_queue, stop_event)
+    )
+
+    st.session_state.ga_run = {
+        "future": future,
+        "cache_key": cache_key,
+        "progress_queue": progress_queue,
+        "stop_event": stop_event,
+        "start_time": time.time(),
+        "maximum_generations": run_parameters["maximum_generations"],
+        "history": {"best": [], "avg": []},
     }
 
-    /* Header styling */
-    h1, h2, h3 {
-        color: #9c4665 !important;
-    }
 
-    /* Violation summary boxes - PINK theme */
-    .violation-summary {
-        background: linear-gradient(135deg, #fff0f6 0%, #ffe4ec 100%);
-        border-radius: 15px;
-        padding: 25px;
-        margin: 20px 0;
-        border-left: 6px solid;
-        box-shadow: 0 4px 15px rgba(255, 107, 157, 0.2);
-        border: 1px solid #ffd6e3;
-    }
+def _request_stop():
+    """Ask the running GA to finish after its current generation."""
+    if st.session_state.ga_run is not None:
+        st.session_state.ga_run["stop_event"].set()
 
-    .summary-perfect {
-        border-left-color: #48bb78;
-        background: linear-gradient(135deg, #f0fff4 0%, #c6f6d5 100%);
-    }
 
-    .summary-good {
-        border-left-color: #ff6b9d;
-        background: linear-gradient(135deg, #fff0f6 0%, #ffe4ec 100%);
-    }
+def _reset_results():
+    """Discard the current results; runs before the script so no extra rerun is needed."""
+    _request_stop()
+    st.session_state.ga_run = None
+    st.session_state.algorithm_results = None
+    st.session_state.execution_timestamp = None
+    st.session_state.results_id = None
 
-    .summary-warning {
-        border-left-color: #ed8936;
-        background: linear-gradient(135deg, #fffaf0 0%, #feebc8 100%);
-    }
 
-    .summary-danger {
-        border-left-color: #f56565;
-        background: linear-gradient(135deg, #fff5f5 0%, #fed7d7 100%);
-    }
+@st.fragment(run_every=0.5)
+def _render_background_run():
+    """Poll the in-flight run, showing live progress until its result arrives."""
+    ga_run = st.session_state.ga_run
+    if ga_run is None:
+        return
 
-    /* Expander styling */
-    .streamlit-expanderHeader {
-        background-color: #ffe4ec;
-        color: #9c4665;
-        border-radius: 10px;
-        border: 1px solid #ffb8d1;
-    }
+    # Drain progress reported since the last poll
+    while True:
+        try:
+            generations_completed, best_fitness, average_fitness = ga_run["progress_queue"].get_nowait()
+        except queue.Empty:
+            break
+        ga_run["history"]["best"].append(best_fitness)
+        ga_run["history"]["avg"].append(average_fitness)
 
-    .streamlit-expanderContent {
-        background-color: #fff5f7;
-        border-radius: 0 0 10px 10px;
-        border: 1px solid #ffb8d1;
-        border-top: none;
-    }
+    if ga_run["future"].done():
+        st.session_state.ga_run = None
+        results = ga_run["future"].result()
+        _remember_result(ga_run["cache_key"], results)
 
-    /* Footer styling */
-    footer {
-        color: #9c4665 !important;
-    }
+        _publish_results(results)
 
-    /* Custom pink icons */
-    .pink-icon {
-        color: #ff6b9d;
-    }
+        # Re-render the whole page so the results tabs pick up the new run
+        st.rerun()
 
-    /* Custom pink badges */
-    .pink-badge {
-        background-color: #ff6b9d;
-        color: white;
-        padding: 2px 8px;
-        border-radius: 12px;
-        font-size: 0.8rem;
-        font-weight: 600;
-    }
-    </style>
-""", unsafe_allow_html=True)
+    elapsed_seconds = time.time() - ga_run["start_time"]
+    generations_completed = len(ga_run["history"]["best"])
 
-# ============================================================================
-# SESSION STATE INITIALIZATION
-# ============================================================================
+    if generations_completed:
+        status_text = (f"🚀 Generation {generations_completed} of up to {ga_run['maximum_generations']} "
+                       f"— best fitness {ga_run['history']['best'][-1]:.2f} · {elapsed_seconds:.1f}s")
+    else:
+        status_text = f"🚀 Starting genetic algorithm optimization... {elapsed_seconds:.1f}s"
 
-if "algorithm_results" not in st.session_state:
-    st.session_state.algorithm_results = None
+    st.progress(min(generations_completed / ga_run["maximum_generations"], 1.0), text=status_text)
+    st.line_chart(pd.DataFrame(ga_run["history"]), color=["#ff8fab", "#ff6b9d"])
+    st.button("⏹️ Stop Optimization", on_click=_request_stop,
+              disabled=ga_run["stop_event"].is_set())
 
-if "execution_timestamp" not in st.session_state:
-    st.session_state.execution_timestamp = None
 
 # ============================================================================
 # SIDEBAR - ALGORITHM CONTROLS
@@ -334,6 +264,15 @@ with st.sidebar:
             help="Number of schedules in each generation"
         )
 
+        number_of_islands = st.slider(
+            "Islands",
+            min_value=1,
+            max_value=max(2, os.cpu_count() or 1),
+            value=1,
+            help="Evolve this many populations of the size above in parallel, "
+                 "migrating the best schedules between them every 20 generations"
+        )
+
     with st.expander("⏱️ Generation Limits", expanded=True):
         col1, col2 = st.columns(2)
         with col1:
@@ -380,6 +319,15 @@ with st.sidebar:
             help="Number of best schedules preserved unchanged each generation"
         )
 
+    with st.expander("🎲 Reproducibility", expanded=False):
+        random_seed = st.number_input(
+            "Random Seed",
+            min_value=0,
+            value=0,
+            step=1,
+            help="Runs with the same seed and parameters are identical and served from cache"
+        )
+
     # Run and Reset buttons
     st.markdown("---")
 
@@ -393,10 +341,7 @@ with st.sidebar:
         )
 
     with col_reset:
-        if st.button("🔄 Reset Results", use_container_width=True):
-            st.session_state.algorithm_results = None
-            st.session_state.execution_timestamp = None
-            st.rerun()
+        st.button("🔄 Reset Results", on_click=_reset_results, use_container_width=True)
 
     # Information section
     st.markdown("---")
@@ -416,9 +361,150 @@ with st.sidebar:
 
         **Termination Conditions:**
         - Minimum 100 generations
-        - Improvement < 1% per generation
+        - Improvement < 1% in the 5-generation rolling average
         """)
 
+# ============================================================================
+# FITNESS CHARTS
+# ============================================================================
+# Altair charts are rendered by the browser, so reruns only ship the data.
+
+FITNESS_SERIES_LABELS = {"best": "Best Fitness", "avg": "Average Fitness", "worst": "Worst Fitness"}
+
+
+def _fitness_progression_chart(history_dataframe):
+    """Best, average and worst fitness per generation in the pink theme."""
+    series_labels = list(FITNESS_SERIES_LABELS.values())
+
+    return alt.Chart(
+        history_dataframe[["generation", *FITNESS_SERIES_LABELS]].rename(columns=FITNESS_SERIES_LABELS)
+    ).transform_fold(
+        series_labels, as_=["label", "fitness"]
+    ).mark_line().encode(
+        x=alt.X("generation:Q", title="Generation Number"),
+        y=alt.Y("fitness:Q", title="Fitness Score"),
+        color=alt.Color(
+            "label:N",
+            title=None,
+            sort=series_labels,
+            scale=alt.Scale(domain=series_labels, range=['#ff6b9d', '#ff8fab', '#ffb8d1'])
+        ),
+        strokeDash=alt.StrokeDash(
+            "label:N",
+            legend=None,
+            scale=alt.Scale(domain=series_labels, range=[[1, 0], [6, 3], [2, 2]])
+        ),
+        tooltip=["generation:Q", "label:N", alt.Tooltip("fitness:Q", format=".2f")]
+    ).interactive()
+
+
+# Improvement compares rolling means of average fitness, not consecutive generations
+IMPROVEMENT_TITLE = f"Improvement over last {IMPROVEMENT_WINDOW} generations"
+IMPROVEMENT_AXIS_LABEL = f"{IMPROVEMENT_WINDOW}-generation rolling improvement (%)"
+
+
+def _improvement_chart(valid_improvements):
+    """Rolling-mean improvement against the 1% termination threshold."""
+    improvement_line = alt.Chart(
+        valid_improvements.rename("improvement").rename_axis("generation").reset_index()
+    ).mark_line(point=True, color='#ff6b9d').encode(
+        x=alt.X("generation:Q", title="Generation"),
+        y=alt.Y("improvement:Q", title=IMPROVEMENT_AXIS_LABEL),
+        tooltip=["generation:Q", alt.Tooltip("improvement:Q", format=".2f")]
+    )
+    threshold_rule = alt.Chart().mark_rule(color='#ff8fab', strokeDash=[6, 3]).encode(
+        y=alt.datum(1.0)
+    )
+
+    return (improvement_line + threshold_rule).interactive()
+
+
+# ============================================================================
+# CHART EXPORT
+# ============================================================================
+
+
+def _build_fitness_figure_png(history_dataframe):
+    """
+    Render the fitness progression and improvement plots as a PNG image.
+
+    matplotlib is imported here, on the export path only, so normal reruns
+    never pay for its import or for server-side rasterization.
+
+    Returns:
+        PNG image bytes
+    """
+    import matplotlib.pyplot as plt
+
+    # Create fitness plot with pink theme
+    fig, axes = plt.subplots(1, 2, figsize=(16, 5))
+
+    # Plot 1: All fitness lines
+    axes[0].plot(history_dataframe["generation"], history_dataframe["best"],
+                 label="Best Fitness", linewidth=3, color='#ff6b9d', alpha=0.8)
+    axes[0].plot(history_dataframe["generation"], history_dataframe["avg"],
+                 label="Average Fitness", linewidth=2, color='#ff8fab', linestyle='--', alpha=0.8)
+    axes[0].plot(history_dataframe["generation"], history_dataframe["worst"],
+                 label="Worst Fitness", linewidth=1.5, color='#ffb8d1', linestyle=':', alpha=0.7)
+
+    axes[0].fill_between(history_dataframe["generation"],
+                         history_dataframe["avg"], history_dataframe["best"],
+                         alpha=0.1, color='#ff6b9d')
+
+    axes[0].set_xlabel("Generation Number", fontsize=12, fontweight='bold', color='#9c4665')
+    axes[0].set_ylabel("Fitness Score", fontsize=12, fontweight='bold', color='#9c4665')
+    axes[0].set_title("Fitness Progression", fontsize=14, fontweight='bold', color='#9c4665')
+    axes[0].grid(True, alpha=0.2, linestyle='--', color='#ffd6e3')
+    axes[0].legend(loc='lower right', framealpha=0.9)
+    axes[0].tick_params(axis='both', which='major', labelsize=10, colors='#5a2d47')
+    axes[0].set_facecolor('#fff5f7')
+    axes[0].spines['bottom'].set_color('#ffb8d1')
+    axes[0].spines['top'].set_color('#ffb8d1')
+    axes[0].spines['left'].set_color('#ffb8d1')
+    axes[0].spines['right'].set_color('#ffb8d1')
+
+    # Plot 2: Improvement percentage
+    if "improvement" in history_dataframe.columns:
+        valid_improvements = history_dataframe["improvement"].dropna()
+        if not valid_improvements.empty:
+            # Plain arrays, extracted once, so matplotlib does no per-call coercion
+            improvement_generations = valid_improvements.index.to_numpy()
+            improvement_values = valid_improvements.to_numpy(dtype=float)
+
+            axes[1].plot(improvement_generations, improvement_values,
+                         color='#ff6b9d', linewidth=2, marker='o', markersize=4)
+            axes[1].axhline(y=1.0, color='#ff8fab', linestyle='--', alpha=0.5,
+                            label='1% Threshold')
+            axes[1].fill_between(improvement_generations, 0, improvement_values,
+                                 where=(improvement_values >= 0),
+                                 color='#ffe4ec', alpha=0.5, label='Positive Improvement')
+            axes[1].fill_between(improvement_generations, 0, improvement_values,
+                                 where=(improvement_values < 0),
+                                 color='#ffd6e3', alpha=0.5, label='Negative Improvement')
+
+            axes[1].set_xlabel("Generation", fontsize=12, fontweight='bold', color='#9c4665')
+            axes[1].set_ylabel(IMPROVEMENT_AXIS_LABEL, fontsize=12, fontweight='bold', color='#9c4665')
+            axes[1].set_title(IMPROVEMENT_TITLE,
+                              fontsize=14, fontweight='bold', color='#9c4665')
+            axes[1].grid(True, alpha=0.2, linestyle='--', color='#ffd6e3')
+            axes[1].legend(framealpha=0.9)
+            axes[1].tick_params(axis='both', which='major', labelsize=10, colors='#5a2d47')
+            axes[1].set_facecolor('#fff5f7')
+            axes[1].spines['bottom'].set_color('#ffb8d1')
+            axes[1].spines['top'].set_color('#ffb8d1')
+            axes[1].spines['left'].set_color('#ffb8d1')
+            axes[1].spines['right'].set_color('#ffb8d1')
+
+
+    plt.tight_layout()
+
+    png_buffer = io.BytesIO()
+    fig.savefig(png_buffer, format="png", dpi=150)
+    plt.close(fig)
+
+    return png_buffer.getvalue()
+
+
 # ============================================================================
 # MAIN CONTENT AREA
 # ============================================================================
@@ -430,456 +516,605 @@ st.markdown("### Optimize room, time, and facilitator assignments using evolutio
 # ALGORITHM EXECUTION
 # ============================================================================
 
-if run_algorithm:
-    with st.spinner("🚀 Executing genetic algorithm optimization... This may take a moment."):
-        # Convert UI values to algorithm parameters
-        crossover_strategy = "single_point" if crossover_method == "Single Point" else "uniform"
-
-        # Execute the algorithm
-        st.session_state.algorithm_results = execute_genetic_algorithm(
-            population_size=population_size,
-            minimum_generations=min_generations,
-            maximum_generations=max_generations,
-            initial_mutation_probability=mutation_rate,
-            crossover_method=crossover_strategy,
-            elitism_count=elitism_count,
-            use_adaptive_mutation=True
-        )
+if run_algorithm and st.session_state.ga_run is None:
+    # Convert UI values to algorithm parameters
+    crossover_strategy = "single_point" if crossover_method == "Single Point" else "uniform"
+
+    run_parameters = {
+        "population_size": population_size,
+        "minimum_generations": min_generations,
+        "maximum_generations": max_generations,
+        "initial_mutation_probability": mutation_rate,
+        "crossover_method": crossover_strategy,
+        "elitism_count": elitism_count,
+        "use_adaptive_mutation": True,
+        "seed": int(random_seed),
+    }
+    if number_of_islands > 1:
+        # Only island runs carry the key, so single-population cache keys are unchanged
+        run_parameters["number_of_islands"] = number_of_islands
+    cache_key = tuple(run_parameters.values())
+    result_cache = _ga_result_cache()
+
+    if cache_key in result_cache["results"]:
+        # Identical settings: serve the previous result from memory
+        result_cache["hits"] += 1
+        result_cache["results"].move_to_end(cache_key)
+        _publish_results(result_cache["results"][cache_key])
+    else:
+        disk_results = load_cached_result(run_parameters)
+
+        if disk_results is not None:
+            # Computed in an earlier session: promote it to the memory cache
+            result_cache["disk_hits"] += 1
+            _remember_result(cache_key, disk_results)
+            _publish_results(disk_results)
+        else:
+            result_cache["misses"] += 1
+            _start_background_run(cache_key, run_parameters)
 
-        # Record execution time
-        st.session_state.execution_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+if st.session_state.ga_run is not None:
+    _render_background_run()
+
+cache_stats = _ga_result_cache()
+st.sidebar.caption(f"🗄️ Result cache: {cache_stats['hits']} memory hits · "
+                   f"{cache_stats['disk_hits']} disk hits · {cache_stats['misses']} misses")
 
 # ============================================================================
-# RESULTS DISPLAY
+# CACHED RESULT VIEWS
 # ============================================================================
+# Widget interactions rerun the script; these build each derived view once per
+# displayed run. Arguments starting with "_" are not hashed, so results_id alone
+# decides when a view is rebuilt.
 
-if st.session_state.algorithm_results is not None:
-    results = st.session_state.algorithm_results
-    optimal_schedule = results["best_schedule"]
-    generation_history = results["history"]
-    total_generations = results["generations_run"]
-    final_mutation_rate = results["final_mutation_rate"]
+RESULT_VIEW_CACHE_ENTRIES = 16
 
-    # Convert history to DataFrame
-    history_dataframe = pd.DataFrame(generation_history)
 
-    # Format improvement percentages
+@st.cache_data(max_entries=RESULT_VIEW_CACHE_ENTRIES)
+def _history_frame(results_id, _generation_history):
+    """Generation history as a DataFrame with display-formatted improvements."""
+    history_dataframe = pd.DataFrame(_generation_history)
+
+    # Format improvement percentages in one vectorized pass
     if "improvement" in history_dataframe.columns:
-        history_dataframe["improvement_display"] = history_dataframe["improvement"].apply(
-            lambda x: f"{x:.2f}%" if x is not None and not pd.isna(x) else "N/A"
-        )
+        improvement_values = history_dataframe["improvement"].to_numpy(dtype=float, na_value=np.nan)
+        has_improvement = ~np.isnan(improvement_values)
 
-    # ========================================================================
-    # SUCCESS MESSAGE AND SUMMARY METRICS
-    # ========================================================================
-    st.success(f"""
-    ✅ **Optimization Completed Successfully!**
+        improvement_display = np.full(len(improvement_values), "N/A", dtype=object)
+        improvement_display[has_improvement] = np.char.mod("%.2f%%", improvement_values[has_improvement])
+        history_dataframe["improvement_display"] = improvement_display
 
-    **Execution Summary:**
-    - **Total Generations:** {total_generations}
-    - **Final Mutation Rate:** {final_mutation_rate:.4f}
-    - **Best Fitness Score:** {history_dataframe["best"].iloc[-1]:.2f}
-    - **Average Fitness:** {history_dataframe["avg"].iloc[-1]:.2f}
-    - **Completion Time:** {st.session_state.execution_timestamp}
-    """)
+    return history_dataframe
 
-    # ========================================================================
-    # TABBED INTERFACE FOR DIFFERENT VIEWS
-    # ========================================================================
-    analysis_tab, schedule_tab, violations_tab, data_tab = st.tabs([
-        "📈 Fitness Analysis",
-        "🌸 Optimal Schedule",
-        "⚠️ Constraint Analysis",
-        "📊 Data Export"
-    ])
 
-    # ========================================================================
-    # TAB 1: FITNESS ANALYSIS
-    # ========================================================================
-    with analysis_tab:
-        st.subheader("Fitness Evolution Over Generations")
-
-        # Create fitness plot with pink theme
-        fig, axes = plt.subplots(1, 2, figsize=(16, 5))
-
-        # Set pink theme for matplotlib
-        plt.rcParams['axes.prop_cycle'] = plt.cycler(color=['#ff6b9d', '#ff8fab', '#ffb8d1', '#ffd6e3'])
-
-        # Plot 1: All fitness lines
-        axes[0].plot(history_dataframe["generation"], history_dataframe["best"],
-                     label="Best Fitness", linewidth=3, color='#ff6b9d', alpha=0.8)
-        axes[0].plot(history_dataframe["generation"], history_dataframe["avg"],
-                     label="Average Fitness", linewidth=2, color='#ff8fab', linestyle='--', alpha=0.8)
-        axes[0].plot(history_dataframe["generation"], history_dataframe["worst"],
-                     label="Worst Fitness", linewidth=1.5, color='#ffb8d1', linestyle=':', alpha=0.7)
-
-        axes[0].fill_between(history_dataframe["generation"],
-                             history_dataframe["avg"], history_dataframe["best"],
-                             alpha=0.1, color='#ff6b9d')
-
-        axes[0].set_xlabel("Generation Number", fontsize=12, fontweight='bold', color='#9c4665')
-        axes[0].set_ylabel("Fitness Score", fontsize=12, fontweight='bold', color='#9c4665')
-        axes[0].set_title("Fitness Progression", fontsize=14, fontweight='bold', color='#9c4665')
-        axes[0].grid(True, alpha=0.2, linestyle='--', color='#ffd6e3')
-        axes[0].legend(loc='lower right', framealpha=0.9)
-        axes[0].tick_params(axis='both', which='major', labelsize=10, colors='#5a2d47')
-        axes[0].set_facecolor('#fff5f7')
-        axes[0].spines['bottom'].set_color('#ffb8d1')
-        axes[0].spines['top'].set_color('#ffb8d1')
-        axes[0].spines['left'].set_color('#ffb8d1')
-        axes[0].spines['right'].set_color('#ffb8d1')
-
-        # Plot 2: Improvement percentage
-        if "improvement" in history_dataframe.columns:
-            valid_improvements = history_dataframe["improvement"].dropna()
-            if not valid_improvements.empty:
-                axes[1].plot(valid_improvements.index, valid_improvements.values,
-                             color='#ff6b9d', linewidth=2, marker='o', markersize=4)
-                axes[1].axhline(y=1.0, color='#ff8fab', linestyle='--', alpha=0.5,
-                                label='1% Threshold')
-                axes[1].fill_between(valid_improvements.index, 0, valid_improvements.values,
-                                     where=(valid_improvements.values >= 0),
-                                     color='#ffe4ec', alpha=0.5, label='Positive Improvement')
-                axes[1].fill_between(valid_improvements.index, 0, valid_improvements.values,
-                                     where=(valid_improvements.values < 0),
-                                     color='#ffd6e3', alpha=0.5, label='Negative Improvement')
-
-                axes[1].set_xlabel("Generation", fontsize=12, fontweight='bold', color='#9c4665')
-                axes[1].set_ylabel("Improvement (%)", fontsize=12, fontweight='bold', color='#9c4665')
-                axes[1].set_title("Generation-to-Generation Improvement",
-                                  fontsize=14, fontweight='bold', color='#9c4665')
-                axes[1].grid(True, alpha=0.2, linestyle='--', color='#ffd6e3')
-                axes[1].legend(framealpha=0.9)
-                axes[1].tick_params(axis='both', which='major', labelsize=10, colors='#5a2d47')
-                axes[1].set_facecolor('#fff5f7')
-                axes[1].spines['bottom'].set_color('#ffb8d1')
-                axes[1].spines['top'].set_color('#ffb8d1')
-                axes[1].spines['left'].set_color('#ffb8d1')
-                axes[1].spines['right'].set_color('#ffb8d1')
-
-        plt.tight_layout()
-        st.pyplot(fig)
-
-        # Display detailed metrics
-        with st.expander("📊 View Detailed Generation Metrics"):
-            display_columns = ["generation", "best", "avg", "worst"]
-            if "improvement_display" in history_dataframe.columns:
-                display_columns.append("improvement_display")
-
-            st.dataframe(
-                history_dataframe[display_columns].rename(
-                    columns={
-                        "generation": "Generation",
-                        "best": "Best Fitness",
-                        "avg": "Average Fitness",
-                        "worst": "Worst Fitness",
-                        "improvement_display": "Improvement %"
-                    }
-                ).style.set_properties(**{
-                    'background-color': '#fff5f7',
-                    'color': '#5a2d47',
-                    'border': '1px solid #ffd6e3'
-                }),
-                use_container_width=True,
-                height=400
-            )
+@st.cache_data(max_entries=RESULT_VIEW_CACHE_ENTRIES)
+def _schedule_frame(results_id, _schedule):
+    """The optimal schedule as a categorical DataFrame."""
+    return _schedule.to_dataframe()
 
-    # ========================================================================
-    # TAB 2: OPTIMAL SCHEDULE
-    # ========================================================================
-    with schedule_tab:
-        st.subheader("Optimal Schedule Configuration")
 
-        # Schedule display controls
-        col_controls1, col_controls2, col_controls3 = st.columns([2, 2, 1])
+@st.cache_data(max_entries=RESULT_VIEW_CACHE_ENTRIES)
+def _violation_summary(results_id, _schedule):
+    """Constraint violation counts for the optimal schedule and their total."""
+    violation_summary = fitness_calculator.calculate_constraint_violations(_schedule)
+    return violation_summary, sum(violation_summary.values())
 
-        with col_controls1:
-            display_limit = st.radio(
-                "Activities to Display:",
-                ["First 6 Activities", "All Activities"],
-                horizontal=True
-            )
 
-        with col_controls2:
-            sort_preference = st.radio(
-                "Sort Schedule By:",
-                ["Time Slot", "Activity Name"],
-                horizontal=True
-            )
+PINK_CELL_PROPERTIES = {
+    'background-color': '#fff5f7',
+    'color': '#5a2d47',
+    'border': '1px solid #ffd6e3'
+}
 
-        with col_controls3:
-            show_groupings = st.checkbox("Show Groupings", value=False)
+PINK_STRIPED_TABLE_STYLES = [
+    {'selector': 'thead th', 'props': [('background-color', '#ffe4ec'),
+                                       ('color', '#9c4665'),
+                                       ('border', '1px solid #ffb8d1')]},
+    {'selector': 'tbody tr:nth-child(even)', 'props': [('background-color', '#ffe4ec')]},
+    {'selector': 'tbody tr:nth-child(odd)', 'props': [('background-color', '#fff5f7')]},
+]
 
-        # Convert schedule to DataFrame
-        schedule_df = optimal_schedule.to_dataframe()
 
-        # Apply sorting
-        time_order_mapping = {
-            "10 AM": 1, "11 AM": 2, "12 PM": 3,
-            "1 PM": 4, "2 PM": 5, "3 PM": 6
-        }
+@st.cache_resource(max_entries=16 * RESULT_VIEW_CACHE_ENTRIES)
+def _pink_styler(results_id, view_name, _dataframe, striped=False):
+    """Pink-themed Styler for one table of the displayed results, built once per run."""
+    styler = _dataframe.style.set_properties(**PINK_CELL_PROPERTIES)
 
-        if sort_preference == "Time Slot":
-            schedule_df["Sort_Key"] = schedule_df["Time"].map(time_order_mapping)
-            schedule_df = schedule_df.sort_values(["Sort_Key", "Activity"]).drop(columns=["Sort_Key"])
-        else:
-            schedule_df = schedule_df.sort_values("Activity")
+    if striped:
+        styler = styler.set_table_styles(PINK_STRIPED_TABLE_STYLES)
+
+    return styler
 
-        # Apply display limit
-        if display_limit == "First 6 Activities":
-            display_df = schedule_df.head(6)
-        else:
-            display_df = schedule_df
 
-        # Display schedule with pink styling
+@st.cache_resource(max_entries=2 * RESULT_VIEW_CACHE_ENTRIES)
+def _grouped_schedule_styler(results_id, group_column, _schedule_df):
+    """
+    The schedule as a single table grouped by one column, for the Groupings view.
+
+    Rows are ordered by group, then time slot, and the row background alternates
+    between the two theme pinks at each group boundary.
+    """
+    grouped_df = _schedule_df.sort_values([group_column, "Time", "Activity"])
+    grouped_df = grouped_df[[group_column, *grouped_df.columns.drop(group_column)]]
+
+    # Sorted rows keep each group contiguous, so codes alternate parity per group
+    group_codes, _ = pd.factorize(grouped_df[group_column])
+    row_backgrounds = np.where(group_codes % 2 == 0, '#fff5f7', '#ffe4ec')
+
+    cell_css = np.repeat(
+        np.char.add("background-color: ", row_backgrounds)[:, np.newaxis], len(grouped_df.columns), axis=1
+    )
+    cell_css = np.char.add(cell_css, "; color: #5a2d47; border: 1px solid #ffd6e3")
+    cell_styles = pd.DataFrame(cell_css, index=grouped_df.index, columns=grouped_df.columns)
+
+    return grouped_df.style.apply(lambda _: cell_styles, axis=None)
+
+
+@st.cache_data(max_entries=4 * RESULT_VIEW_CACHE_ENTRIES)
+def _csv_bytes(results_id, view_name, _dataframe):
+    """UTF-8 CSV export of one view of the displayed results."""
+    # pyarrow's writer produces bytes directly, without a Python-level formatter
+    csv_buffer = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(_dataframe, preserve_index=False), csv_buffer)
+    return csv_buffer.getvalue()
+
+
+# ============================================================================
+# RESULT TABS
+# ============================================================================
+# Each tab is a fragment, so its widgets rerun only that tab rather than the
+# whole page.
+
+def _schedule_export_order():
+    """Per-session holder of the schedule tab's current sort order, shared with its exports."""
+    return st.session_state.setdefault("schedule_export_order", {"sort_preference": "Time Slot"})
+
+
+@st.cache_data(max_entries=RESULT_VIEW_CACHE_ENTRIES)
+def _sorted_schedule_frame(results_id, sort_preference, _schedule):
+    """The optimal schedule as a DataFrame in the chosen display order."""
+    schedule_df = _schedule_frame(results_id, _schedule)
+
+    # Apply sorting
+    if sort_preference == "Time Slot":
+        return schedule_df.sort_values(["Time", "Activity"])
+
+    return schedule_df.sort_values("Activity")
+
+
+# ============================================================================
+# TAB 1: FITNESS ANALYSIS
+# ============================================================================
+
+@st.fragment
+def _render_analysis_tab(results_id, history_dataframe):
+    """Fitness charts and the per-generation metrics table."""
+    st.subheader("Fitness Evolution Over Generations")
+
+    # Browser-rendered charts: nothing is rasterized on the server per rerun
+    chart_col1, chart_col2 = st.columns(2)
+
+    with chart_col1:
+        st.markdown("**Fitness Progression**")
+        st.altair_chart(_fitness_progression_chart(history_dataframe), use_container_width=True)
+
+    with chart_col2:
+        st.markdown(f"**{IMPROVEMENT_TITLE}**")
+        if "improvement" in history_dataframe.columns:
+            valid_improvements = history_dataframe["improvement"].dropna()
+            if not valid_improvements.empty:
+                st.altair_chart(_improvement_chart(valid_improvements), use_container_width=True)
+
+    # Display detailed metrics
+    with st.expander("📊 View Detailed Generation Metrics"):
+        display_columns = ["generation", "best", "avg", "worst"]
+        if "improvement_display" in history_dataframe.columns:
+            display_columns.append("improvement_display")
+
         st.dataframe(
-            display_df.style.set_properties(**{
-                'background-color': '#fff5f7',
-                'color': '#5a2d47',
-                'border': '1px solid #ffd6e3'
-            }).set_table_styles([
-                {'selector': 'thead th', 'props': [('background-color', '#ffe4ec'),
-                                                   ('color', '#9c4665'),
-                                                   ('border', '1px solid #ffb8d1')]},
-                {'selector': 'tbody tr:nth-child(even)', 'props': [('background-color', '#ffe4ec')]},
-                {'selector': 'tbody tr:nth-child(odd)', 'props': [('background-color', '#fff5f7')]},
-            ]),
+            _pink_styler(results_id, "generation metrics", history_dataframe[display_columns].rename(
+                columns={
+                    "generation": "Generation",
+                    "best": "Best Fitness",
+                    "avg": "Average Fitness",
+                    "worst": "Worst Fitness",
+                    "improvement_display": "Improvement %"
+                }
+            )),
             use_container_width=True,
             height=400
         )
 
-        # Optional groupings
-        if show_groupings:
-            st.subheader("Schedule Groupings")
-
-            grouping_col1, grouping_col2 = st.columns(2)
-
-            with grouping_col1:
-                with st.expander("🏫 Group by Room", expanded=False):
-                    for room_name, room_group in schedule_df.groupby("Room"):
-                        st.markdown(f"**<span style='color:#ff6b9d'>Room: {room_name}</span>**", unsafe_allow_html=True)
-                        st.dataframe(room_group.style.set_properties(**{
-                            'background-color': '#fff5f7',
-                            'color': '#5a2d47',
-                            'border': '1px solid #ffd6e3'
-                        }), use_container_width=True)
-
-            with grouping_col2:
-                with st.expander("🧑‍🏫 Group by Facilitator", expanded=False):
-                    for facilitator_name, fac_group in schedule_df.groupby("Facilitator"):
-                        st.markdown(f"**<span style='color:#ff6b9d'>Facilitator: {facilitator_name}</span>**",
-                                    unsafe_allow_html=True)
-                        st.dataframe(fac_group.style.set_properties(**{
-                            'background-color': '#fff5f7',
-                            'color': '#5a2d47',
-                            'border': '1px solid #ffd6e3'
-                        }), use_container_width=True)
 
-    # ========================================================================
-    # TAB 3: CONSTRAINT VIOLATIONS - PINK THEME
-    # ========================================================================
-    with violations_tab:
-        st.subheader("Constraint Violation Analysis")
-
-        # Calculate violations
-        violation_summary = fitness_calculator.calculate_constraint_violations(optimal_schedule)
-
-
-        # Helper function to format violation count with pink icons
-        def format_violation_count(count):
-            """Format violation count with appropriate icon and color."""
-            if count == 0:
-                return f'<span class="violation-perfect">✓ 0</span>'
-            elif count <= 2:
-                return f'<span class="violation-good">🌸 {count}</span>'
-            else:
-                return f'<span class="violation-danger">💥 {count}</span>'
-
-
-        # Display violations in two columns
-        violation_col1, violation_col2 = st.columns(2)
-
-        with violation_col1:
-            st.markdown("#### 🏫 Room & Time Violations")
-            st.markdown(f"""
-            <div class='metric-card'>
-            <h4>🏛️ Room Issues</h4>
-            <p><strong>Room Conflicts:</strong> {format_violation_count(violation_summary['room_conflicts'])}</p>
-            <p><strong>Room Too Small:</strong> {format_violation_count(violation_summary['room_too_small'])}</p>
-            <p><strong>Room Too Big (>1.5x):</strong> {format_violation_count(violation_summary['room_too_big_15'])}</p>
-            <p><strong>Room Too Big (>3x):</strong> {format_violation_count(violation_summary['room_too_big_30'])}</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-            st.markdown(f"""
-            <div class='metric-card'>
-            <h4>⏰ Time Slot Issues</h4>
-            <p><strong>SLA101 Sections Same Time:</strong> {format_violation_count(violation_summary['sla101_same_time'])}</p>
-            <p><strong>SLA191 Sections Same Time:</strong> {format_violation_count(violation_summary['sla191_same_time'])}</p>
-            <p><strong>SLA101/SLA191 Same Time:</strong> {format_violation_count(violation_summary['sla101_191_same_time'])}</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with violation_col2:
-            st.markdown("#### 👨‍🏫 Facilitator & Interactions")
-            st.markdown(f"""
-            <div class='metric-card'>
-            <h4>🧑‍🏫 Facilitator Issues</h4>
-            <p><strong>Facilitator Overload (>4):</strong> {format_violation_count(violation_summary['facilitator_overload'])}</p>
-            <p><strong>Facilitator Underload (<3):</strong> {format_violation_count(violation_summary['facilitator_underload'])}</p>
-            <p><strong>Same-Time Conflicts:</strong> {format_violation_count(violation_summary['facilitator_same_time_conflict'])}</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-            st.markdown(f"""
-            <div class='metric-card'>
-            <h4>🔄 SLA101 ↔ SLA191 Interactions</h4>
-            <p><strong>Consecutive Pairs:</strong> {format_violation_count(violation_summary['sla101_191_consecutive_pair'])}</p>
-            <p><strong>Building Mismatch:</strong> {format_violation_count(violation_summary['sla101_191_building_mismatch'])}</p>
-            <p><strong>One Hour Gap:</strong> {format_violation_count(violation_summary['sla101_191_one_hour_gap'])}</p>
-            </div>
-            """, unsafe_allow_html=True)
-
-        # Violation summary with pink styling
-        total_violations = sum(violation_summary.values())
-
-        # Determine which summary class to use
-        if total_violations == 0:
-            summary_class = "summary-perfect"
-            summary_icon = "🎉"
-            summary_title = "Perfect Schedule!"
-            summary_message = "No constraint violations detected. This schedule satisfies all Appendix A requirements."
-        elif total_violations <= 3:
-            summary_class = "summary-good"
-            summary_icon = "🌸"
-            summary_title = "Good Schedule"
-            summary_message = f"Only {total_violations} minor constraint issues. This is a high-quality schedule with minimal violations."
-        elif total_violations <= 6:
-            summary_class = "summary-warning"
-            summary_icon = "🌺"
-            summary_title = "Acceptable Schedule"
-            summary_message = f"{total_violations} constraint issues identified. Consider re-running optimization for better results."
-        else:
-            summary_class = "summary-danger"
-            summary_icon = "💥"
-            summary_title = "Poor Schedule"
-            summary_message = f"{total_violations} constraint violations! This schedule has significant issues. Re-run optimization."
-
-        # Display the summary
-        st.markdown(f"""
-        <div class="violation-summary {summary_class}">
-            <h3 style="margin-top: 0; color: #9c4665;">{summary_icon} {summary_title}</h3>
-            <p style="color: #5a2d47; font-size: 1.1em;"><strong>Total Violations:</strong> <span style="color: #ff6b9d; font-weight: bold;">{total_violations}</span></p>
-            <p style="color: #5a2d47;">{summary_message}</p>
+# ============================================================================
+# TAB 2: OPTIMAL SCHEDULE
+# ============================================================================
+
+@st.fragment
+def _render_schedule_tab(results_id, optimal_schedule):
+    """The optimal schedule with display, sort and grouping controls."""
+    st.subheader("Optimal Schedule Configuration")
+
+    # Schedule display controls
+    col_controls1, col_controls2, col_controls3 = st.columns([2, 2, 1])
+
+    with col_controls1:
+        display_limit = st.radio(
+            "Activities to Display:",
+            ["First 6 Activities", "All Activities"],
+            horizontal=True
+        )
+
+    with col_controls2:
+        sort_preference = st.radio(
+            "Sort Schedule By:",
+            ["Time Slot", "Activity Name"],
+            horizontal=True,
+            key="schedule_sort"
+        )
+
+    with col_controls3:
+        show_groupings = st.checkbox("Show Groupings", value=False)
+
+    schedule_df = _sorted_schedule_frame(results_id, sort_preference, optimal_schedule)
+
+    # Schedule exports read this when they are made, so the export tab never needs a rerun
+    _schedule_export_order()["sort_preference"] = sort_preference
+
+    # Apply display limit
+    if display_limit == "First 6 Activities":
+        display_df = schedule_df.iloc[:6]
+    else:
+        display_df = schedule_df
+
+    # Display schedule with pink styling
+    st.dataframe(
+        _pink_styler(results_id, f"schedule {sort_preference} {display_limit}", display_df, striped=True),
+        use_container_width=True,
+        height=400
+    )
+
+    # Optional groupings
+    if show_groupings:
+        st.subheader("Schedule Groupings")
+
+        grouping_col1, grouping_col2 = st.columns(2)
+
+        with grouping_col1:
+            with st.expander("🏫 Group by Room", expanded=False):
+                st.dataframe(_grouped_schedule_styler(results_id, "Room", schedule_df),
+                             use_container_width=True)
+
+        with grouping_col2:
+            with st.expander("🧑‍🏫 Group by Facilitator", expanded=False):
+                st.dataframe(_grouped_schedule_styler(results_id, "Facilitator", schedule_df),
+                             use_container_width=True)
+
+
+# ============================================================================
+# TAB 3: CONSTRAINT VIOLATIONS - PINK THEME
+# ============================================================================
+
+# (column heading, [(card title, [(label, violation_summary key), ...]), ...]) per grid column
+VIOLATION_CARD_LAYOUT = [
+    ("🏫 Room & Time Violations", [
+        ("🏛️ Room Issues", [
+            ("Room Conflicts", "room_conflicts"),
+            ("Room Too Small", "room_too_small"),
+            ("Room Too Big (>1.5x)", "room_too_big_15"),
+            ("Room Too Big (>3x)", "room_too_big_30"),
+        ]),
+        ("⏰ Time Slot Issues", [
+            ("SLA101 Sections Same Time", "sla101_same_time"),
+            ("SLA191 Sections Same Time", "sla191_same_time"),
+            ("SLA101/SLA191 Same Time", "sla101_191_same_time"),
+        ]),
+    ]),
+    ("👨‍🏫 Facilitator & Interactions", [
+        ("🧑‍🏫 Facilitator Issues", [
+            ("Facilitator Overload (>4)", "facilitator_overload"),
+            ("Facilitator Underload (<3)", "facilitator_underload"),
+            ("Same-Time Conflicts", "facilitator_same_time_conflict"),
+        ]),
+        ("🔄 SLA101 ↔ SLA191 Interactions", [
+            ("Consecutive Pairs", "sla101_191_consecutive_pair"),
+            ("Building Mismatch", "sla101_191_building_mismatch"),
+            ("One Hour Gap", "sla101_191_one_hour_gap"),
+        ]),
+    ]),
+]
+
+
+def _format_violation_count(count):
+    """Format violation count with appropriate icon and color."""
+    if count == 0:
+        return f'<span class="violation-perfect">✓ 0</span>'
+    elif count <= 2:
+        return f'<span class="violation-good">🌸 {count}</span>'
+    else:
+        return f'<span class="violation-danger">💥 {count}</span>'
+
+
+@st.cache_data(max_entries=RESULT_VIEW_CACHE_ENTRIES)
+def _violation_cards_html(violation_summary):
+    """HTML for every violation card, laid out as one two-column grid; built once per summary."""
+    formatted_counts = {
+        violation_key: _format_violation_count(count) for violation_key, count in violation_summary.items()
+    }
+
+    grid_columns = []
+    for column_heading, cards in VIOLATION_CARD_LAYOUT:
+        card_blocks = [f"<h4>{column_heading}</h4>"]
+        for card_title, card_rows in cards:
+            row_lines = "".join(
+                f"<p><strong>{label}:</strong> {formatted_counts[violation_key]}</p>"
+                for label, violation_key in card_rows
+            )
+            card_blocks.append(f"<div class='metric-card'><h4>{card_title}</h4>{row_lines}</div>")
+        grid_columns.append(f"<div>{''.join(card_blocks)}</div>")
+
+    return f"<div class='violation-grid'>{''.join(grid_columns)}</div>"
+
+
+@st.cache_data
+def _violation_verdict_html(total_violations):
+    """Overall verdict box for a schedule with this many violations."""
+    # Determine which summary class to use
+    if total_violations == 0:
+        summary_class = "summary-perfect"
+        summary_icon = "🎉"
+        summary_title = "Perfect Schedule!"
+        summary_message = "No constraint violations detected. This schedule satisfies all Appendix A requirements."
+    elif total_violations <= 3:
+        summary_class = "summary-good"
+        summary_icon = "🌸"
+        summary_title = "Good Schedule"
+        summary_message = f"Only {total_violations} minor constraint issues. This is a high-quality schedule with minimal violations."
+    elif total_violations <= 6:
+        summary_class = "summary-warning"
+        summary_icon = "🌺"
+        summary_title = "Acceptable Schedule"
+        summary_message = f"{total_violations} constraint issues identified. Consider re-running optimization for better results."
+    else:
+        summary_class = "summary-danger"
+        summary_icon = "💥"
+        summary_title = "Poor Schedule"
+        summary_message = f"{total_violations} constraint violations! This schedule has significant issues. Re-run optimization."
+
+    return f"""
+    <div class="violation-summary {summary_class}">
+        <h3>{summary_icon} {summary_title}</h3>
+        <p class="summary-total"><strong>Total Violations:</strong> <span class="summary-count">{total_violations}</span></p>
+        <p>{summary_message}</p>
+    </div>
+    """
+
+
+@st.fragment
+def _render_violations_tab(results_id, optimal_schedule):
+    """Violation counts for the optimal schedule."""
+    st.subheader("Constraint Violation Analysis")
+
+    # Calculate violations
+    violation_summary, total_violations = _violation_summary(results_id, optimal_schedule)
+
+    # Display violations in a two-column grid as a single element
+    st.markdown(_violation_cards_html(violation_summary), unsafe_allow_html=True)
+
+    # Violation summary with pink styling
+    st.markdown(_violation_verdict_html(total_violations), unsafe_allow_html=True)
+
+    # Add detailed explanation with pink styling
+    with st.expander("📖 Understanding Constraint Violations", expanded=False):
+        st.markdown("""
+        <div class="pink-card">
+        ### 🎀 Violation Type Explanations:
+
+        **🏛️ Room Issues:**
+        - **Room Conflicts**: Multiple activities in same room at same time
+        - **Room Too Small**: Room capacity < expected enrollment
+        - **Room Too Big (>1.5x)**: Room is 1.5-3x larger than needed (minor issue)
+        - **Room Too Big (>3x)**: Room is >3x larger than needed (major issue)
+
+        **⏰ Time Issues:**
+        - **SLA101 Sections Same Time**: SLA101A and SLA101B scheduled simultaneously
+        - **SLA191 Sections Same Time**: SLA191A and SLA191B scheduled simultaneously  
+        - **SLA101/SLA191 Same Time**: Related courses at same time
+
+        **🧑‍🏫 Facilitator Issues:**
+        - **Overload (>4)**: Facilitator assigned to >4 activities
+        - **Underload (<3)**: Facilitator assigned to <3 activities (except Tyler)
+        - **Same-Time Conflicts**: Same facilitator in multiple rooms simultaneously
+
+        **🔄 SLA101 ↔ SLA191 Interactions:**
+        - **Consecutive Pairs**: Should be in consecutive time slots (e.g., 10 AM & 11 AM)
+        - **Building Mismatch**: Consecutive pairs in different building types (Beach/Roman vs others)
+        - **One Hour Gap**: Exactly one hour between pairs (e.g., 10 AM & 12 PM)
         </div>
         """, unsafe_allow_html=True)
 
-        # Add detailed explanation with pink styling
-        with st.expander("📖 Understanding Constraint Violations", expanded=False):
-            st.markdown("""
-            <div style="background-color: #fff5f7; padding: 20px; border-radius: 10px; border: 1px solid #ffd6e3;">
-            ### 🎀 Violation Type Explanations:
-
-            **🏛️ Room Issues:**
-            - **Room Conflicts**: Multiple activities in same room at same time
-            - **Room Too Small**: Room capacity < expected enrollment
-            - **Room Too Big (>1.5x)**: Room is 1.5-3x larger than needed (minor issue)
-            - **Room Too Big (>3x)**: Room is >3x larger than needed (major issue)
-
-            **⏰ Time Issues:**
-            - **SLA101 Sections Same Time**: SLA101A and SLA101B scheduled simultaneously
-            - **SLA191 Sections Same Time**: SLA191A and SLA191B scheduled simultaneously  
-            - **SLA101/SLA191 Same Time**: Related courses at same time
-
-            **🧑‍🏫 Facilitator Issues:**
-            - **Overload (>4)**: Facilitator assigned to >4 activities
-            - **Underload (<3)**: Facilitator assigned to <3 activities (except Tyler)
-            - **Same-Time Conflicts**: Same facilitator in multiple rooms simultaneously
-
-            **🔄 SLA101 ↔ SLA191 Interactions:**
-            - **Consecutive Pairs**: Should be in consecutive time slots (e.g., 10 AM & 11 AM)
-            - **Building Mismatch**: Consecutive pairs in different building types (Beach/Roman vs others)
-            - **One Hour Gap**: Exactly one hour between pairs (e.g., 10 AM & 12 PM)
-            </div>
-            """, unsafe_allow_html=True)
 
-    # ========================================================================
-    # TAB 4: DATA EXPORT
-    # ========================================================================
-    with data_tab:
-        st.subheader("Data Export and Download")
+# ============================================================================
+# TAB 4: DATA EXPORT
+# ============================================================================
+
+def _prepare_downloads(results_id):
+    """Enable the CSV download buttons for this run."""
+    st.session_state.downloads_prepared_for = results_id
+
+
+@st.fragment
+def _render_data_tab(results_id, optimal_schedule, history_dataframe):
+    """Downloads and server-side saves of the run's results."""
+    st.subheader("Data Export and Download")
+
+    export_order = _schedule_export_order()
+    violation_summary, _ = _violation_summary(results_id, optimal_schedule)
+
+    def schedule_csv():
+        """The schedule CSV in the order the schedule tab shows at the time of export."""
+        sort_preference = export_order["sort_preference"]
+        schedule_df = _sorted_schedule_frame(results_id, sort_preference, optimal_schedule)
+        return _csv_bytes(results_id, f"schedule sorted by {sort_preference}", schedule_df)
 
-        # Schedule export
-        st.markdown("### 🌸 Schedule Export")
-        schedule_csv = schedule_df.to_csv(index=False).encode('utf-8')
+    # Every export of this run carries the run's completion time in its file name
+    file_timestamp = datetime.fromtimestamp(st.session_state.execution_timestamp).strftime('%Y%m%d_%H%M%S')
 
-        col_schedule1, col_schedule2 = st.columns(2)
+    # CSVs are encoded and shipped to the browser only once downloads are requested
+    downloads_ready = st.session_state.get("downloads_prepared_for") == results_id
+    if not downloads_ready:
+        st.button("📦 Prepare Downloads", on_click=_prepare_downloads, args=(results_id,),
+                  use_container_width=True)
 
-        with col_schedule1:
+    # Schedule export
+    st.markdown("### 🌸 Schedule Export")
+
+    col_schedule1, col_schedule2 = st.columns(2)
+
+    with col_schedule1:
+        if downloads_ready:
             st.download_button(
                 label="📥 Download Schedule (CSV)",
+                # Built on click, so it follows sort changes made since this tab last ran
                 data=schedule_csv,
-                file_name=f"sla_schedule_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                file_name=f"sla_schedule_{file_timestamp}.csv",
                 mime="text/csv",
                 use_container_width=True
             )
 
-        with col_schedule2:
-            # Save schedule to file
-            output_filename = f"output/sla_optimal_schedule_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            optimal_schedule.save_to_csv(output_filename)
+    with col_schedule2:
+        # Save schedule to file, reusing the bytes encoded for the download
+        if st.button("💾 Save Schedule to Server", use_container_width=True):
+            output_filename = os.path.join(
+                _ensure_output_dir(),
+                f"sla_optimal_schedule_{file_timestamp}.csv"
+            )
+            Path(output_filename).write_bytes(schedule_csv())
             st.success(f"✅ Schedule saved to: `{output_filename}`")
 
-        # History export
-        st.markdown("### 📈 History Data Export")
-        history_csv = history_dataframe.to_csv(index=False).encode('utf-8')
+    # History export
+    st.markdown("### 📈 History Data Export")
 
-        col_history1, col_history2 = st.columns(2)
+    col_history1, col_history2 = st.columns(2)
 
-        with col_history1:
+    with col_history1:
+        if downloads_ready:
             st.download_button(
                 label="📥 Download Fitness History (CSV)",
-                data=history_csv,
-                file_name=f"fitness_history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                data=_csv_bytes(results_id, "history", history_dataframe),
+                file_name=f"fitness_history_{file_timestamp}.csv",
                 mime="text/csv",
                 use_container_width=True
             )
 
-        with col_history2:
-            # Display sample of history data
-            with st.expander("👁️ Preview History Data"):
-                st.dataframe(history_dataframe.head(10).style.set_properties(**{
-                    'background-color': '#fff5f7',
-                    'color': '#5a2d47',
-                    'border': '1px solid #ffd6e3'
-                }), use_container_width=True)
+        if st.button("🖼️ Prepare Fitness Chart (PNG)", use_container_width=True):
+            st.download_button(
+                label="📥 Download Fitness Chart (PNG)",
+                data=_build_fitness_figure_png(history_dataframe),
+                file_name=f"fitness_chart_{file_timestamp}.png",
+                mime="image/png",
+                use_container_width=True
+            )
+
+    with col_history2:
+        # Display sample of history data
+        # A collapsed expander still runs its body, so the table is built only on request
+        with st.expander("👁️ Preview History Data"):
+            if st.checkbox("Show first 10 generations", value=False):
+                st.dataframe(_pink_styler(results_id, "history preview", history_dataframe.iloc[:10]),
+                             use_container_width=True)
 
-        # Violations export
-        st.markdown("### ⚠️ Violations Export")
-        violations_df = pd.DataFrame([violation_summary])
+    # Violations export
+    st.markdown("### ⚠️ Violations Export")
 
-        col_viol1, col_viol2 = st.columns(2)
+    col_viol1, col_viol2 = st.columns(2)
 
-        with col_viol1:
-            violations_csv = violations_df.to_csv(index=False).encode('utf-8')
+    with col_viol1:
+        if downloads_ready:
             st.download_button(
                 label="📥 Download Violations Report (CSV)",
-                data=violations_csv,
-                file_name=f"violations_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                data=_csv_bytes(results_id, "violations", pd.DataFrame([violation_summary])),
+                file_name=f"violations_report_{file_timestamp}.csv",
                 mime="text/csv",
                 use_container_width=True
             )
 
-        with col_viol2:
-            st.markdown("#### 📋 Violations Summary")
-            st.json(violation_summary)
+    with col_viol2:
+        st.markdown("#### 📋 Violations Summary")
+        st.json(violation_summary)
+
+
+# ============================================================================
+# RESULTS DISPLAY
+# ============================================================================
+
+if st.session_state.algorithm_results is not None:
+    results = st.session_state.algorithm_results
+    optimal_schedule = results["best_schedule"]
+    generation_history = results["history"]
+    total_generations = results["generations_run"]
+    final_mutation_rate = results["final_mutation_rate"]
+
+    completion_time = datetime.fromtimestamp(st.session_state.execution_timestamp).strftime("%Y-%m-%d %H:%M:%S")
+
+    results_id = st.session_state.results_id
+
+    # Convert history to DataFrame
+    history_dataframe = _history_frame(results_id, generation_history)
+
+    # ========================================================================
+    # SUCCESS MESSAGE AND SUMMARY METRICS
+    # ========================================================================
+    st.success(f"""
+    ✅ **Optimization Completed Successfully!**
+
+    **Execution Summary:**
+    - **Total Generations:** {total_generations}
+    - **Final Mutation Rate:** {final_mutation_rate:.4f}
+    - **Best Fitness Score:** {history_dataframe["best"].iloc[-1]:.2f}
+    - **Average Fitness:** {history_dataframe["avg"].iloc[-1]:.2f}
+    - **Completion Time:** {completion_time}
+    """)
+
+    # Results cached on disk before cache statistics were recorded lack this entry
+    fitness_cache_statistics = results.get("fitness_cache")
+    if fitness_cache_statistics is not None:
+        fitness_lookups = fitness_cache_statistics["hits"] + fitness_cache_statistics["evaluations"]
+        st.metric(
+            "Fitness cache hits",
+            f"{fitness_cache_statistics['hits']:,}",
+            f"{fitness_cache_statistics['hits'] / max(fitness_lookups, 1):.0%} of evaluations skipped",
+            delta_color="off"
+        )
+
+    # ========================================================================
+    # TABBED INTERFACE FOR DIFFERENT VIEWS
+    # ========================================================================
+    analysis_tab, schedule_tab, violations_tab, data_tab = st.tabs([
+        "📈 Fitness Analysis",
+        "🌸 Optimal Schedule",
+        "⚠️ Constraint Analysis",
+        "📊 Data Export"
+    ])
+
+    with analysis_tab:
+        _render_analysis_tab(results_id, history_dataframe)
+
+    with schedule_tab:
+        _render_schedule_tab(results_id, optimal_schedule)
+
+    with violations_tab:
+        _render_violations_tab(results_id, optimal_schedule)
+
+    with data_tab:
+        _render_data_tab(results_id, optimal_schedule, history_dataframe)
 
 # ========================================================================
 # INITIAL STATE (NO RESULTS YET)
 # ========================================================================
 else:
     st.markdown("""
-    <div style="background-color: #fff5f7; padding: 30px; border-radius: 15px; border: 2px solid #ffd6e3; margin-bottom: 30px;">
+    <div class="pink-card pink-welcome">
     ## 🚀 Welcome to the SLA Activity Scheduler
 
     This application uses a **genetic algorithm** to optimize scheduling for 
@@ -913,7 +1148,7 @@ else:
     # Quick start example
     with st.expander("🎯 Quick Start Recommendation", expanded=True):
         st.markdown("""
-        <div style="background-color: #ffe4ec; padding: 20px; border-radius: 10px; border: 1px solid #ffb8d1;">
+        <div class="pink-card pink-card-accent">
         **🌸 For best results, try these settings:**
         - Population Size: **300**
         - Minimum Generations: **100**
@@ -931,7 +1166,7 @@ else:
 # ========================================================================
 st.markdown("---")
 st.markdown(
-    "<div style='text-align: center; color: #ff6b9d; font-size: 0.9em; padding: 20px; background-color: #fff5f7; border-radius: 10px; border: 1px solid #ffd6e3;'>"
+    "<div class='pink-card pink-footer'>"
     "🌸 Genetic Algorithm Scheduler for SLA Activities | "
     f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
     "</div>",
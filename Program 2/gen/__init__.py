@@ -13,7 +13,11 @@ from gen.constants import (
     ALL_FACILITATORS,
     ALL_TIME_SLOTS,
     ROOMS_WITH_CAPACITIES,
-    ACTIVITY_DEFINITIONS
+    ACTIVITY_DEFINITIONS,
+    ROOM_CAPACITIES,
+    EXPECTED_ENROLLMENTS,
+    PREFERRED_MASK,
+    ACCEPTABLE_MASK
 )
 from gen.algorithm_engine import execute_genetic_algorithm
 from gen.fitness_evaluator import fitness_calculator
@@ -27,5 +31,9 @@ __all__ = [
     'ALL_FACILITATORS',
     'ALL_TIME_SLOTS',
     'ROOMS_WITH_CAPACITIES',
-    'ACTIVITY_DEFINITIONS'
+    'ACTIVITY_DEFINITIONS',
+    'ROOM_CAPACITIES',
+    'EXPECTED_ENROLLMENTS',
+    'PREFERRED_MASK',
+    'ACCEPTABLE_MASK'
 ]
@@ -2,54 +2,159 @@
 Main genetic algorithm engine for SLA scheduling.
 Coordinates population evolution through generations.
 """
-from typing import Dict, List, Any, Tuple
-import statistics
-from gen.population_manager import create_initial_population
-from gen.fitness_evaluator import fitness_calculator
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple, Union
+import logging
+import queue
+import numpy as np
+from gen.population_manager import create_initial_population_genomes
+from gen.fitness_evaluator import EvaluationPool, fitness_calculator
 from gen.selection_methods import (
     calculate_softmax_probabilities,
-    select_parent_pairs,
-    select_best_schedules
+    select_parent_indices,
+    select_best_indices
 )
+from gen.models import Schedule
 from gen.genetic_operators import (
-    perform_single_point_crossover,
-    perform_uniform_crossover,
-    apply_mutation
+    batch_single_point_crossover,
+    batch_uniform_crossover,
+    batch_mutation
 )
 
+logger = logging.getLogger(__name__)
+
+# Generations averaged when measuring improvement for termination and mutation
+IMPROVEMENT_WINDOW = 5
+
+# Smallest magnitude divided by when taking ratios of fitness values near zero
+MINIMUM_DENOMINATOR = 1e-9
+
+# The population counts as converged once the coefficient of variation
+# (std / |mean|) of its fitness stays below the threshold this many generations
+PLATEAU_VARIATION_THRESHOLD = 0.001
+PLATEAU_GENERATIONS = 5
+
+
+def rolling_improvement_percentage(recent_averages: Sequence[float], window: int) -> Optional[float]:
+    """
+    Percentage change between the rolling mean of the last `window` average
+    fitnesses and the same mean one generation earlier.
+
+    Args:
+        recent_averages: Average fitness per generation, oldest first;
+                         at least the last window + 1 values
+        window: Number of generations in each rolling mean (1 compares
+                consecutive generations)
+
+    Returns:
+        Improvement percentage, or None until window + 1 generations exist
+    """
+    if len(recent_averages) < window + 1:
+        return None
+
+    recent_averages = list(recent_averages)[-(window + 1):]
+    previous_mean = sum(recent_averages[:-1]) / window
+    current_mean = sum(recent_averages[1:]) / window
+
+    return (current_mean - previous_mean) / max(abs(previous_mean), MINIMUM_DENOMINATOR) * 100.0
+
+
+# Queue handler and listener of the running background logging, if started
+_background_logging: Optional[Tuple[QueueHandler, QueueListener]] = None
+
+
+def start_background_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    Print gen.* log messages from a background thread.
+
+    Records are handed to a queue without blocking and written to stderr by
+    a listener thread, so the evolution loop never waits on console output.
+    This covers the calling process only; call it inside any worker process
+    whose messages should be shown.
+
+    Calling it again while logging is running only updates the level, so
+    each message is still printed once.
+
+    Args:
+        level: Lowest level to show; engine progress is INFO with verbose=True
+
+    Returns:
+        The running listener; stop_background_logging() flushes and detaches it
+    """
+    global _background_logging
+
+    package_logger = logging.getLogger("gen")
+    package_logger.setLevel(level)
+
+    if _background_logging is None:
+        log_records = queue.Queue()
+        queue_handler = QueueHandler(log_records)
+        listener = QueueListener(log_records, logging.StreamHandler())
+
+        package_logger.addHandler(queue_handler)
+        listener.start()
+        _background_logging = (queue_handler, listener)
+
+    return _background_logging[1]
+
+
+def stop_background_logging() -> None:
+    """
+    Print any queued gen.* messages, then detach the background logging
+    started by start_background_logging. Does nothing if it is not running.
+    """
+    global _background_logging
+
+    if _background_logging is None:
+        return
+
+    queue_handler, listener = _background_logging
+    _background_logging = None
+
+    logging.getLogger("gen").removeHandler(queue_handler)
+    listener.stop()
+
 
 class GeneticAlgorithmEngine:
     """
     Main controller for the genetic algorithm optimization.
     """
 
-    def __init__(self):
+    def __init__(self, evaluation_pool: Optional[EvaluationPool] = None):
         self.generation_history = []
         self.total_generations_run = 0
         self.final_mutation_rate = 0.01
+        self.final_population = []
+        self.evaluation_pool = evaluation_pool
+        self._fitness_buffer = None  # Per-run scratch array for population fitness
 
     def _evaluate_entire_population(
             self,
-            population: List[Any]
-    ) -> Tuple[List[float], float, float, float]:
+            population_genomes: np.ndarray
+    ) -> Tuple[np.ndarray, float, float, float]:
         """
         Calculate fitness for all schedules in population.
 
+        Args:
+            population_genomes: int32 genomes of the population, shape (size, activities, 3)
+
         Returns:
-            Tuple of (fitness_list, best_score, average_score, worst_score)
+            Tuple of (fitness_array, best_score, average_score, worst_score)
         """
-        fitness_scores = []
-
-        for schedule in population:
-            score = fitness_calculator.calculate_schedule_fitness(schedule)
-            fitness_scores.append(score)
+        # One compiled call scores the whole population into the run's reusable
+        # buffer, which selection then reads without converting again
+        fitness_scores = fitness_calculator.calculate_genome_fitness(
+            population_genomes, evaluation_pool=self.evaluation_pool, out=self._fitness_buffer
+        )
 
-        if not fitness_scores:
-            return [], 0.0, 0.0, 0.0
+        if not fitness_scores.size:
+            return fitness_scores, 0.0, 0.0, 0.0
 
-        best_fitness = max(fitness_scores)
-        average_fitness = statistics.mean(fitness_scores)
-        worst_fitness = min(fitness_scores)
+        # Plain floats keep the history and results free of NumPy scalars
+        best_fitness = float(fitness_scores.max())
+        average_fitness = float(fitness_scores.mean())
+        worst_fitness = float(fitness_scores.min())
 
         return fitness_scores, best_fitness, average_fitness, worst_fitness
 
@@ -61,35 +166,109 @@ class GeneticAlgorithmEngine:
             initial_mutation_probability: float = 0.01,
             crossover_method: str = "single_point",
             elitism_count: int = 1,
-            use_adaptive_mutation: bool = True
+            use_adaptive_mutation: bool = True,
+            seed: Optional[Union[int, np.random.Generator]] = None,
+            progress_callback: Optional[Callable[[int, float, float], None]] = None,
+            initial_population: Optional[List[Schedule]] = None,
+            verbose: bool = False,
+            improvement_window: int = IMPROVEMENT_WINDOW,
+            check_termination: bool = True,
+            first_generation: int = 0,
+            earlier_averages: Sequence[float] = ()
     ) -> Dict[str, Any]:
         """
         Execute the complete genetic algorithm optimization.
 
+        Passing a seed makes the run reproducible, so identical parameters
+        always produce identical results. The seed may also be a NumPy
+        Generator, which the run then keeps drawing from.
+
+        If given, progress_callback(generations_completed, best_fitness,
+        average_fitness) is called after every generation. The callback may
+        raise StopIteration to end the run early with the current population.
+
+        If given, initial_population replaces the random starting population
+        (and sets the population size), so a run can continue from the
+        final_population of an earlier one.
+
+        Improvement is measured between rolling means of the last
+        improvement_window generations' average fitness, so a single noisy
+        generation neither ends the run nor triggers a mutation change. After
+        minimum_generations the run also ends early once the population's
+        fitness has collapsed to a plateau (see PLATEAU_VARIATION_THRESHOLD).
+
+        A run can also be one stretch of a longer evolution, as in the island
+        model: with check_termination=False it evolves exactly
+        maximum_generations generations, breeding after every one.
+        first_generation numbers its generations within the whole evolution,
+        which keeps the adaptive mutation schedule (every 20th generation)
+        running across stretches. earlier_averages are the average fitnesses
+        of the generations before the stretch, oldest first, so rolling
+        improvement continues as well.
+
+        Progress messages go to this module's logger, at INFO level with
+        verbose=True and at DEBUG otherwise; quiet runs suit outer parallel
+        drivers such as the island model (see start_background_logging).
+
         Returns:
             Dictionary containing results:
             - best_schedule: Best schedule found
             - history: Generation-by-generation metrics
             - final_mutation_rate: Mutation rate at termination
             - generations_run: Total generations executed
+            - stopped_early: True if the progress callback stopped the run
+            - fitness_cache: Genome fitness lookups served from cache vs evaluated
         """
         # ====================================================================
         # INITIALIZATION
         # ====================================================================
-        print(f"Initializing genetic algorithm with population size {population_size}...")
+        if initial_population is not None:
+            population_size = len(initial_population)
+
+        log_level = logging.INFO if verbose else logging.DEBUG
+        logger.log(log_level, "Initializing genetic algorithm with population size %d...", population_size)
+
+        # Every random draw of the run comes in bulk from one PCG64 generator,
+        # so the seed alone determines the result
+        rng = np.random.default_rng(seed)
+
+        if initial_population is None:
+            current_genomes = create_initial_population_genomes(population_size=population_size, rng=rng)
+        else:
+            current_genomes = np.stack([schedule.to_array() for schedule in initial_population])
+
+        # Two population buffers swap roles every generation: elites and
+        # offspring are written straight into the one not holding the current
+        # generation, so nothing is reallocated or wrapped in Schedule objects
+        next_genomes = np.empty_like(current_genomes)
+        number_of_elites = min(max(elitism_count, 0), population_size)
+        number_of_parent_pairs = population_size - number_of_elites
 
-        current_population = create_initial_population(population_size=population_size)
         current_mutation_rate = initial_mutation_probability
         self.generation_history = []
         self.total_generations_run = 0
 
-        previous_average_fitness = None
+        # Scratch arrays reused every generation instead of reallocated
+        self._fitness_buffer = np.empty(population_size, dtype=np.float64)
+        selection_probabilities = np.empty(population_size, dtype=np.float64)
+
+        # Averages of the generations covered by the current and previous rolling windows
+        recent_average_fitness = deque(earlier_averages, maxlen=improvement_window + 1)
+        recent_fitness_variation = deque(maxlen=PLATEAU_GENERATIONS)
+        stopped_early = False
+
+        # The fitness cache outlives a run, so report this run's share of its activity
+        starting_cache_hits = fitness_calculator.genome_cache_hits
+        starting_evaluations = fitness_calculator.genome_evaluations
 
         # ====================================================================
         # MAIN EVOLUTION LOOP
         # ====================================================================
-        for generation_number in range(maximum_generations):
-            self.total_generations_run = generation_number + 1
+        for run_generation in range(maximum_generations):
+            self.total_generations_run = run_generation + 1
+
+            # Position within the whole evolution, for records and the mutation schedule
+            generation_number = first_generation + run_generation
 
             # ----------------------------------------------------------------
             # EVALUATION PHASE
@@ -97,20 +276,18 @@ class GeneticAlgorithmEngine:
             (current_fitness_scores,
              generation_best_fitness,
              generation_average_fitness,
-             generation_worst_fitness) = self._evaluate_entire_population(current_population)
+             generation_worst_fitness) = self._evaluate_entire_population(current_genomes)
 
             # Calculate improvement percentage
-            if previous_average_fitness is None:
-                improvement_percentage = None
-            else:
-                denominator = (abs(previous_average_fitness)
-                               if abs(previous_average_fitness) > 1e-9 else 1e-9)
-                improvement_percentage = (
-                        (generation_average_fitness - previous_average_fitness)
-                        / denominator * 100.0
-                )
+            recent_average_fitness.append(generation_average_fitness)
+            improvement_percentage = rolling_improvement_percentage(
+                recent_average_fitness, improvement_window
+            )
 
-            previous_average_fitness = generation_average_fitness
+            # Spread of the population's fitness relative to its mean
+            recent_fitness_variation.append(
+                float(current_fitness_scores.std()) / max(abs(generation_average_fitness), MINIMUM_DENOMINATOR)
+            )
 
             # ----------------------------------------------------------------
             # RECORD GENERATION STATISTICS
@@ -125,18 +302,45 @@ class GeneticAlgorithmEngine:
             }
             self.generation_history.append(generation_record)
 
+            # ----------------------------------------------------------------
+            # REPORT PROGRESS
+            # ----------------------------------------------------------------
+            if progress_callback is not None:
+                try:
+                    progress_callback(generation_number + 1,
+                                      generation_best_fitness,
+                                      generation_average_fitness)
+                except StopIteration:
+                    logger.log(log_level, "Stopped by request at generation %d", generation_number + 1)
+                    stopped_early = True
+                    break
+
             # ----------------------------------------------------------------
             # CHECK TERMINATION CONDITIONS
             # ----------------------------------------------------------------
             should_terminate = (
-                    generation_number + 1 >= minimum_generations and
+                    check_termination and
+                    run_generation + 1 >= minimum_generations and
                     improvement_percentage is not None and
                     improvement_percentage < 1.0  # Less than 1% improvement
             )
 
             if should_terminate:
-                print(f"Terminating at generation {generation_number + 1}: "
-                      f"Improvement ({improvement_percentage:.2f}%) < 1%")
+                logger.log(log_level, "Terminating at generation %d: Improvement (%.2f%%) < 1%%",
+                           generation_number + 1, improvement_percentage)
+                break
+
+            has_plateaued = (
+                    check_termination and
+                    run_generation + 1 >= minimum_generations and
+                    len(recent_fitness_variation) == PLATEAU_GENERATIONS and
+                    max(recent_fitness_variation) < PLATEAU_VARIATION_THRESHOLD
+            )
+
+            if has_plateaued:
+                logger.log(log_level, "Terminating at generation %d: Fitness variation below %.3f "
+                           "for %d generations", generation_number + 1,
+                           PLATEAU_VARIATION_THRESHOLD, PLATEAU_GENERATIONS)
                 break
 
             # ----------------------------------------------------------------
@@ -146,75 +350,65 @@ class GeneticAlgorithmEngine:
                 if improvement_percentage is not None and improvement_percentage > 0.1:
                     # Halve mutation rate if it's helping
                     current_mutation_rate = current_mutation_rate / 2.0
-                    print(f"Generation {generation_number + 1}: "
-                          f"Reducing mutation rate to {current_mutation_rate:.4f}")
+                    logger.log(log_level, "Generation %d: Reducing mutation rate to %.4f",
+                               generation_number + 1, current_mutation_rate)
 
             # ----------------------------------------------------------------
             # SELECTION PHASE
             # ----------------------------------------------------------------
-            selection_probabilities = calculate_softmax_probabilities(current_fitness_scores)
-            number_of_parent_pairs = population_size - elitism_count
-            parent_combinations = select_parent_pairs(
-                current_population, selection_probabilities, number_of_parent_pairs
+            calculate_softmax_probabilities(current_fitness_scores, out=selection_probabilities)
+            parent_indices = select_parent_indices(
+                selection_probabilities, number_of_parent_pairs, rng
             )
 
             # ----------------------------------------------------------------
             # REPRODUCTION PHASE (Crossover + Mutation)
             # ----------------------------------------------------------------
-            offspring_schedules = []
+            # All children of the generation are bred at once from gathered
+            # parent genomes, directly into the next generation's buffer
+            parents_a = current_genomes[parent_indices[:, 0]]
+            parents_b = current_genomes[parent_indices[:, 1]]
+            offspring_genomes = next_genomes[number_of_elites:]
 
-            for parent_a, parent_b in parent_combinations:
-                # Crossover
-                if crossover_method == "uniform":
-                    child_schedule = perform_uniform_crossover(parent_a, parent_b)
-                else:  # Default to single-point
-                    child_schedule = perform_single_point_crossover(parent_a, parent_b)
+            # Crossover
+            if crossover_method == "uniform":
+                batch_uniform_crossover(parents_a, parents_b, rng, out=offspring_genomes)
+            else:  # Default to single-point
+                batch_single_point_crossover(parents_a, parents_b, rng, out=offspring_genomes)
 
-                # Mutation
-                apply_mutation(child_schedule, mutation_probability=current_mutation_rate)
-
-                offspring_schedules.append(child_schedule)
+            # Mutation
+            batch_mutation(offspring_genomes, current_mutation_rate, rng)
 
             # ----------------------------------------------------------------
             # ELITISM: Preserve best schedules
             # ----------------------------------------------------------------
-            elite_schedules = select_best_schedules(
-                current_population, current_fitness_scores, elitism_count
-            )
+            elite_indices = select_best_indices(current_fitness_scores, number_of_elites)
+            next_genomes[:number_of_elites] = current_genomes[elite_indices]
 
             # ----------------------------------------------------------------
             # CREATE NEXT GENERATION
             # ----------------------------------------------------------------
-            next_generation = elite_schedules + offspring_schedules
-
-            # Ensure correct population size
-            if len(next_generation) > population_size:
-                next_generation = next_generation[:population_size]
-            elif len(next_generation) < population_size:
-                # Add more offspring if needed
-                shortage = population_size - len(next_generation)
-                next_generation.extend(offspring_schedules[:shortage])
-
-            # Update population for next generation
-            current_population = next_generation
+            current_genomes, next_genomes = next_genomes, current_genomes
 
         # ====================================================================
         # FINAL EVALUATION AND RESULT PREPARATION
         # ====================================================================
-        print(f"Algorithm completed after {self.total_generations_run} generations")
+        logger.log(log_level, "Algorithm completed after %d generations", self.total_generations_run)
 
         # Final population evaluation
         (final_fitness_scores,
          final_best_fitness,
          final_average_fitness,
-         final_worst_fitness) = self._evaluate_entire_population(current_population)
+         final_worst_fitness) = self._evaluate_entire_population(current_genomes)
+
+        # Only the final generation is turned back into Schedule objects
+        self.final_population = [Schedule.from_array(genome) for genome in current_genomes]
+        for schedule, fitness_score in zip(self.final_population, final_fitness_scores.tolist()):
+            schedule.fitness = fitness_score
 
         # Find best schedule
-        best_schedule_index = max(
-            range(len(current_population)),
-            key=lambda i: final_fitness_scores[i]
-        )
-        optimal_schedule = current_population[best_schedule_index]
+        best_schedule_index = int(np.argmax(final_fitness_scores))
+        optimal_schedule = self.final_population[best_schedule_index]
 
         # Calculate violations for the best schedule
         fitness_calculator.calculate_constraint_violations(optimal_schedule)
@@ -228,6 +422,11 @@ class GeneticAlgorithmEngine:
             "history": self.generation_history,
             "final_mutation_rate": current_mutation_rate,
             "generations_run": self.total_generations_run,
+            "stopped_early": stopped_early,
+            "fitness_cache": {
+                "hits": fitness_calculator.genome_cache_hits - starting_cache_hits,
+                "evaluations": fitness_calculator.genome_evaluations - starting_evaluations,
+            },
             "final_fitness_scores": {
                 "best": final_best_fitness,
                 "average": final_average_fitness,
@@ -238,15 +437,57 @@ class GeneticAlgorithmEngine:
         return results
 
 
+class QueueProgressReporter:
+    """
+    Picklable progress callback for runs executed in a worker process.
+
+    Forwards each generation's (generations_completed, best, average) to a
+    queue and stops the run once the shared stop event has been set.
+    """
+
+    def __init__(self, progress_queue, stop_event):
+        self.progress_queue = progress_queue
+        self.stop_event = stop_event
+
+    def __call__(self, generations_completed: int, best_fitness: float, average_fitness: float):
+        self.progress_queue.put((generations_completed, best_fitness, average_fitness))
+
+        if self.stop_event.is_set():
+            raise StopIteration
+
+
 # Convenience function
-def execute_genetic_algorithm(**kwargs):
+def execute_genetic_algorithm(evaluation_workers: Optional[int] = None,
+                              number_of_islands: Optional[int] = None, **kwargs):
     """
     Convenience wrapper for running the genetic algorithm.
 
+    Args:
+        evaluation_workers: If given, score populations in this many worker
+                            processes kept for the whole run. By default the
+                            compiled kernel evaluates in-process, already
+                            spreading each population across threads.
+        number_of_islands: If greater than 1, run the island model
+                           (gen.island_engine.run_islands) instead, with
+                           population_size schedules on each island
+        **kwargs: Arguments for GeneticAlgorithmEngine.run_optimization()
+
     Returns:
         Results dictionary from GeneticAlgorithmEngine.run_optimization()
     """
-    engine = GeneticAlgorithmEngine()
-    return engine.run_optimization(**kwargs)
+    if number_of_islands and number_of_islands > 1:
+        # Imported here because gen.island_engine builds on this module
+        from gen.island_engine import run_islands
+
+        return run_islands(number_of_islands=number_of_islands,
+                           island_population_size=kwargs.pop("population_size", 250),
+                           **kwargs)
+
+    if not evaluation_workers:
+        return GeneticAlgorithmEngine().run_optimization(**kwargs)
+
+    with EvaluationPool(evaluation_workers) as evaluation_pool:
+        engine = GeneticAlgorithmEngine(evaluation_pool=evaluation_pool)
+        return engine.run_optimization(**kwargs)
 
 
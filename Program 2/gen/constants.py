@@ -2,6 +2,7 @@
 Constant definitions for the SLA scheduling problem.
 Contains all static data: rooms, activities, facilitators, time slots, and special rules.
 """
+import numpy as np
 
 # ============================================================================
 # AVAILABLE RESOURCES
@@ -134,4 +135,117 @@ ROOM_EQUIPMENT_AVAILABILITY = {
     # Default equipment for other rooms
     "Loft 206": {"has_lab": False, "has_projector": False},
     "Roman 201": {"has_lab": False, "has_projector": False},
-}
\ No newline at end of file
+}
+
+# ============================================================================
+# INDEX LOOKUPS (array-encoded schedules)
+# ============================================================================
+
+# List of all room names; a room's position is its index in encoded schedules
+ALL_ROOMS = list(ROOMS_WITH_CAPACITIES.keys())
+
+ACTIVITY_INDEX = {activity_name: index for index, activity_name in enumerate(ALL_ACTIVITIES)}
+ROOM_INDEX = {room_name: index for index, room_name in enumerate(ALL_ROOMS)}
+TIME_SLOT_INDEX = {time_slot: index for index, time_slot in enumerate(ALL_TIME_SLOTS)}
+FACILITATOR_INDEX = {facilitator: index for index, facilitator in enumerate(ALL_FACILITATORS)}
+
+# Column layout of an encoded schedule: one row per activity in ALL_ACTIVITIES order
+ROOM_COLUMN = 0
+TIME_COLUMN = 1
+FACILITATOR_COLUMN = 2
+
+# Marker for an attribute that has not been assigned yet
+UNASSIGNED = -1
+
+NUMBER_OF_ROOMS = len(ALL_ROOMS)
+NUMBER_OF_TIME_SLOTS = len(ALL_TIME_SLOTS)
+NUMBER_OF_FACILITATORS = len(ALL_FACILITATORS)
+
+# Exclusive upper bound of the index in each genome column
+COLUMN_CHOICE_COUNTS = np.empty(3, dtype=np.int32)
+COLUMN_CHOICE_COUNTS[ROOM_COLUMN] = NUMBER_OF_ROOMS
+COLUMN_CHOICE_COUNTS[TIME_COLUMN] = NUMBER_OF_TIME_SLOTS
+COLUMN_CHOICE_COUNTS[FACILITATOR_COLUMN] = NUMBER_OF_FACILITATORS
+
+# ============================================================================
+# LOOKUP TABLES (array-encoded schedules)
+# ============================================================================
+# Indexed by the encoded room, activity row, and facilitator indices above, so
+# the fitness kernels do one array load instead of dictionary and list lookups.
+
+# Seating capacity of each room
+ROOM_CAPACITIES = np.array(
+    [ROOMS_WITH_CAPACITIES[room_name] for room_name in ALL_ROOMS], dtype=np.int32
+)
+
+# Expected enrollment of each activity
+EXPECTED_ENROLLMENTS = np.array(
+    [ACTIVITY_DEFINITIONS[activity_name]["expected_enrollment"] for activity_name in ALL_ACTIVITIES],
+    dtype=np.int32
+)
+
+
+def _build_facilitator_mask(preference_key):
+    """
+    Build an (activity x facilitator) boolean mask from ACTIVITY_DEFINITIONS.
+
+    Args:
+        preference_key: "preferred_facilitators" or "acceptable_facilitators"
+
+    Returns:
+        Mask where [i, j] is True if facilitator j is listed for activity i
+    """
+    mask = np.zeros((len(ALL_ACTIVITIES), len(ALL_FACILITATORS)), dtype=np.bool_)
+
+    for activity_name, definition in ACTIVITY_DEFINITIONS.items():
+        for facilitator in definition[preference_key]:
+            mask[ACTIVITY_INDEX[activity_name], FACILITATOR_INDEX[facilitator]] = True
+
+    return mask
+
+
+PREFERRED_MASK = _build_facilitator_mask("preferred_facilitators")
+ACCEPTABLE_MASK = _build_facilitator_mask("acceptable_facilitators")
+
+# ============================================================================
+# BIT-PACKED ENCODING (two uint64 words per schedule)
+# ============================================================================
+# Each genome field gets just enough bits for its indices plus an all-ones code
+# for UNASSIGNED: 4 room bits, 3 time bits, 4 facilitator bits, 121 bits in all.
+# Fields are laid out in genome order and never straddle a word boundary.
+
+PACKED_WORDS = 2
+
+PACK_FIELD_MASKS = np.empty(3, dtype=np.int64)
+PACK_FIELD_MASKS[ROOM_COLUMN] = (1 << NUMBER_OF_ROOMS.bit_length()) - 1
+PACK_FIELD_MASKS[TIME_COLUMN] = (1 << NUMBER_OF_TIME_SLOTS.bit_length()) - 1
+PACK_FIELD_MASKS[FACILITATOR_COLUMN] = (1 << NUMBER_OF_FACILITATORS.bit_length()) - 1
+
+
+def _build_pack_layout():
+    """
+    Assign each (activity, column) field a word and a bit offset within it.
+
+    Returns:
+        Tuple of (word index array, bit shift array), each (activities, 3)
+    """
+    words = np.empty((len(ALL_ACTIVITIES), 3), dtype=np.int64)
+    shifts = np.empty((len(ALL_ACTIVITIES), 3), dtype=np.uint64)
+    word, offset = 0, 0
+
+    for activity_row in range(len(ALL_ACTIVITIES)):
+        for column in range(3):
+            field_bits = int(PACK_FIELD_MASKS[column]).bit_length()
+            if offset + field_bits > 64:
+                word, offset = word + 1, 0
+            words[activity_row, column] = word
+            shifts[activity_row, column] = offset
+            offset += field_bits
+
+    if word >= PACKED_WORDS:
+        raise ValueError("Schedule fields do not fit in the packed encoding")
+
+    return words, shifts
+
+
+PACK_WORDS, PACK_SHIFTS = _build_pack_layout()
@@ -1,284 +1,652 @@
 """
 Fitness function implementation for SLA scheduling.
 Implements all rules from Appendix A of the assignment.
+
+Fitness scoring and constraint violation counting run in Numba-compiled kernels
+over array-encoded schedules (see Schedule.to_array).
 """
-from typing import Dict, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+import numpy as np
+from numba import njit, prange, set_num_threads
 from gen.constants import (
-    ACTIVITY_DEFINITIONS,
-    ROOMS_WITH_CAPACITIES,
-    ALL_TIME_SLOTS,
+    ALL_ACTIVITIES,
+    ALL_ROOMS,
+    ACTIVITY_INDEX,
+    FACILITATOR_INDEX,
+    NUMBER_OF_ROOMS,
+    NUMBER_OF_TIME_SLOTS,
+    NUMBER_OF_FACILITATORS,
+    ROOM_CAPACITIES,
+    EXPECTED_ENROLLMENTS,
+    PREFERRED_MASK,
+    ACCEPTABLE_MASK,
+    ROOM_COLUMN,
+    TIME_COLUMN,
+    FACILITATOR_COLUMN,
+    UNASSIGNED,
     SLA101_SECTIONS,
     SLA191_SECTIONS,
-    CROSS_SECTION_PAIRS
+    CROSS_SECTION_PAIRS,
+    PACKED_WORDS
 )
+from gen.models import pack_genomes
 
+# ============================================================================
+# LOOKUP TABLES FOR THE COMPILED KERNEL
+# ============================================================================
+# Numba freezes module-level arrays, including the tables imported from
+# gen.constants, into the compiled code as constants.
 
-class FitnessCalculator:
+_ROOM_IS_BEACH_OR_ROMAN = np.array(
+    [room_name.startswith("Beach") or room_name.startswith("Roman") for room_name in ALL_ROOMS],
+    dtype=np.bool_
+)
+
+# Activity rows of the special sections
+_SLA101_ROWS = (ACTIVITY_INDEX[SLA101_SECTIONS[0]], ACTIVITY_INDEX[SLA101_SECTIONS[1]])
+_SLA191_ROWS = (ACTIVITY_INDEX[SLA191_SECTIONS[0]], ACTIVITY_INDEX[SLA191_SECTIONS[1]])
+_CROSS_SECTION_ROWS = np.array(
+    [[ACTIVITY_INDEX[section_101], ACTIVITY_INDEX[section_191]]
+     for section_101, section_191 in CROSS_SECTION_PAIRS],
+    dtype=np.int32
+)
+
+_TYLER_INDEX = FACILITATOR_INDEX["Tyler"]
+
+# Room size score per (activity, room): the ratio rules of Appendix A applied
+# once here, so the kernel does one load instead of a division and cascade
+_CAPACITY_RATIOS = ROOM_CAPACITIES[np.newaxis, :] / EXPECTED_ENROLLMENTS[:, np.newaxis]
+_ROOM_SIZE_SCORES = np.select(
+    [ROOM_CAPACITIES[np.newaxis, :] < EXPECTED_ENROLLMENTS[:, np.newaxis],  # Room too small
+     _CAPACITY_RATIOS > 3.0,  # Way too big
+     _CAPACITY_RATIOS > 1.5],  # Too big
+    [-0.5, -0.4, -0.2],
+    default=0.3  # Good fit
+)
+
+# Facilitator preference score per (activity, facilitator)
+_FACILITATOR_PREFERENCE_SCORES = np.select(
+    [PREFERRED_MASK, ACCEPTABLE_MASK], [0.5, 0.2], default=-0.1
+)
+
+# Load penalty per (facilitator, number of activities they lead): overload
+# above 4, underload below 3, except that Dr. Tyler is only penalized at 2
+_FACILITATOR_LOADS = np.arange(len(ALL_ACTIVITIES) + 1)[np.newaxis, :]
+_IS_TYLER = (np.arange(NUMBER_OF_FACILITATORS) == _TYLER_INDEX)[:, np.newaxis]
+_FACILITATOR_LOAD_SCORES = np.select(
+    [_FACILITATOR_LOADS > 4,  # Overload penalty
+     (_FACILITATOR_LOADS < 3) & ~(_IS_TYLER & (_FACILITATOR_LOADS < 2))],  # Underload penalty
+    [-0.5, -0.4],
+    default=0.0
+)
+
+
+# ============================================================================
+# COMPILED FITNESS KERNEL
+# ============================================================================
+# Explicit signatures compile the kernels eagerly at import (and cache them on
+# disk), so no call ever pays JIT latency. Genomes must be C-contiguous, which
+# lets LLVM emit tighter loops; Schedule.to_array() and np.stack both are.
+
+@njit("float64(int32, int32)", cache=True, fastmath=True)
+def _section_spacing_score(time_1, time_2):
+    """+0.5 if two sections are >4 hours apart, -0.5 if at the same time, 0 otherwise."""
+    if time_1 < 0 or time_2 < 0:
+        return 0.0
+
+    if time_1 == time_2:
+        return -0.5  # Same time penalty
+
+    if abs(time_1 - time_2) > 4:
+        return 0.5  # Good spacing bonus
+
+    return 0.0
+
+
+@njit("float64(int32, int32, int32, int32)", cache=True, fastmath=True)
+def _cross_section_score(room_101, time_101, room_191, time_191):
+    """Fitness score for one SLA101/SLA191 section pair."""
+    if time_101 < 0 or time_191 < 0:
+        return 0.0
+
+    # Same time slot penalty
+    if time_101 == time_191:
+        return -0.25
+
+    hour_diff = abs(time_101 - time_191)
+
+    # Consecutive time slots
+    if hour_diff == 1:
+        score = 0.5  # Consecutive bonus
+
+        # Check building mismatch penalty (unassigned rooms count as "not special")
+        room_101_is_special = room_101 >= 0 and _ROOM_IS_BEACH_OR_ROMAN[room_101]
+        room_191_is_special = room_191 >= 0 and _ROOM_IS_BEACH_OR_ROMAN[room_191]
+
+        if room_101_is_special != room_191_is_special:  # XOR: one special, one not
+            score -= 0.4  # Building mismatch penalty
+
+        return score
+
+    # One hour gap
+    if hour_diff == 2:
+        return 0.25
+
+    return 0.0
+
+
+@njit("void(int32[:, ::1], int32[::1], int32[::1], int32[::1])", cache=True)
+def _count_usage(genome, room_time_usage, facilitator_time_usage, facilitator_total_load):
     """
-    Calculates fitness scores and constraint violations for schedules.
-    Implements all rules from Appendix A.
+    Fill the usage counters shared by the fitness and violation kernels.
+
+    Args:
+        genome: C-contiguous int32 array of shape (number of activities, 3)
+        room_time_usage: Zeroed counts per room * NUMBER_OF_TIME_SLOTS + time slot
+        facilitator_time_usage: Zeroed counts per facilitator * NUMBER_OF_TIME_SLOTS + time slot
+        facilitator_total_load: Zeroed activity counts per facilitator
     """
+    for activity_row in range(genome.shape[0]):
+        room = genome[activity_row, ROOM_COLUMN]
+        time = genome[activity_row, TIME_COLUMN]
+        facilitator = genome[activity_row, FACILITATOR_COLUMN]
 
-    def __init__(self):
-        # Cache for performance optimization
-        self._fitness_cache = {}
+        if room >= 0 and time >= 0:
+            room_time_usage[room * NUMBER_OF_TIME_SLOTS + time] += 1
 
-        # Time slot indices for calculating hour differences
-        self._time_slot_indices = {
-            time_slot: index for index, time_slot in enumerate(ALL_TIME_SLOTS)
-        }
+        if facilitator >= 0 and time >= 0:
+            facilitator_time_usage[facilitator * NUMBER_OF_TIME_SLOTS + time] += 1
 
-    def _calculate_hour_difference(self, time_slot_1: str, time_slot_2: str) -> int:
-        """
-        Calculate the number of hours between two time slots.
+        if facilitator >= 0:
+            facilitator_total_load[facilitator] += 1
 
-        Args:
-            time_slot_1: First time slot (e.g., "10 AM")
-            time_slot_2: Second time slot
 
-        Returns:
-            Absolute hour difference (0 for same slot, 1 for consecutive, etc.)
-        """
-        idx1 = self._time_slot_indices.get(time_slot_1)
-        idx2 = self._time_slot_indices.get(time_slot_2)
+@njit("float64(int32[:, ::1])", cache=True, fastmath=True)
+def evaluate_genome(genome):
+    """
+    Calculate the total fitness of one array-encoded schedule.
+
+    Args:
+        genome: C-contiguous int32 array of shape (number of activities, 3) as
+                produced by Schedule.to_array()
+
+    Returns:
+        Total fitness score (sum of all activity scores + special rules)
+    """
+    number_of_activities = genome.shape[0]
+
+    room_time_usage = np.zeros(NUMBER_OF_ROOMS * NUMBER_OF_TIME_SLOTS, dtype=np.int32)
+    facilitator_time_usage = np.zeros(NUMBER_OF_FACILITATORS * NUMBER_OF_TIME_SLOTS, dtype=np.int32)
+    facilitator_total_load = np.zeros(NUMBER_OF_FACILITATORS, dtype=np.int32)
+
+    # ====================================================================
+    # FIRST PASS: Collect usage data for conflict detection
+    # ====================================================================
+    _count_usage(genome, room_time_usage, facilitator_time_usage, facilitator_total_load)
+
+    # ====================================================================
+    # SECOND PASS: Calculate scores for each activity
+    # ====================================================================
+    total_score = 0.0
+
+    for activity_row in range(number_of_activities):
+        room = genome[activity_row, ROOM_COLUMN]
+        time = genome[activity_row, TIME_COLUMN]
+        facilitator = genome[activity_row, FACILITATOR_COLUMN]
+        activity_score = 0.0
+
+        # 1. Room size score
+        if room >= 0:
+            activity_score += _ROOM_SIZE_SCORES[activity_row, room]
+
+        # 2. Facilitator preference score
+        if facilitator >= 0:
+            activity_score += _FACILITATOR_PREFERENCE_SCORES[activity_row, facilitator]
+
+        # 3. Room-time conflict penalty
+        if room >= 0 and time >= 0:
+            if room_time_usage[room * NUMBER_OF_TIME_SLOTS + time] > 1:
+                activity_score -= 0.5
+
+        # 4. Facilitator same-time score
+        if facilitator >= 0 and time >= 0:
+            concurrent_count = facilitator_time_usage[facilitator * NUMBER_OF_TIME_SLOTS + time]
+
+            if concurrent_count == 1:
+                activity_score += 0.2  # Sole facilitator bonus
+            elif concurrent_count > 1:
+                activity_score -= 0.2  # Conflict penalty
+
+        # 5. Facilitator total load penalties
+        if facilitator >= 0:
+            activity_score += _FACILITATOR_LOAD_SCORES[facilitator, facilitator_total_load[facilitator]]
+
+        total_score += activity_score
+
+    # ====================================================================
+    # THIRD PASS: Apply special section rules
+    # ====================================================================
+    # SLA101 sections spacing
+    total_score += _section_spacing_score(genome[_SLA101_ROWS[0], TIME_COLUMN],
+                                          genome[_SLA101_ROWS[1], TIME_COLUMN])
+
+    # SLA191 sections spacing
+    total_score += _section_spacing_score(genome[_SLA191_ROWS[0], TIME_COLUMN],
+                                          genome[_SLA191_ROWS[1], TIME_COLUMN])
+
+    # Cross-section interactions
+    for pair_index in range(_CROSS_SECTION_ROWS.shape[0]):
+        row_101 = _CROSS_SECTION_ROWS[pair_index, 0]
+        row_191 = _CROSS_SECTION_ROWS[pair_index, 1]
+        total_score += _cross_section_score(genome[row_101, ROOM_COLUMN], genome[row_101, TIME_COLUMN],
+                                            genome[row_191, ROOM_COLUMN], genome[row_191, TIME_COLUMN])
+
+    return total_score
+
+
+@njit("float64[::1](int32[:, :, ::1])", cache=True, parallel=True)
+def evaluate_population(population_genomes):
+    """
+    Calculate the fitness of every schedule in an array-encoded population.
+
+    Args:
+        population_genomes: C-contiguous int32 array of shape (population size,
+                            number of activities, 3), one encoded schedule per entry
+
+    Returns:
+        float64 array with one fitness score per schedule
+    """
+    number_of_schedules = population_genomes.shape[0]
+    fitness_scores = np.empty(number_of_schedules, dtype=np.float64)
+
+    for schedule_index in prange(number_of_schedules):
+        fitness_scores[schedule_index] = evaluate_genome(population_genomes[schedule_index])
+
+    return fitness_scores
+
+
+# ============================================================================
+# COMPILED VIOLATION KERNEL
+# ============================================================================
+
+# Violation types in report order; count_violations fills its result in this order
+VIOLATION_TYPES = (
+    "room_conflicts",
+    "room_too_small",
+    "room_too_big_15",  # >1.5x capacity
+    "room_too_big_30",  # >3x capacity
+    "facilitator_overload",
+    "facilitator_underload",
+    "facilitator_same_time_conflict",
+    "sla101_same_time",
+    "sla191_same_time",
+    "sla101_191_same_time",
+    "sla101_191_building_mismatch",
+    "sla101_191_one_hour_gap",
+    "sla101_191_consecutive_pair",
+)
+
+(_ROOM_CONFLICTS,
+ _ROOM_TOO_SMALL,
+ _ROOM_TOO_BIG_15,
+ _ROOM_TOO_BIG_30,
+ _FACILITATOR_OVERLOAD,
+ _FACILITATOR_UNDERLOAD,
+ _FACILITATOR_SAME_TIME_CONFLICT,
+ _SLA101_SAME_TIME,
+ _SLA191_SAME_TIME,
+ _SLA101_191_SAME_TIME,
+ _SLA101_191_BUILDING_MISMATCH,
+ _SLA101_191_ONE_HOUR_GAP,
+ _SLA101_191_CONSECUTIVE_PAIR) = range(len(VIOLATION_TYPES))
+
+
+@njit("int32[::1](int32[:, ::1])", cache=True)
+def count_violations(genome):
+    """
+    Count all constraint violations in one array-encoded schedule.
+
+    Args:
+        genome: C-contiguous int32 array of shape (number of activities, 3) as
+                produced by Schedule.to_array()
+
+    Returns:
+        int32 array of violation counts, ordered as VIOLATION_TYPES
+    """
+    number_of_activities = genome.shape[0]
+    violation_counts = np.zeros(len(VIOLATION_TYPES), dtype=np.int32)
+
+    room_time_usage = np.zeros(NUMBER_OF_ROOMS * NUMBER_OF_TIME_SLOTS, dtype=np.int32)
+    facilitator_time_usage = np.zeros(NUMBER_OF_FACILITATORS * NUMBER_OF_TIME_SLOTS, dtype=np.int32)
+    facilitator_total_load = np.zeros(NUMBER_OF_FACILITATORS, dtype=np.int32)
+
+    # ====================================================================
+    # FIRST PASS: Collect data and check individual violations
+    # ====================================================================
+    _count_usage(genome, room_time_usage, facilitator_time_usage, facilitator_total_load)
+
+    for activity_row in range(number_of_activities):
+        room = genome[activity_row, ROOM_COLUMN]
+
+        # Room size violations
+        if room >= 0:
+            expected = EXPECTED_ENROLLMENTS[activity_row]
+            capacity = ROOM_CAPACITIES[room]
+
+            if capacity < expected:
+                violation_counts[_ROOM_TOO_SMALL] += 1
+            elif capacity > 0 and expected > 0:
+                ratio = capacity / expected
+                if ratio > 3.0:
+                    violation_counts[_ROOM_TOO_BIG_30] += 1
+                elif ratio > 1.5:
+                    violation_counts[_ROOM_TOO_BIG_15] += 1
+
+    # ====================================================================
+    # SECOND PASS: Count conflicts from collected data
+    # ====================================================================
+    # Room-time conflicts
+    for count in room_time_usage:
+        if count > 1:
+            violation_counts[_ROOM_CONFLICTS] += count - 1
+
+    # Facilitator total load violations (unassigned facilitators are not underloaded)
+    for facilitator in range(NUMBER_OF_FACILITATORS):
+        total = facilitator_total_load[facilitator]
+
+        if total == 0:
+            continue
+
+        if total > 4:
+            violation_counts[_FACILITATOR_OVERLOAD] += 1
+        elif total < 3:
+            if facilitator == _TYLER_INDEX:
+                if total >= 2:
+                    violation_counts[_FACILITATOR_UNDERLOAD] += 1
+            else:
+                violation_counts[_FACILITATOR_UNDERLOAD] += 1
+
+    # Facilitator same-time conflicts
+    for count in facilitator_time_usage:
+        if count > 1:
+            violation_counts[_FACILITATOR_SAME_TIME_CONFLICT] += count - 1
+
+    # ====================================================================
+    # THIRD PASS: Special section violations
+    # ====================================================================
+    # SLA101 sections same time
+    time_101a = genome[_SLA101_ROWS[0], TIME_COLUMN]
+    time_101b = genome[_SLA101_ROWS[1], TIME_COLUMN]
+    if time_101a >= 0 and time_101a == time_101b:
+        violation_counts[_SLA101_SAME_TIME] += 1
+
+    # SLA191 sections same time
+    time_191a = genome[_SLA191_ROWS[0], TIME_COLUMN]
+    time_191b = genome[_SLA191_ROWS[1], TIME_COLUMN]
+    if time_191a >= 0 and time_191a == time_191b:
+        violation_counts[_SLA191_SAME_TIME] += 1
+
+    # Cross-section analysis
+    for pair_index in range(_CROSS_SECTION_ROWS.shape[0]):
+        row_101 = _CROSS_SECTION_ROWS[pair_index, 0]
+        row_191 = _CROSS_SECTION_ROWS[pair_index, 1]
+        time_101 = genome[row_101, TIME_COLUMN]
+        time_191 = genome[row_191, TIME_COLUMN]
+
+        if time_101 < 0 or time_191 < 0:
+            continue
+
+        # Same time slot
+        if time_101 == time_191:
+            violation_counts[_SLA101_191_SAME_TIME] += 1
+            continue
+
+        hour_diff = abs(time_101 - time_191)
+
+        # Consecutive slots
+        if hour_diff == 1:
+            violation_counts[_SLA101_191_CONSECUTIVE_PAIR] += 1
 
-        if idx1 is None or idx2 is None:
-            return 0
+            # Check building mismatch
+            room_101 = genome[row_101, ROOM_COLUMN]
+            room_191 = genome[row_191, ROOM_COLUMN]
+            if room_101 >= 0 and room_191 >= 0:
+                if _ROOM_IS_BEACH_OR_ROMAN[room_101] != _ROOM_IS_BEACH_OR_ROMAN[room_191]:
+                    violation_counts[_SLA101_191_BUILDING_MISMATCH] += 1
+
+        # One hour gap
+        elif hour_diff == 2:
+            violation_counts[_SLA101_191_ONE_HOUR_GAP] += 1
+
+    return violation_counts
+
+
+def warm_up_kernels() -> None:
+    """
+    Run the compiled kernels once so a fresh process has them fully loaded,
+    including Numba's parallel threading layer, before real work arrives.
+    """
+    unassigned_population = np.full((1, len(ALL_ACTIVITIES), 3), UNASSIGNED, dtype=np.int32)
+    evaluate_population(unassigned_population)
+    count_violations(unassigned_population[0])
 
-        return abs(idx1 - idx2)
 
-    def _is_room_in_beach_or_roman(self, room_name: str) -> bool:
+# ============================================================================
+# MULTI-PROCESS EVALUATION
+# ============================================================================
+
+def _init_evaluation_worker() -> None:
+    """
+    Run the kernel single-threaded in shard processes; the pool itself
+    provides the parallelism, so threads would only oversubscribe the cores.
+    """
+    set_num_threads(1)
+
+
+def _evaluate_population_shard(population_genomes: np.ndarray) -> np.ndarray:
+    """Score one shard of an encoded population inside a pool worker."""
+    return evaluate_population(population_genomes)
+
+
+class EvaluationPool:
+    """
+    Worker processes that score encoded populations, one shard per worker.
+
+    Only int32 genome arrays cross the process boundary. The pool is meant to
+    live for a whole run so processes are started once, not per generation.
+    """
+
+    def __init__(self, number_of_workers: int):
+        self.number_of_workers = number_of_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=number_of_workers, initializer=_init_evaluation_worker
+        )
+
+    def evaluate(self, population_genomes: np.ndarray) -> np.ndarray:
         """
-        Check if a room is in the Beach or Roman building.
+        Score an encoded population across the workers.
 
         Args:
-            room_name: Name of the room
+            population_genomes: int32 array of shape (population size, number of activities, 3)
 
         Returns:
-            True if room is in Beach or Roman building, False otherwise
+            float64 array with one fitness score per schedule
         """
-        if not room_name:
-            return False
+        genome_shards = [shard for shard in np.array_split(population_genomes, self.number_of_workers)
+                         if len(shard)]
+        return np.concatenate(list(self._executor.map(_evaluate_population_shard, genome_shards)))
 
-        return room_name.startswith("Beach") or room_name.startswith("Roman")
+    def close(self) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown()
 
-    def _evaluate_room_size(self, activity_name: str, room_name: str) -> float:
-        """
-        Calculate fitness contribution based on room size vs expected enrollment.
+    def __enter__(self):
+        return self
 
-        Returns:
-            Fitness score for room size (-0.5 to +0.3)
-        """
-        if not room_name or activity_name not in ACTIVITY_DEFINITIONS:
-            return 0.0
+    def __exit__(self, *exc_info):
+        self.close()
 
-        expected = ACTIVITY_DEFINITIONS[activity_name]["expected_enrollment"]
-        capacity = ROOMS_WITH_CAPACITIES.get(room_name, 0)
 
-        # Room too small
-        if capacity < expected:
-            return -0.5
+# Late generations are dominated by copies of the same few schedules, so
+# scoring remembers fitness per genome across generations and runs
+GENOME_CACHE_MAX_ENTRIES = 100_000
 
-        # Calculate room utilization ratio
-        utilization_ratio = capacity / expected
 
-        if utilization_ratio > 3.0:
-            return -0.4  # Way too big
-        elif utilization_ratio > 1.5:
-            return -0.2  # Too big
-        else:
-            return 0.3  # Good fit
+def _genome_cache_keys(population_genomes: np.ndarray) -> list:
+    """
+    Build fitness cache keys, one bytes object per genome straight from the packed buffer.
 
-    def _evaluate_facilitator_preference(self, activity_name: str, facilitator: str) -> float:
-        """
-        Calculate fitness based on facilitator preference level.
+    Args:
+        population_genomes: int32 array of shape (number of genomes, number of activities, 3)
 
-        Returns:
-            Fitness score for facilitator (0.5, 0.2, or -0.1)
-        """
-        if not facilitator or activity_name not in ACTIVITY_DEFINITIONS:
-            return 0.0
+    Returns:
+        List of packed genome keys in population order
+    """
+    # The fixed-width view drops trailing zero bytes, which keeps keys unique
+    return pack_genomes(population_genomes).view(f"S{8 * PACKED_WORDS}").ravel().tolist()
 
-        activity_info = ACTIVITY_DEFINITIONS[activity_name]
 
-        if facilitator in activity_info["preferred_facilitators"]:
-            return 0.5
-        elif facilitator in activity_info["acceptable_facilitators"]:
-            return 0.2
-        else:
-            return -0.1
+class FitnessCalculator:
+    """
+    Calculates fitness scores and constraint violations for schedules.
+    Implements all rules from Appendix A.
+    """
 
-    def _evaluate_section_spacing(self, section_1: str, section_2: str, schedule) -> float:
+    def __init__(self):
+        # Fitness keyed by packed genome bytes (see pack_genomes), least recently used first
+        self._genome_fitness_cache = OrderedDict()
+        self.genome_cache_hits = 0
+        self.genome_evaluations = 0
+
+    def calculate_schedule_fitness(self, schedule) -> float:
         """
-        Evaluate spacing rules for two sections of the same course.
+        Calculate total fitness score for a complete schedule.
+
+        Args:
+            schedule: Schedule object to evaluate
 
         Returns:
-            +0.5 if >4 hours apart, -0.5 if same time, 0 otherwise
+            Total fitness score (sum of all activity scores + special rules)
         """
-        assign_1 = schedule.assignments[section_1]
-        assign_2 = schedule.assignments[section_2]
+        genome = schedule.to_array()
 
-        if not assign_1.time or not assign_2.time:
-            return 0.0
+        # Shares the bounded cache, and its statistics, with population scoring
+        genome_key = _genome_cache_keys(genome[np.newaxis])[0]
+        total_score = self._genome_fitness_cache.get(genome_key)
 
-        if assign_1.time == assign_2.time:
-            return -0.5  # Same time penalty
+        if total_score is not None:
+            self._genome_fitness_cache.move_to_end(genome_key)
+            self.genome_cache_hits += 1
+        else:
+            total_score = evaluate_genome(genome)
+            self.genome_evaluations += 1
+            self._remember_genome_fitness({genome_key: total_score})
 
-        hour_diff = self._calculate_hour_difference(assign_1.time, assign_2.time)
+        schedule.fitness = total_score
 
-        if hour_diff > 4:
-            return 0.5  # Good spacing bonus
+        return total_score
 
-        return 0.0
+    def _remember_genome_fitness(self, scores_by_key: Dict[bytes, float]) -> None:
+        """
+        Add newly computed scores to the genome cache, evicting the least recently used.
 
-    def _evaluate_cross_section_interaction(self, section_101: str, section_191: str, schedule) -> float:
+        Args:
+            scores_by_key: Fitness scores keyed by packed genome bytes
         """
-        Evaluate interaction rules between SLA101 and SLA191 sections.
+        self._genome_fitness_cache.update(scores_by_key)
+        while len(self._genome_fitness_cache) > GENOME_CACHE_MAX_ENTRIES:
+            self._genome_fitness_cache.popitem(last=False)
+
+    def calculate_genome_fitness(self, population_genomes, evaluation_pool=None, out=None) -> np.ndarray:
+        """
+        Calculate fitness for an encoded population in a single kernel call.
+
+        Genomes seen before (in this or an earlier generation) are looked up
+        instead of evaluated, so the kernel only scores novel schedules.
+
+        Args:
+            population_genomes: int32 array of shape (population size, number of activities, 3)
+            evaluation_pool: Optional EvaluationPool to score novel genomes in
+                             worker processes instead of in this process
+            out: Optional float64 array of population length to write the scores into
 
         Returns:
-            Fitness score for this specific pair
+            float64 array of fitness scores in population order (out, if given)
         """
-        assign_101 = schedule.assignments[section_101]
-        assign_191 = schedule.assignments[section_191]
+        if out is None:
+            out = np.empty(len(population_genomes), dtype=np.float64)
 
-        if not assign_101.time or not assign_191.time:
-            return 0.0
+        if not len(population_genomes):
+            return out
 
-        # Same time slot penalty
-        if assign_101.time == assign_191.time:
-            return -0.25
+        genome_keys = _genome_cache_keys(population_genomes)
 
-        hour_diff = self._calculate_hour_difference(assign_101.time, assign_191.time)
+        fitness_scores = [None] * len(population_genomes)
+        novel_rows = {}
 
-        # Consecutive time slots
-        if hour_diff == 1:
-            score = 0.5  # Consecutive bonus
+        for row, genome_key in enumerate(genome_keys):
+            cached_score = self._genome_fitness_cache.get(genome_key)
 
-            # Check building mismatch penalty
-            room_101_is_special = self._is_room_in_beach_or_roman(assign_101.room)
-            room_191_is_special = self._is_room_in_beach_or_roman(assign_191.room)
+            if cached_score is not None:
+                self._genome_fitness_cache.move_to_end(genome_key)
+                fitness_scores[row] = cached_score
+                self.genome_cache_hits += 1
+            elif genome_key in novel_rows:
+                # Duplicate within this generation; scored once below
+                self.genome_cache_hits += 1
+            else:
+                novel_rows[genome_key] = row
 
-            if room_101_is_special != room_191_is_special:  # XOR: one special, one not
-                score -= 0.4  # Building mismatch penalty
+        if novel_rows:
+            novel_genomes = population_genomes[list(novel_rows.values())]
 
-            return score
+            if evaluation_pool is None:
+                novel_fitness = evaluate_population(novel_genomes)
+            else:
+                novel_fitness = evaluation_pool.evaluate(novel_genomes)
 
-        # One hour gap
-        if hour_diff == 2:
-            return 0.25
+            novel_scores = dict(zip(novel_rows, novel_fitness.tolist()))
+            self.genome_evaluations += len(novel_scores)
 
-        return 0.0
+            # Scatter the new scores back, including to in-generation duplicates
+            for row, genome_key in enumerate(genome_keys):
+                if fitness_scores[row] is None:
+                    fitness_scores[row] = novel_scores[genome_key]
 
-    def calculate_schedule_fitness(self, schedule) -> float:
+            self._remember_genome_fitness(novel_scores)
+
+        out[:] = fitness_scores
+        return out
+
+    def calculate_population_fitness(self, population, evaluation_pool=None, out=None):
         """
-        Calculate total fitness score for a complete schedule.
+        Calculate fitness for a whole population of schedules.
+
+        Scores come from calculate_genome_fitness and are also stored on
+        each schedule.
 
         Args:
-            schedule: Schedule object to evaluate
+            population: List of Schedule objects to evaluate
+            evaluation_pool: Optional EvaluationPool to score novel genomes in
+                             worker processes instead of in this process
+            out: Optional float64 array of population length to write the scores into
 
         Returns:
-            Total fitness score (sum of all activity scores + special rules)
+            List of fitness scores in population order, or out filled with them
         """
-        # Generate cache key from assignments
-        cache_key = hash(str([(a.room, a.time, a.facilitator)
-                              for a in schedule.assignments.values()]))
-
-        # Return cached result if available
-        if cache_key in self._fitness_cache:
-            schedule.fitness = self._fitness_cache[cache_key]
-            return schedule.fitness
-
-        total_score = 0.0
-
-        # Data structures for conflict detection
-        room_time_usage = {}
-        facilitator_time_usage = {}
-        facilitator_total_load = {}
-
-        # ====================================================================
-        # FIRST PASS: Collect usage data and calculate basic scores
-        # ====================================================================
-        for activity_name, assignment in schedule.assignments.items():
-            # Track room-time usage for conflict detection
-            if assignment.room and assignment.time:
-                room_time_key = (assignment.room, assignment.time)
-                room_time_usage[room_time_key] = room_time_usage.get(room_time_key, 0) + 1
-
-            # Track facilitator-time usage
-            if assignment.facilitator and assignment.time:
-                facilitator_time_key = (assignment.facilitator, assignment.time)
-                facilitator_time_usage[facilitator_time_key] = (
-                        facilitator_time_usage.get(facilitator_time_key, 0) + 1
-                )
-
-            # Track total facilitator load
-            if assignment.facilitator:
-                facilitator_total_load[assignment.facilitator] = (
-                        facilitator_total_load.get(assignment.facilitator, 0) + 1
-                )
-
-        # ====================================================================
-        # SECOND PASS: Calculate scores for each activity
-        # ====================================================================
-        for activity_name, assignment in schedule.assignments.items():
-            activity_score = 0.0
-
-            # 1. Room size score
-            activity_score += self._evaluate_room_size(activity_name, assignment.room)
-
-            # 2. Facilitator preference score
-            activity_score += self._evaluate_facilitator_preference(activity_name, assignment.facilitator)
-
-            # 3. Room-time conflict penalty
-            if assignment.room and assignment.time:
-                room_time_key = (assignment.room, assignment.time)
-                if room_time_usage.get(room_time_key, 0) > 1:
-                    activity_score -= 0.5
-
-            # 4. Facilitator same-time score
-            if assignment.facilitator and assignment.time:
-                facilitator_time_key = (assignment.facilitator, assignment.time)
-                concurrent_count = facilitator_time_usage.get(facilitator_time_key, 0)
-
-                if concurrent_count == 1:
-                    activity_score += 0.2  # Sole facilitator bonus
-                elif concurrent_count > 1:
-                    activity_score -= 0.2  # Conflict penalty
-
-            # 5. Facilitator total load penalties
-            if assignment.facilitator:
-                total_load = facilitator_total_load.get(assignment.facilitator, 0)
-
-                if total_load > 4:
-                    activity_score -= 0.5  # Overload penalty
-                elif total_load < 3:
-                    # Special rule for Dr. Tyler
-                    if assignment.facilitator == "Tyler":
-                        if total_load >= 2:  # Tyler penalty only if 2 or more but less than 3
-                            activity_score -= 0.4
-                    else:
-                        activity_score -= 0.4  # Underload penalty
-
-            total_score += activity_score
-
-        # ====================================================================
-        # THIRD PASS: Apply special section rules
-        # ====================================================================
-        # SLA101 sections spacing
-        total_score += self._evaluate_section_spacing(SLA101_SECTIONS[0], SLA101_SECTIONS[1], schedule)
-
-        # SLA191 sections spacing
-        total_score += self._evaluate_section_spacing(SLA191_SECTIONS[0], SLA191_SECTIONS[1], schedule)
-
-        # Cross-section interactions
-        for section_101, section_191 in CROSS_SECTION_PAIRS:
-            total_score += self._evaluate_cross_section_interaction(section_101, section_191, schedule)
-
-        # Cache and return result
-        self._fitness_cache[cache_key] = total_score
-        schedule.fitness = total_score
+        if not population:
+            return [] if out is None else out
 
-        return total_score
+        population_genomes = np.stack([schedule.to_array() for schedule in population])
+        scores = self.calculate_genome_fitness(population_genomes, evaluation_pool, out)
+        fitness_scores = scores.tolist()
+
+        for schedule, score in zip(population, fitness_scores):
+            schedule.fitness = score
+
+        return fitness_scores if out is None else out
 
     def calculate_constraint_violations(self, schedule) -> Dict:
         """
@@ -290,129 +658,7 @@ class FitnessCalculator:
         Returns:
             Dictionary with counts for each violation type
         """
-        violation_counts = {
-            "room_conflicts": 0,
-            "room_too_small": 0,
-            "room_too_big_15": 0,  # >1.5x capacity
-            "room_too_big_30": 0,  # >3x capacity
-            "facilitator_overload": 0,
-            "facilitator_underload": 0,
-            "facilitator_same_time_conflict": 0,
-            "sla101_same_time": 0,
-            "sla191_same_time": 0,
-            "sla101_191_same_time": 0,
-            "sla101_191_building_mismatch": 0,
-            "sla101_191_one_hour_gap": 0,
-            "sla101_191_consecutive_pair": 0,
-        }
-
-        # Data collection for conflict analysis
-        room_time_counts = {}
-        facilitator_time_counts = {}
-        facilitator_total_counts = {}
-
-        # ====================================================================
-        # FIRST PASS: Collect data and check individual violations
-        # ====================================================================
-        for activity_name, assignment in schedule.assignments.items():
-            # Room-time conflicts
-            if assignment.room and assignment.time:
-                key = (assignment.room, assignment.time)
-                room_time_counts[key] = room_time_counts.get(key, 0) + 1
-
-            # Facilitator-time conflicts
-            if assignment.facilitator and assignment.time:
-                key = (assignment.facilitator, assignment.time)
-                facilitator_time_counts[key] = facilitator_time_counts.get(key, 0) + 1
-
-            # Facilitator total load
-            if assignment.facilitator:
-                facilitator_total_counts[assignment.facilitator] = (
-                        facilitator_total_counts.get(assignment.facilitator, 0) + 1
-                )
-
-            # Room size violations
-            if activity_name in ACTIVITY_DEFINITIONS and assignment.room:
-                expected = ACTIVITY_DEFINITIONS[activity_name]["expected_enrollment"]
-                capacity = ROOMS_WITH_CAPACITIES.get(assignment.room, 0)
-
-                if capacity < expected:
-                    violation_counts["room_too_small"] += 1
-                elif capacity > 0 and expected > 0:
-                    ratio = capacity / expected
-                    if ratio > 3.0:
-                        violation_counts["room_too_big_30"] += 1
-                    elif ratio > 1.5:
-                        violation_counts["room_too_big_15"] += 1
-
-        # ====================================================================
-        # SECOND PASS: Count conflicts from collected data
-        # ====================================================================
-        # Room-time conflicts
-        for count in room_time_counts.values():
-            if count > 1:
-                violation_counts["room_conflicts"] += count - 1
-
-        # Facilitator total load violations
-        for facilitator, total in facilitator_total_counts.items():
-            if total > 4:
-                violation_counts["facilitator_overload"] += 1
-            elif total < 3:
-                if facilitator == "Tyler":
-                    if total >= 2:
-                        violation_counts["facilitator_underload"] += 1
-                else:
-                    violation_counts["facilitator_underload"] += 1
-
-        # Facilitator same-time conflicts
-        for count in facilitator_time_counts.values():
-            if count > 1:
-                violation_counts["facilitator_same_time_conflict"] += count - 1
-
-        # ====================================================================
-        # THIRD PASS: Special section violations
-        # ====================================================================
-        # SLA101 sections same time
-        assign_101a = schedule.assignments[SLA101_SECTIONS[0]]
-        assign_101b = schedule.assignments[SLA101_SECTIONS[1]]
-        if assign_101a.time and assign_101b.time and assign_101a.time == assign_101b.time:
-            violation_counts["sla101_same_time"] += 1
-
-        # SLA191 sections same time
-        assign_191a = schedule.assignments[SLA191_SECTIONS[0]]
-        assign_191b = schedule.assignments[SLA191_SECTIONS[1]]
-        if assign_191a.time and assign_191b.time and assign_191a.time == assign_191b.time:
-            violation_counts["sla191_same_time"] += 1
-
-        # Cross-section analysis
-        for section_101, section_191 in CROSS_SECTION_PAIRS:
-            assign_101 = schedule.assignments[section_101]
-            assign_191 = schedule.assignments[section_191]
-
-            if not assign_101.time or not assign_191.time:
-                continue
-
-            # Same time slot
-            if assign_101.time == assign_191.time:
-                violation_counts["sla101_191_same_time"] += 1
-                continue
-
-            hour_diff = self._calculate_hour_difference(assign_101.time, assign_191.time)
-
-            # Consecutive slots
-            if hour_diff == 1:
-                violation_counts["sla101_191_consecutive_pair"] += 1
-
-                # Check building mismatch
-                if assign_101.room and assign_191.room:
-                    room_101_special = self._is_room_in_beach_or_roman(assign_101.room)
-                    room_191_special = self._is_room_in_beach_or_roman(assign_191.room)
-                    if room_101_special != room_191_special:
-                        violation_counts["sla101_191_building_mismatch"] += 1
-
-            # One hour gap
-            elif hour_diff == 2:
-                violation_counts["sla101_191_one_hour_gap"] += 1
+        violation_counts = dict(zip(VIOLATION_TYPES, count_violations(schedule.to_array()).tolist()))
 
         # Store violations in schedule
         schedule.violations = violation_counts
@@ -1,42 +1,50 @@
 """
 Genetic operators for the scheduling algorithm.
 Includes crossover and mutation functions.
+
+Operators work on the schedules' int32 genomes (see Schedule.to_array), so a
+crossover is a pair of row-slice copies rather than per-assignment objects.
+The batch_* variants produce a whole generation's offspring at once from
+stacked parent genomes.
 """
-import random
+from typing import Optional
+import numpy as np
 from gen.models import Schedule
-from gen.constants import ALL_ACTIVITIES
+from gen.constants import (
+    ALL_ACTIVITIES,
+    COLUMN_CHOICE_COUNTS
+)
 
 
-def perform_single_point_crossover(parent_1: Schedule, parent_2: Schedule) -> Schedule:
+def perform_single_point_crossover(parent_1: Schedule, parent_2: Schedule,
+                                   rng: Optional[np.random.Generator] = None) -> Schedule:
     """
     Create child schedule using single-point crossover.
 
     Args:
         parent_1: First parent schedule
         parent_2: Second parent schedule
+        rng: NumPy random generator; a fresh unseeded one if omitted
 
     Returns:
         New child schedule
     """
-    # Random crossover point
-    crossover_point = random.randint(0, len(ALL_ACTIVITIES) - 1)
+    if rng is None:
+        rng = np.random.default_rng()
 
-    # Create child assignments
-    child_assignments = {}
+    # Random crossover point; the child takes activities up to and including
+    # it from the first parent and the rest from the second
+    crossover_point = int(rng.integers(len(ALL_ACTIVITIES)))
 
-    for index, activity_name in enumerate(ALL_ACTIVITIES):
-        if index <= crossover_point:
-            # Take from first parent
-            child_assignments[activity_name] = parent_1.assignments[activity_name].copy()
-        else:
-            # Take from second parent
-            child_assignments[activity_name] = parent_2.assignments[activity_name].copy()
+    child_genome = parent_1.to_array().copy()
+    child_genome[crossover_point + 1:] = parent_2.to_array()[crossover_point + 1:]
 
-    return Schedule(child_assignments)
+    return Schedule.from_array(child_genome)
 
 
 def perform_uniform_crossover(parent_1: Schedule, parent_2: Schedule,
-                              crossover_probability: float = 0.5) -> Schedule:
+                              crossover_probability: float = 0.5,
+                              rng: Optional[np.random.Generator] = None) -> Schedule:
     """
     Create child schedule using uniform crossover.
 
@@ -44,52 +52,140 @@ def perform_uniform_crossover(parent_1: Schedule, parent_2: Schedule,
         parent_1: First parent schedule
         parent_2: Second parent schedule
         crossover_probability: Probability of taking from second parent
+        rng: NumPy random generator; a fresh unseeded one if omitted
 
     Returns:
         New child schedule
     """
-    child_assignments = {}
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # One draw per activity decides which parent supplies its whole row
+    take_from_second_parent = rng.random(len(ALL_ACTIVITIES)) < crossover_probability
 
-    for activity_name in ALL_ACTIVITIES:
-        if random.random() < crossover_probability:
-            # Take from second parent
-            child_assignments[activity_name] = parent_2.assignments[activity_name].copy()
-        else:
-            # Take from first parent
-            child_assignments[activity_name] = parent_1.assignments[activity_name].copy()
+    child_genome = np.where(
+        take_from_second_parent[:, np.newaxis], parent_2.to_array(), parent_1.to_array()
+    )
 
-    return Schedule(child_assignments)
+    return Schedule.from_array(child_genome)
 
 
-def apply_mutation(schedule: Schedule, mutation_probability: float = 0.01) -> Schedule:
+def apply_mutation(schedule: Schedule, mutation_probability: float = 0.01,
+                   rng: Optional[np.random.Generator] = None) -> Schedule:
     """
     Mutate a schedule by randomly changing room, time, or facilitator.
 
     Args:
         schedule: Schedule to mutate (modified in place)
         mutation_probability: Probability of mutating each attribute
+        rng: NumPy random generator; a fresh unseeded one if omitted
 
     Returns:
         The mutated schedule (same object)
     """
-    from gen.constants import ROOMS_WITH_CAPACITIES, ALL_TIME_SLOTS, ALL_FACILITATORS
+    if rng is None:
+        rng = np.random.default_rng()
 
-    for activity_name in schedule.assignments:
-        assignment = schedule.assignments[activity_name]
+    # A one-child batch: every attribute's draw happens in a single vectorized call
+    batch_mutation(schedule.to_array()[np.newaxis], mutation_probability, rng)
 
-        # Mutate room with given probability
-        if random.random() < mutation_probability:
-            assignment.room = random.choice(list(ROOMS_WITH_CAPACITIES.keys()))
+    # Clear cached fitness since schedule changed
+    schedule.fitness = None
 
-        # Mutate time slot with given probability
-        if random.random() < mutation_probability:
-            assignment.time = random.choice(ALL_TIME_SLOTS)
+    return schedule
 
-        # Mutate facilitator with given probability
-        if random.random() < mutation_probability:
-            assignment.facilitator = random.choice(ALL_FACILITATORS)
 
-    # Clear cached fitness since schedule changed
-    schedule.fitness = None
+# ============================================================================
+# BATCH OPERATORS (whole offspring generation at once)
+# ============================================================================
+
+def _choose_parent_rows(take_from_chosen: np.ndarray, chosen_parents: np.ndarray,
+                        other_parents: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Build children activity by activity from two parent batches.
+
+    Args:
+        take_from_chosen: bool array (children, activities); True takes that
+                          activity's row from chosen_parents
+        chosen_parents: int32 genomes, shape (children, activities, 3)
+        other_parents: int32 genomes supplying every other row, same shape
+        out: Optional array to write the children into
+
+    Returns:
+        int32 array of child genomes (out, if given)
+    """
+    if out is None:
+        return np.where(take_from_chosen[:, :, np.newaxis], chosen_parents, other_parents)
+
+    np.copyto(out, other_parents)
+    np.copyto(out, chosen_parents, where=take_from_chosen[:, :, np.newaxis])
+    return out
+
+
+def batch_single_point_crossover(parents_a: np.ndarray, parents_b: np.ndarray,
+                                 rng: np.random.Generator,
+                                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Create one child per parent pair using single-point crossover.
+
+    Args:
+        parents_a: int32 genomes of the first parents, shape (children, activities, 3)
+        parents_b: int32 genomes of the second parents, same shape
+        rng: NumPy random generator
+        out: Optional int32 array of the parents' shape to write the children into
+
+    Returns:
+        int32 array of child genomes, same shape as the parents (out, if given)
+    """
+    number_of_children, number_of_activities = parents_a.shape[:2]
+
+    # As in perform_single_point_crossover, each child takes activities up to
+    # and including its crossover point from the first parent
+    crossover_points = rng.integers(0, number_of_activities, size=number_of_children)
+    take_from_first_parent = np.arange(number_of_activities) <= crossover_points[:, np.newaxis]
+
+    return _choose_parent_rows(take_from_first_parent, parents_a, parents_b, out)
+
+
+def batch_uniform_crossover(parents_a: np.ndarray, parents_b: np.ndarray,
+                            rng: np.random.Generator,
+                            crossover_probability: float = 0.5,
+                            out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Create one child per parent pair using uniform crossover.
+
+    Args:
+        parents_a: int32 genomes of the first parents, shape (children, activities, 3)
+        parents_b: int32 genomes of the second parents, same shape
+        rng: NumPy random generator
+        crossover_probability: Probability of taking an activity from the second parent
+        out: Optional int32 array of the parents' shape to write the children into
+
+    Returns:
+        int32 array of child genomes, same shape as the parents (out, if given)
+    """
+    take_from_second_parent = rng.random(parents_a.shape[:2]) < crossover_probability
+
+    return _choose_parent_rows(take_from_second_parent, parents_b, parents_a, out)
+
+
+def batch_mutation(children: np.ndarray, mutation_probability: float,
+                   rng: np.random.Generator) -> np.ndarray:
+    """
+    Mutate every child's rooms, times, and facilitators in one pass.
+
+    Args:
+        children: int32 child genomes, shape (children, activities, 3); modified in place
+        mutation_probability: Probability of mutating each attribute
+        rng: NumPy random generator
+
+    Returns:
+        The mutated children (same array)
+    """
+    mutated = rng.random(children.shape) < mutation_probability
+
+    # Each mutated attribute gets a fresh index below its own column's bound
+    choice_counts = np.broadcast_to(COLUMN_CHOICE_COUNTS, children.shape)[mutated]
+    children[mutated] = rng.integers(0, choice_counts)
 
-    return schedule
\ No newline at end of file
+    return children
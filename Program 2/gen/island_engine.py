@@ -0,0 +1,290 @@
+"""
+Island-model genetic algorithm for SLA scheduling.
+Evolves several sub-populations in separate processes and periodically
+migrates the best schedules of each island to its neighbour.
+"""
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+from numba import set_num_threads
+from gen.algorithm_engine import (
+    IMPROVEMENT_WINDOW,
+    GeneticAlgorithmEngine,
+    rolling_improvement_percentage
+)
+from gen.fitness_evaluator import fitness_calculator
+from gen.models import Schedule
+from gen.population_manager import create_initial_population_genomes
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# ISLAND WORKER
+# ============================================================================
+
+def _init_island_worker() -> None:
+    """
+    Run the fitness kernel single-threaded in island processes; the islands
+    themselves use the cores, so threads would only oversubscribe them.
+    """
+    set_num_threads(1)
+
+
+def _evolve_island(island: Dict[str, Any], run_parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Evolve one island for exactly one migration period with the standard engine.
+
+    The engine runs with check_termination=False, continuing the island's
+    generation numbering, rolling averages, mutation rate and random generator
+    from the previous period, so a period is one seamless stretch of the
+    island's evolution.
+
+    Args:
+        island: Island state from run_islands or an earlier call: population_genomes,
+                rng, mutation_rate, and average_fitness (recent generations, oldest first)
+        run_parameters: Remaining keyword arguments for GeneticAlgorithmEngine.run_optimization,
+                        including maximum_generations (the period length) and first_generation
+
+    Returns:
+        The island's new state, plus its fitness_scores for the evolved
+        population and the period's history and fitness_cache statistics
+    """
+    improvement_window = run_parameters["improvement_window"]
+
+    engine = GeneticAlgorithmEngine()
+    results = engine.run_optimization(
+        initial_population=[Schedule.from_array(genome) for genome in island["population_genomes"]],
+        seed=island["rng"],
+        initial_mutation_probability=island["mutation_rate"],
+        earlier_averages=island["average_fitness"],
+        check_termination=False,
+        **run_parameters
+    )
+
+    period_averages = [record["avg"] for record in results["history"]]
+
+    return {
+        "population_genomes": np.stack([schedule.to_array() for schedule in engine.final_population]),
+        "fitness_scores": np.array([schedule.fitness for schedule in engine.final_population]),
+        "rng": island["rng"],  # Advanced by the run; sent back so the next period continues it
+        "mutation_rate": results["final_mutation_rate"],
+        "average_fitness": (list(island["average_fitness"]) + period_averages)[-improvement_window:],
+        "history": results["history"],
+        "fitness_cache": results["fitness_cache"],
+    }
+
+
+# ============================================================================
+# MIGRATION AND HISTORY
+# ============================================================================
+
+def _migrate_around_ring(islands: List[Dict[str, Any]], migrants: int) -> None:
+    """
+    Replace each island's worst schedules with copies of its predecessor's best.
+
+    Island i sends to island i + 1, and the last island sends to the first.
+    Migrants are taken before any island is changed.
+
+    Args:
+        islands: Island results from _evolve_island; modified in place
+        migrants: Number of schedules each island sends
+    """
+    outgoing = []
+    for island in islands:
+        best_rows = np.argsort(-island["fitness_scores"], kind="stable")[:migrants]
+        outgoing.append((island["population_genomes"][best_rows].copy(),
+                         island["fitness_scores"][best_rows].copy()))
+
+    for island_index, island in enumerate(islands):
+        migrant_genomes, migrant_scores = outgoing[island_index - 1]
+        worst_rows = np.argsort(island["fitness_scores"], kind="stable")[:len(migrant_scores)]
+        island["population_genomes"][worst_rows] = migrant_genomes
+        island["fitness_scores"][worst_rows] = migrant_scores
+
+
+def _combine_island_histories(islands: List[Dict[str, Any]], first_generation: int,
+                              earlier_averages: List[float],
+                              improvement_window: int) -> List[Dict[str, Any]]:
+    """
+    Merge one migration period of per-island histories into whole-run records.
+
+    Islands are equally sized, so the average of island averages is the
+    average over every schedule.
+
+    Args:
+        islands: Island results from _evolve_island
+        first_generation: Run-wide number of the period's first generation
+        earlier_averages: Combined averages of the generations before, oldest first
+        improvement_window: Generations per rolling mean (see rolling_improvement_percentage)
+
+    Returns:
+        Generation records shaped like GeneticAlgorithmEngine history entries
+    """
+    combined_history = []
+    recent_averages = list(earlier_averages)
+
+    for offset, island_records in enumerate(zip(*(island["history"] for island in islands))):
+        average_fitness = float(np.mean([record["avg"] for record in island_records]))
+        recent_averages.append(average_fitness)
+        improvement_percentage = rolling_improvement_percentage(recent_averages, improvement_window)
+
+        combined_history.append({
+            "generation": first_generation + offset,
+            "best": max(record["best"] for record in island_records),
+            "avg": average_fitness,
+            "worst": min(record["worst"] for record in island_records),
+            "improvement": improvement_percentage,
+            "mutation_rate": float(np.mean([record["mutation_rate"] for record in island_records])),
+        })
+
+    return combined_history
+
+
+# ============================================================================
+# ISLAND MODEL DRIVER
+# ============================================================================
+
+def run_islands(
+        number_of_islands: Optional[int] = None,
+        island_population_size: int = 250,
+        migration_period: int = 20,
+        migrants: int = 2,
+        minimum_generations: int = 100,
+        maximum_generations: int = 500,
+        initial_mutation_probability: float = 0.01,
+        crossover_method: str = "single_point",
+        elitism_count: int = 1,
+        use_adaptive_mutation: bool = True,
+        seed: Optional[int] = None,
+        improvement_window: int = IMPROVEMENT_WINDOW,
+        progress_callback: Optional[Callable[[int, float, float], None]] = None
+) -> Dict[str, Any]:
+    """
+    Run an island-model genetic algorithm across worker processes.
+
+    Each island evolves its own population with GeneticAlgorithmEngine for
+    exactly migration_period generations (the last period may be shorter to
+    end at maximum_generations), then sends its best schedules to the next
+    island in a ring. Each island's random generator, mutation schedule and
+    rolling improvement window carry over between periods, so apart from
+    migration an island evolves exactly like a single uninterrupted run.
+    The run ends with the same rule as a single population: after
+    minimum_generations, the first migration period whose last generation
+    improves the rolling mean of the combined average fitness by less than 1%.
+
+    If given, progress_callback(generations_completed, best_fitness,
+    average_fitness) is called for every combined generation as each period
+    completes. It may raise StopIteration to end the run after that period.
+
+    Args:
+        number_of_islands: Number of islands and worker processes (default: CPU count)
+        island_population_size: Schedules per island (must be ≥ 250)
+        migration_period: Generations between migrations
+        migrants: Schedules each island sends per migration
+        minimum_generations: Generations to run before termination is checked
+        maximum_generations: Upper bound on generations
+        initial_mutation_probability: Starting mutation rate of every island
+        crossover_method: "single_point" or "uniform"
+        elitism_count: Best schedules each island keeps per generation
+        use_adaptive_mutation: Let each island's engine adjust its mutation rate
+        seed: Makes the whole run reproducible if given
+        improvement_window: Generations per rolling mean when measuring improvement
+        progress_callback: Optional per-generation progress callback, see above
+
+    Returns:
+        Results dictionary shaped like GeneticAlgorithmEngine.run_optimization(),
+        with history and final scores combined over all islands and the
+        additional key number_of_islands
+    """
+    number_of_islands = number_of_islands or os.cpu_count() or 1
+
+    # Starting populations and each island's own generator all derive from the one run seed
+    rng = np.random.default_rng(seed)
+
+    islands = []
+    for island_rng in rng.spawn(number_of_islands):
+        islands.append({
+            "population_genomes": create_initial_population_genomes(island_population_size, rng),
+            "rng": island_rng,
+            "mutation_rate": initial_mutation_probability,
+            "average_fitness": [],
+        })
+
+    generation_history = []
+    fitness_cache = {"hits": 0, "evaluations": 0}
+    stopped_early = False
+
+    with ProcessPoolExecutor(max_workers=number_of_islands, initializer=_init_island_worker) as executor:
+        while len(generation_history) < maximum_generations:
+            period_length = min(migration_period, maximum_generations - len(generation_history))
+            period_parameters = {
+                "maximum_generations": period_length,
+                "first_generation": len(generation_history),
+                "crossover_method": crossover_method,
+                "elitism_count": elitism_count,
+                "use_adaptive_mutation": use_adaptive_mutation,
+                "improvement_window": improvement_window,
+            }
+
+            islands = list(executor.map(
+                _evolve_island, islands, [period_parameters] * number_of_islands
+            ))
+
+            earlier_averages = [record["avg"] for record in generation_history[-improvement_window:]]
+            generation_history.extend(_combine_island_histories(
+                islands, len(generation_history), earlier_averages, improvement_window
+            ))
+            for island in islands:
+                fitness_cache["hits"] += island["fitness_cache"]["hits"]
+                fitness_cache["evaluations"] += island["fitness_cache"]["evaluations"]
+
+            if progress_callback is not None:
+                try:
+                    for record in generation_history[-period_length:]:
+                        progress_callback(record["generation"] + 1, record["best"], record["avg"])
+                except StopIteration:
+                    logger.info("Islands stopped by request at generation %d", len(generation_history))
+                    stopped_early = True
+                    break
+
+            last_improvement = generation_history[-1]["improvement"]
+            if (len(generation_history) >= minimum_generations and
+                    last_improvement is not None and last_improvement < 1.0):
+                logger.info("Terminating islands at generation %d: Improvement (%.2f%%) < 1%%",
+                            len(generation_history), last_improvement)
+                break
+
+            # No migration after the final period; nothing would evolve the migrants
+            if number_of_islands > 1 and len(generation_history) < maximum_generations:
+                _migrate_around_ring(islands, migrants)
+
+    # ========================================================================
+    # RESULT PREPARATION
+    # ========================================================================
+    all_genomes = np.concatenate([island["population_genomes"] for island in islands])
+    all_fitness_scores = np.concatenate([island["fitness_scores"] for island in islands])
+
+    best_schedule_index = int(np.argmax(all_fitness_scores))
+    optimal_schedule = Schedule.from_array(all_genomes[best_schedule_index].copy())
+    optimal_schedule.fitness = float(all_fitness_scores[best_schedule_index])
+    fitness_calculator.calculate_constraint_violations(optimal_schedule)
+
+    final_mutation_rate = float(np.mean([island["mutation_rate"] for island in islands]))
+
+    return {
+        "best_schedule": optimal_schedule,
+        "history": generation_history,
+        "final_mutation_rate": final_mutation_rate,
+        "generations_run": len(generation_history),
+        "stopped_early": stopped_early,
+        "fitness_cache": fitness_cache,
+        "final_fitness_scores": {
+            "best": float(all_fitness_scores.max()),
+            "average": float(all_fitness_scores.mean()),
+            "worst": float(all_fitness_scores.min()),
+        },
+        "number_of_islands": number_of_islands,
+    }
@@ -1,21 +1,150 @@
 """
 Data models for representing schedules and assignments.
 """
-from copy import deepcopy
-from dataclasses import dataclass
-import pandas as pd
-from gen.constants import ACTIVITY_DEFINITIONS
+import numpy as np
+from gen.constants import (
+    ALL_ACTIVITIES,
+    ALL_FACILITATORS,
+    ALL_ROOMS,
+    ALL_TIME_SLOTS,
+    ROOM_INDEX,
+    TIME_SLOT_INDEX,
+    FACILITATOR_INDEX,
+    ROOM_COLUMN,
+    TIME_COLUMN,
+    FACILITATOR_COLUMN,
+    UNASSIGNED,
+    PACKED_WORDS,
+    PACK_FIELD_MASKS,
+    PACK_WORDS,
+    PACK_SHIFTS
+)
+
+
+def _alphabetical_categorical(codes, names):
+    """
+    Build a categorical column from indices into names, with categories in
+    alphabetical order so it sorts exactly like the equivalent string column.
+    UNASSIGNED (-1) codes become missing values.
+    """
+    import pandas as pd
+
+    return pd.Categorical.from_codes(codes, categories=names).reorder_categories(sorted(names))
+
+
+def _name_at(names, index):
+    """Look up the name for an encoded index, or None if UNASSIGNED."""
+    return None if index == UNASSIGNED else names[index]
+
+
+def _index_of(name_index, name):
+    """Encode a name as its index, or UNASSIGNED for None."""
+    return UNASSIGNED if name is None else name_index[name]
+
+
+# Weight of each genome field in each packed word; fields never overlap, so a
+# matrix product of the masked fields with these sums to the bitwise OR
+_PACK_WEIGHTS = np.zeros((len(ALL_ACTIVITIES) * 3, PACKED_WORDS), dtype=np.uint64)
+_PACK_WEIGHTS[np.arange(len(ALL_ACTIVITIES) * 3), PACK_WORDS.ravel()] = np.uint64(1) << PACK_SHIFTS.ravel()
+
+
+def pack_genomes(genomes):
+    """
+    Bit-pack encoded schedules into two uint64 words each.
+
+    Args:
+        genomes: int32 array of shape (..., number of activities, 3)
+
+    Returns:
+        uint64 array of shape (..., 2); equal schedules pack to equal words
+    """
+    # UNASSIGNED (-1) masks to the field's all-ones code, which no index uses
+    fields = (genomes & PACK_FIELD_MASKS).astype(np.uint64)
+
+    return fields.reshape(genomes.shape[:-2] + (-1,)) @ _PACK_WEIGHTS
+
+
+def unpack_genomes(packed):
+    """
+    Restore encoded schedules from their bit-packed words.
+
+    Args:
+        packed: uint64 array of shape (..., 2) from pack_genomes
+
+    Returns:
+        C-contiguous int32 array of shape (..., number of activities, 3)
+    """
+    fields = (packed[..., PACK_WORDS] >> PACK_SHIFTS).astype(np.int64) & PACK_FIELD_MASKS
+    genomes = fields.astype(np.int32, order="C")
+    genomes[fields == PACK_FIELD_MASKS] = UNASSIGNED
+
+    return genomes
 
 
-@dataclass
 class ActivityAssignment:
     """
     Represents the assignment for a single activity.
     Contains room, time slot, and facilitator.
+
+    The values live in a three-element row of an encoded schedule, so an
+    assignment taken from Schedule.assignments reads and writes that
+    schedule's genome directly. A standalone assignment owns its own row.
     """
-    room: str = None
-    time: str = None
-    facilitator: str = None
+
+    __slots__ = ("_row",)
+
+    def __init__(self, room: str = None, time: str = None, facilitator: str = None):
+        self._row = np.array(
+            [_index_of(ROOM_INDEX, room),
+             _index_of(TIME_SLOT_INDEX, time),
+             _index_of(FACILITATOR_INDEX, facilitator)],
+            dtype=np.int32
+        )
+
+    @classmethod
+    def from_row(cls, row):
+        """
+        Wrap a row of an encoded schedule without copying it.
+
+        Args:
+            row: int32 array of (room, time slot, facilitator) indices
+
+        Returns:
+            ActivityAssignment viewing the given row
+        """
+        assignment = cls.__new__(cls)
+        assignment._row = row
+        return assignment
+
+    @property
+    def room(self):
+        """Get the assigned room name."""
+        return _name_at(ALL_ROOMS, self._row[ROOM_COLUMN])
+
+    @room.setter
+    def room(self, value):
+        """Set the assigned room name."""
+        self._row[ROOM_COLUMN] = _index_of(ROOM_INDEX, value)
+
+    @property
+    def time(self):
+        """Get the assigned time slot."""
+        return _name_at(ALL_TIME_SLOTS, self._row[TIME_COLUMN])
+
+    @time.setter
+    def time(self, value):
+        """Set the assigned time slot."""
+        self._row[TIME_COLUMN] = _index_of(TIME_SLOT_INDEX, value)
+
+    @property
+    def facilitator(self):
+        """Get the assigned facilitator name."""
+        return _name_at(ALL_FACILITATORS, self._row[FACILITATOR_COLUMN])
+
+    @facilitator.setter
+    def facilitator(self, value):
+        """Set the assigned facilitator name."""
+        self._row[FACILITATOR_COLUMN] = _index_of(FACILITATOR_INDEX, value)
 
     def to_dict(self):
         """Convert to dictionary format for serialization."""
@@ -27,13 +156,27 @@ class ActivityAssignment:
 
     def copy(self):
         """Create a deep copy of this assignment."""
-        return ActivityAssignment(self.room, self.time, self.facilitator)
+        return ActivityAssignment.from_row(self._row.copy())
+
+    def __eq__(self, other):
+        if not isinstance(other, ActivityAssignment):
+            return NotImplemented
+        return bool(np.array_equal(self._row, other._row))
+
+    def __repr__(self):
+        return (f"ActivityAssignment(room={self.room!r}, time={self.time!r}, "
+                f"facilitator={self.facilitator!r})")
 
 
 class Schedule:
     """
     Represents a complete schedule for all SLA activities.
     Each schedule contains assignments for all 11 activities.
+
+    The schedule is stored as an int32 genome of shape (number of activities, 3)
+    holding room, time slot, and facilitator indices (see to_array). The genome
+    may be a row of a whole-population array, in which case the schedule is a
+    view and writes go straight into that array.
     """
 
     def __init__(self, assignments_dict=None):
@@ -42,25 +185,68 @@ class Schedule:
 
         Args:
             assignments_dict: Optional dictionary of {activity_name: ActivityAssignment}
+                            whose values are copied into the schedule.
                             If None, creates empty assignments for all activities.
         """
         self._fitness_score = None  # Cache for fitness calculation
         self._violation_summary = None  # Cache for violation counts
+        self._assignments = None  # Assignment views, built on first access
+        self._genome = np.full((len(ALL_ACTIVITIES), 3), UNASSIGNED, dtype=np.int32)
 
-        if assignments_dict is None:
-            # Create empty assignments for all activities
-            self._assignments = {
-                activity_name: ActivityAssignment()
-                for activity_name in ACTIVITY_DEFINITIONS.keys()
-            }
-        else:
-            self._assignments = assignments_dict
+        if assignments_dict is not None:
+            for row, activity_name in enumerate(ALL_ACTIVITIES):
+                self._genome[row] = assignments_dict[activity_name]._row
+
+    @classmethod
+    def from_array(cls, genome):
+        """
+        Wrap an encoded schedule without copying it.
+
+        Args:
+            genome: C-contiguous int32 array of shape (number of activities, 3),
+                    e.g. one row of a population array
+
+        Returns:
+            Schedule viewing the given genome
+        """
+        schedule = cls.__new__(cls)
+        schedule._fitness_score = None
+        schedule._violation_summary = None
+        schedule._assignments = None
+        schedule._genome = genome
+        return schedule
 
     @property
     def assignments(self):
-        """Get the assignments dictionary."""
+        """Get the assignments dictionary; each assignment views a genome row."""
+        if self._assignments is None:
+            self._assignments = {
+                activity_name: ActivityAssignment.from_row(self._genome[row])
+                for row, activity_name in enumerate(ALL_ACTIVITIES)
+            }
         return self._assignments
 
+    @property
+    def rooms(self):
+        """Get the room index of every activity, as a view of the genome's room column."""
+        return self._genome[:, ROOM_COLUMN]
+
+    @property
+    def times(self):
+        """Get the time slot index of every activity, as a view of the genome's time column."""
+        return self._genome[:, TIME_COLUMN]
+
+    @property
+    def facilitators(self):
+        """Get the facilitator index of every activity, as a view of the genome's facilitator column."""
+        return self._genome[:, FACILITATOR_COLUMN]
+
+    def __getstate__(self):
+        """Pickle without the assignment views; they are rebuilt over the unpickled genome."""
+        state = self.__dict__.copy()
+        state["_assignments"] = None
+        return state
+
     @property
     def fitness(self):
         """Get the cached fitness score."""
@@ -88,32 +274,68 @@ class Schedule:
         Returns:
             A new Schedule object with copied assignments.
         """
-        copied_assignments = {
-            activity_name: assignment.copy()
-            for activity_name, assignment in self._assignments.items()
-        }
-        new_schedule = Schedule(copied_assignments)
+        new_schedule = Schedule.from_array(self._genome.copy())
         new_schedule._fitness_score = self._fitness_score
         return new_schedule
 
+    def to_array(self):
+        """
+        Get the integer encoding used by the compiled fitness kernels.
+
+        This is the schedule's own genome, not a copy; copy it before changing
+        it unless the schedule is meant to change too.
+
+        Returns:
+            int32 array of shape (number of activities, 3). Row i holds the room,
+            time slot, and facilitator indices of ALL_ACTIVITIES[i], with
+            UNASSIGNED (-1) for any attribute that has not been set.
+        """
+        return self._genome
+
+    def pack(self):
+        """
+        Get the bit-packed form of the schedule (see pack_genomes).
+
+        Returns:
+            uint64 array of two words
+        """
+        return pack_genomes(self._genome)
+
+    @classmethod
+    def unpack(cls, packed):
+        """
+        Create a schedule from its bit-packed form.
+
+        Args:
+            packed: uint64 array of two words from Schedule.pack
+
+        Returns:
+            New Schedule with the unpacked assignments
+        """
+        return cls.from_array(unpack_genomes(packed))
+
     def to_dataframe(self):
         """
         Convert schedule to pandas DataFrame for display and export.
 
+        Columns are categorical, built straight from the array encoding, so
+        sorting and grouping compare integer codes instead of strings. Time is
+        ordered by slot; the other columns sort alphabetically.
+
+        pandas is imported here, on the display and export path only, so the
+        GA and its worker processes never pay for its import.
+
         Returns:
             DataFrame with columns: Activity, Room, Time, Facilitator
         """
-        schedule_records = []
-
-        for activity_name, assignment in self._assignments.items():
-            schedule_records.append({
-                "Activity": activity_name,
-                "Room": assignment.room,
-                "Time": assignment.time,
-                "Facilitator": assignment.facilitator,
-            })
+        import pandas as pd
 
-        return pd.DataFrame(schedule_records)
+        return pd.DataFrame({
+            "Activity": _alphabetical_categorical(np.arange(len(ALL_ACTIVITIES)), ALL_ACTIVITIES),
+            "Room": _alphabetical_categorical(self.rooms, ALL_ROOMS),
+            "Time": pd.Categorical.from_codes(self.times, categories=ALL_TIME_SLOTS, ordered=True),
+            "Facilitator": _alphabetical_categorical(self.facilitators, ALL_FACILITATORS),
+        })
 
     def save_to_csv(self, filepath):
         """
@@ -130,7 +352,7 @@ class Schedule:
         lines = ["COMPLETE SCHEDULE:"]
         lines.append("-" * 80)
 
-        for activity_name, assignment in self._assignments.items():
+        for activity_name, assignment in self.assignments.items():
             lines.append(
                 f"{activity_name:8s} | "
                 f"Room: {assignment.room or 'None':<12s} | "
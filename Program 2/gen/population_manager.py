@@ -1,64 +1,87 @@
 """
 Functions for creating and managing populations of schedules.
 """
-import random
+import numpy as np
 from gen.models import Schedule, ActivityAssignment
 from gen.constants import (
-    ROOMS_WITH_CAPACITIES,
-    ALL_TIME_SLOTS,
-    ALL_FACILITATORS,
-    ACTIVITY_DEFINITIONS
+    ALL_ACTIVITIES,
+    COLUMN_CHOICE_COUNTS
 )
 
 
-def generate_random_assignment():
+def generate_random_assignment(rng=None):
     """
     Create a completely random assignment for one activity.
 
+    Args:
+        rng: NumPy random generator; a fresh unseeded one if omitted
+
     Returns:
         ActivityAssignment with random room, time, and facilitator
     """
-    random_room = random.choice(list(ROOMS_WITH_CAPACITIES.keys()))
-    random_time = random.choice(ALL_TIME_SLOTS)
-    random_facilitator = random.choice(ALL_FACILITATORS)
+    if rng is None:
+        rng = np.random.default_rng()
 
-    return ActivityAssignment(random_room, random_time, random_facilitator)
+    return ActivityAssignment.from_row(rng.integers(0, COLUMN_CHOICE_COUNTS, dtype=np.int32))
 
 
-def generate_random_schedule():
+def generate_random_schedule(rng=None):
     """
     Create a complete schedule with random assignments for all activities.
 
+    Args:
+        rng: NumPy random generator; a fresh unseeded one if omitted
+
     Returns:
         Schedule object with random assignments
     """
-    assignments_collection = {}
+    if rng is None:
+        rng = np.random.default_rng()
 
-    for activity_name in ACTIVITY_DEFINITIONS.keys():
-        assignments_collection[activity_name] = generate_random_assignment()
+    # One draw for every activity's room, time, and facilitator
+    return Schedule.from_array(
+        rng.integers(0, COLUMN_CHOICE_COUNTS, size=(len(ALL_ACTIVITIES), 3), dtype=np.int32)
+    )
 
-    return Schedule(assignments_collection)
 
-
-def create_initial_population(population_size=250):
+def create_initial_population_genomes(population_size=250, rng=None):
     """
-    Create the initial population for the genetic algorithm.
+    Create the initial population as one encoded array.
 
     Args:
         population_size: Number of schedules in the population (must be ≥ 250)
+        rng: NumPy random generator; a fresh unseeded one if omitted
 
     Returns:
-        List of Schedule objects
+        int32 array of shape (population_size, number of activities, 3) with
+        random room, time slot, and facilitator indices
     """
     if population_size < 250:
         raise ValueError(f"Population size must be at least 250, got {population_size}")
 
-    population = []
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # One draw fills every attribute of every schedule, each below its column's bound
+    return rng.integers(
+        0, COLUMN_CHOICE_COUNTS, size=(population_size, len(ALL_ACTIVITIES), 3), dtype=np.int32
+    )
+
 
-    for _ in range(population_size):
-        population.append(generate_random_schedule())
+def create_initial_population(population_size=250, rng=None):
+    """
+    Create the initial population for the genetic algorithm.
+
+    Args:
+        population_size: Number of schedules in the population (must be ≥ 250)
+        rng: NumPy random generator; a fresh unseeded one if omitted
+
+    Returns:
+        List of Schedule objects, each viewing one row of a shared population array
+    """
+    population_genomes = create_initial_population_genomes(population_size, rng)
 
-    return population
+    return [Schedule.from_array(genome) for genome in population_genomes]
 
 
 def get_population_statistics(population):
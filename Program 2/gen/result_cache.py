@@ -0,0 +1,95 @@
+"""
+Filesystem memoization of complete genetic algorithm runs.
+Results are pickled under output/cache, keyed by a hash of the run parameters,
+so previously tried settings survive app restarts and are shared between users.
+"""
+import hashlib
+import json
+import os
+import pickle
+from typing import Any, Dict, Optional
+from gen.algorithm_engine import execute_genetic_algorithm
+
+CACHE_DIRECTORY = os.path.join("output", "cache")
+
+# Bump whenever the algorithm changes what a given set of parameters produces,
+# so results computed by earlier versions are not served
+ALGORITHM_REVISION = 4
+
+
+def _cache_path(params: Dict[str, Any]) -> str:
+    """
+    Build the cache file path for a set of run parameters.
+
+    Args:
+        params: Keyword arguments for execute_genetic_algorithm
+
+    Returns:
+        Path of the pickle file holding results for these parameters
+    """
+    keyed_params = {"params": params, "algorithm_revision": ALGORITHM_REVISION}
+    cache_key = hashlib.sha256(json.dumps(keyed_params, sort_keys=True).encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIRECTORY, f"{cache_key}.pkl")
+
+
+def load_cached_result(params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Load previously computed results for these parameters.
+
+    Args:
+        params: Keyword arguments for execute_genetic_algorithm
+
+    Returns:
+        Results dictionary, or None if these parameters were never run
+    """
+    cache_path = _cache_path(params)
+
+    if not os.path.exists(cache_path):
+        return None
+
+    with open(cache_path, "rb") as cache_file:
+        return pickle.load(cache_file)
+
+
+def store_result(params: Dict[str, Any], results: Dict[str, Any]) -> None:
+    """
+    Persist results for these parameters.
+
+    Runs that were stopped early are skipped, since they do not represent the
+    full result of their parameters.
+
+    Args:
+        params: Keyword arguments for execute_genetic_algorithm
+        results: Results dictionary returned by execute_genetic_algorithm
+    """
+    if results.get("stopped_early"):
+        return
+
+    os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+    cache_path = _cache_path(params)
+
+    # Write to a temporary file first so concurrent readers never see a partial pickle
+    temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as cache_file:
+        pickle.dump(results, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, cache_path)
+
+
+def get_or_compute(params: Dict[str, Any], **run_options) -> Dict[str, Any]:
+    """
+    Return cached results for these parameters, running the GA on a miss.
+
+    Args:
+        params: Keyword arguments for execute_genetic_algorithm; these form the cache key
+        **run_options: Extra arguments that do not affect the result (e.g. progress_callback)
+
+    Returns:
+        Results dictionary from execute_genetic_algorithm
+    """
+    results = load_cached_result(params)
+
+    if results is None:
+        results = execute_genetic_algorithm(**params, **run_options)
+        store_result(params, results)
+
+    return results
@@ -1,41 +1,70 @@
 """
 Selection methods for parent selection in genetic algorithm.
 """
-import math
-import random
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
 from gen.models import Schedule
 
 
-def calculate_softmax_probabilities(fitness_scores: List[float]) -> List[float]:
+def calculate_softmax_probabilities(fitness_scores: Sequence[float],
+                                    out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Convert fitness scores to selection probabilities using softmax.
 
     Args:
-        fitness_scores: List of fitness values
+        fitness_scores: Fitness values, as an array or list
+        out: Optional float64 array of the same length to write the probabilities
+             into; may be fitness_scores itself
 
     Returns:
-        List of probabilities that sum to 1.0
+        float64 array of probabilities that sum to 1.0 (out, if given)
     """
-    if not fitness_scores:
-        return []
+    fitness_scores = np.asarray(fitness_scores, dtype=np.float64)
 
-    # For numerical stability, subtract max value
-    max_score = max(fitness_scores)
-    exponentiated_scores = [math.exp(score - max_score) for score in fitness_scores]
-    total = sum(exponentiated_scores)
+    if fitness_scores.size == 0:
+        return fitness_scores.copy() if out is None else out
 
-    # Avoid division by zero
-    if total == 0:
-        return [1.0 / len(fitness_scores)] * len(fitness_scores)
+    # For numerical stability, subtract max value; the largest term is then
+    # exp(0) = 1, so the total can never be zero
+    probabilities = np.subtract(fitness_scores, fitness_scores.max(), out=out)
+    np.exp(probabilities, out=probabilities)
+    probabilities /= probabilities.sum()
 
-    return [score / total for score in exponentiated_scores]
+    return probabilities
+
+
+def select_parent_indices(
+        selection_probabilities: Sequence[float],
+        number_of_pairs: int,
+        rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Select parent pairs by population index using weighted random selection.
+
+    Args:
+        selection_probabilities: Probability for each schedule
+        number_of_pairs: Number of parent pairs to select
+        rng: NumPy random generator
+
+    Returns:
+        int array of shape (number_of_pairs, 2) holding (parent_a, parent_b) indices
+    """
+    # Inverse-CDF sampling: one cumulative sum, then every parent is found by
+    # binary search over a single batch of uniform draws. This is what
+    # rng.choice(p=...) does internally, minus its per-call validation, so the
+    # same generator state picks the same parents. A schedule may pair with
+    # itself, that's okay.
+    cumulative_probabilities = np.cumsum(selection_probabilities, dtype=np.float64)
+    cumulative_probabilities /= cumulative_probabilities[-1]
+
+    return cumulative_probabilities.searchsorted(rng.random((number_of_pairs, 2)), side="right")
 
 
 def select_parent_pairs(
         population: List[Schedule],
-        selection_probabilities: List[float],
-        number_of_pairs: int
+        selection_probabilities: Sequence[float],
+        number_of_pairs: int,
+        rng: Optional[np.random.Generator] = None
 ) -> List[Tuple[Schedule, Schedule]]:
     """
     Select parent pairs for crossover using weighted random selection.
@@ -44,27 +73,47 @@ def select_parent_pairs(
         population: List of schedules
         selection_probabilities: Probability for each schedule
         number_of_pairs: Number of parent pairs to select
+        rng: NumPy random generator; a fresh unseeded one if omitted
 
     Returns:
         List of (parent_a, parent_b) tuples
     """
-    selected_pairs = []
+    if rng is None:
+        rng = np.random.default_rng()
+
+    parent_indices = select_parent_indices(selection_probabilities, number_of_pairs, rng)
+
+    return [(population[index_a], population[index_b]) for index_a, index_b in parent_indices.tolist()]
+
+
+def select_best_indices(fitness_scores: Sequence[float], number_to_select: int) -> np.ndarray:
+    """
+    Find the positions of the best schedules for elitism preservation.
+
+    Args:
+        fitness_scores: Fitness score for each schedule
+        number_to_select: Number of best schedules to select
 
-    for _ in range(number_of_pairs):
-        # Select first parent based on fitness
-        parent_a = random.choices(population, weights=selection_probabilities, k=1)[0]
+    Returns:
+        int array of population indices, best first
+    """
+    fitness_scores = np.asarray(fitness_scores, dtype=np.float64)
+    number_to_select = min(max(number_to_select, 0), len(fitness_scores))
 
-        # Select second parent (could be same as first, that's okay)
-        parent_b = random.choices(population, weights=selection_probabilities, k=1)[0]
+    if number_to_select == 0:
+        return np.empty(0, dtype=np.intp)
 
-        selected_pairs.append((parent_a, parent_b))
+    if number_to_select == 1:
+        return np.array([np.argmax(fitness_scores)])
 
-    return selected_pairs
+    # Partition out the top scores in linear time, then order just those
+    top_indices = np.argpartition(-fitness_scores, number_to_select - 1)[:number_to_select]
+    return top_indices[np.argsort(-fitness_scores[top_indices], kind="stable")]
 
 
 def select_best_schedules(
         population: List[Schedule],
-        fitness_scores: List[float],
+        fitness_scores: Sequence[float],
         number_to_select: int
 ) -> List[Schedule]:
     """
@@ -76,17 +125,9 @@ def select_best_schedules(
         number_to_select: Number of best schedules to select
 
     Returns:
-        List of the best schedule copies
+        List of the best schedule copies, best first
     """
-    # Pair each schedule with its fitness score
-    schedule_fitness_pairs = list(zip(population, fitness_scores))
-
-    # Sort by fitness in descending order
-    schedule_fitness_pairs.sort(key=lambda pair: pair[1], reverse=True)
-
-    # Select top schedules and return copies
-    top_schedules = []
-    for schedule, _ in schedule_fitness_pairs[:number_to_select]:
-        top_schedules.append(schedule.create_copy())
+    top_indices = select_best_indices(fitness_scores, min(number_to_select, len(population)))
 
-    return top_schedules
\ No newline at end of file
+    # Return copies of the top schedules
+    return [population[index].create_copy() for index in top_indices]
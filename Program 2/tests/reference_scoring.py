@@ -0,0 +1,220 @@
+"""
+Plain-Python reference implementation of the Appendix A rules.
+
+This is the original dictionary-based scorer, kept as the oracle the
+compiled kernels in gen.fitness_evaluator are tested against. Schedules are
+dictionaries of {activity_name: (room, time, facilitator)}, with None for an
+unassigned field.
+"""
+from typing import Dict, Optional, Tuple
+import numpy as np
+from gen.constants import (
+    ACTIVITY_DEFINITIONS,
+    ALL_ACTIVITIES,
+    ALL_FACILITATORS,
+    ALL_ROOMS,
+    ALL_TIME_SLOTS,
+    CROSS_SECTION_PAIRS,
+    FACILITATOR_COLUMN,
+    ROOM_COLUMN,
+    ROOMS_WITH_CAPACITIES,
+    SLA101_SECTIONS,
+    SLA191_SECTIONS,
+    TIME_COLUMN
+)
+
+Assignment = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+def genome_to_assignments(genome: np.ndarray) -> Dict[str, Assignment]:
+    """
+    Decode an int32 genome into the name-based form used by the reference scorer.
+
+    Args:
+        genome: int32 array of shape (number of activities, 3); UNASSIGNED fields become None
+
+    Returns:
+        Dictionary of {activity_name: (room, time, facilitator)}
+    """
+    def name_at(names, index):
+        return names[index] if index >= 0 else None
+
+    return {
+        activity_name: (name_at(ALL_ROOMS, genome[row, ROOM_COLUMN]),
+                        name_at(ALL_TIME_SLOTS, genome[row, TIME_COLUMN]),
+                        name_at(ALL_FACILITATORS, genome[row, FACILITATOR_COLUMN]))
+        for row, activity_name in enumerate(ALL_ACTIVITIES)
+    }
+
+
+def _hour_difference(time_1: str, time_2: str) -> int:
+    return abs(ALL_TIME_SLOTS.index(time_1) - ALL_TIME_SLOTS.index(time_2))
+
+
+def _is_beach_or_roman(room: Optional[str]) -> bool:
+    return bool(room) and (room.startswith("Beach") or room.startswith("Roman"))
+
+
+def _count_usage(assignments: Dict[str, Assignment]):
+    room_time_usage, facilitator_time_usage, facilitator_load = {}, {}, {}
+
+    for room, time, facilitator in assignments.values():
+        if room and time:
+            room_time_usage[(room, time)] = room_time_usage.get((room, time), 0) + 1
+        if facilitator and time:
+            facilitator_time_usage[(facilitator, time)] = facilitator_time_usage.get((facilitator, time), 0) + 1
+        if facilitator:
+            facilitator_load[facilitator] = facilitator_load.get(facilitator, 0) + 1
+
+    return room_time_usage, facilitator_time_usage, facilitator_load
+
+
+def reference_fitness(assignments: Dict[str, Assignment]) -> float:
+    """
+    Score a schedule with the original rule-by-rule implementation.
+
+    Args:
+        assignments: Dictionary of {activity_name: (room, time, facilitator)}
+
+    Returns:
+        Total fitness score
+    """
+    room_time_usage, facilitator_time_usage, facilitator_load = _count_usage(assignments)
+    total_score = 0.0
+
+    for activity_name, (room, time, facilitator) in assignments.items():
+        activity = ACTIVITY_DEFINITIONS[activity_name]
+        activity_score = 0.0
+
+        # 1. Room size
+        if room:
+            expected = activity["expected_enrollment"]
+            capacity = ROOMS_WITH_CAPACITIES[room]
+            if capacity < expected:
+                activity_score -= 0.5
+            elif capacity / expected > 3.0:
+                activity_score -= 0.4
+            elif capacity / expected > 1.5:
+                activity_score -= 0.2
+            else:
+                activity_score += 0.3
+
+        # 2. Facilitator preference
+        if facilitator:
+            if facilitator in activity["preferred_facilitators"]:
+                activity_score += 0.5
+            elif facilitator in activity["acceptable_facilitators"]:
+                activity_score += 0.2
+            else:
+                activity_score -= 0.1
+
+        # 3. Room-time conflict
+        if room and time and room_time_usage[(room, time)] > 1:
+            activity_score -= 0.5
+
+        # 4. Facilitator same-time
+        if facilitator and time:
+            concurrent_count = facilitator_time_usage[(facilitator, time)]
+            activity_score += 0.2 if concurrent_count == 1 else -0.2
+
+        # 5. Facilitator load, with Dr. Tyler only penalized at exactly 2
+        if facilitator:
+            total_load = facilitator_load[facilitator]
+            if total_load > 4:
+                activity_score -= 0.5
+            elif total_load < 3 and (facilitator != "Tyler" or total_load >= 2):
+                activity_score -= 0.4
+
+        total_score += activity_score
+
+    # Same-course section spacing
+    for section_1, section_2 in (SLA101_SECTIONS, SLA191_SECTIONS):
+        time_1, time_2 = assignments[section_1][1], assignments[section_2][1]
+        if time_1 and time_2:
+            if time_1 == time_2:
+                total_score -= 0.5
+            elif _hour_difference(time_1, time_2) > 4:
+                total_score += 0.5
+
+    # SLA101 / SLA191 interactions
+    for section_101, section_191 in CROSS_SECTION_PAIRS:
+        room_101, time_101, _ = assignments[section_101]
+        room_191, time_191, _ = assignments[section_191]
+        if not time_101 or not time_191:
+            continue
+
+        if time_101 == time_191:
+            total_score -= 0.25
+        elif _hour_difference(time_101, time_191) == 1:
+            total_score += 0.5
+            if _is_beach_or_roman(room_101) != _is_beach_or_roman(room_191):
+                total_score -= 0.4
+        elif _hour_difference(time_101, time_191) == 2:
+            total_score += 0.25
+
+    return total_score
+
+
+
+def reference_violations(assignments: Dict[str, Assignment]) -> Dict[str, int]:
+    """
+    Count constraint violations with the original rule-by-rule implementation.
+
+    Args:
+        assignments: Dictionary of {activity_name: (room, time, facilitator)}
+
+    Returns:
+        Dictionary with counts for each violation type
+    """
+    violation_counts = dict.fromkeys([
+        "room_conflicts", "room_too_small", "room_too_big_15", "room_too_big_30",
+        "facilitator_overload", "facilitator_underload", "facilitator_same_time_conflict",
+        "sla101_same_time", "sla191_same_time", "sla101_191_same_time",
+        "sla101_191_building_mismatch", "sla101_191_one_hour_gap", "sla101_191_consecutive_pair",
+    ], 0)
+    room_time_usage, facilitator_time_usage, facilitator_load = _count_usage(assignments)
+
+    for activity_name, (room, _, _) in assignments.items():
+        if room:
+            expected = ACTIVITY_DEFINITIONS[activity_name]["expected_enrollment"]
+            capacity = ROOMS_WITH_CAPACITIES[room]
+            if capacity < expected:
+                violation_counts["room_too_small"] += 1
+            elif capacity / expected > 3.0:
+                violation_counts["room_too_big_30"] += 1
+            elif capacity / expected > 1.5:
+                violation_counts["room_too_big_15"] += 1
+
+    violation_counts["room_conflicts"] = sum(count - 1 for count in room_time_usage.values() if count > 1)
+    violation_counts["facilitator_same_time_conflict"] = sum(
+        count - 1 for count in facilitator_time_usage.values() if count > 1
+    )
+
+    for facilitator, total_load in facilitator_load.items():
+        if total_load > 4:
+            violation_counts["facilitator_overload"] += 1
+        elif total_load < 3 and (facilitator != "Tyler" or total_load >= 2):
+            violation_counts["facilitator_underload"] += 1
+
+    for (section_1, section_2), violation_type in ((SLA101_SECTIONS, "sla101_same_time"),
+                                                   (SLA191_SECTIONS, "sla191_same_time")):
+        time_1, time_2 = assignments[section_1][1], assignments[section_2][1]
+        if time_1 and time_1 == time_2:
+            violation_counts[violation_type] += 1
+
+    for section_101, section_191 in CROSS_SECTION_PAIRS:
+        room_101, time_101, _ = assignments[section_101]
+        room_191, time_191, _ = assignments[section_191]
+        if not time_101 or not time_191:
+            continue
+
+        if time_101 == time_191:
+            violation_counts["sla101_191_same_time"] += 1
+        elif _hour_difference(time_101, time_191) == 1:
+            violation_counts["sla101_191_consecutive_pair"] += 1
+            if room_101 and room_191 and _is_beach_or_roman(room_101) != _is_beach_or_roman(room_191):
+                violation_counts["sla101_191_building_mismatch"] += 1
+        elif _hour_difference(time_101, time_191) == 2:
+            violation_counts["sla101_191_one_hour_gap"] += 1
+
+    return violation_counts
@@ -0,0 +1,43 @@
+"""
+Tests for the engine's background console logging.
+"""
+import logging
+import pytest
+from gen.algorithm_engine import start_background_logging, stop_background_logging
+
+
+@pytest.fixture
+def package_logger():
+    package_logger = logging.getLogger("gen")
+    original_level = package_logger.level
+    yield package_logger
+    stop_background_logging()
+    package_logger.setLevel(original_level)
+
+
+def test_background_logging_is_started_once(package_logger, capfd):
+    handlers_before = list(package_logger.handlers)
+
+    first_listener = start_background_logging()
+    second_listener = start_background_logging(logging.DEBUG)
+
+    assert second_listener is first_listener
+    assert len(package_logger.handlers) == len(handlers_before) + 1
+    assert package_logger.level == logging.DEBUG
+
+    logging.getLogger("gen.algorithm_engine").info("Generation 1 done")
+    stop_background_logging()
+
+    assert capfd.readouterr().err.count("Generation 1 done") == 1
+
+
+def test_stopping_background_logging_detaches_it(package_logger):
+    handlers_before = list(package_logger.handlers)
+    start_background_logging()
+
+    stop_background_logging()
+    stop_background_logging()  # Already stopped: nothing to do
+
+    assert package_logger.handlers == handlers_before
+    assert start_background_logging() is not None
+    assert len(package_logger.handlers) == len(handlers_before) + 1
@@ -0,0 +1,187 @@
+"""
+Regression tests pinning the compiled fitness and violation kernels to the
+reference scorer.
+"""
+import numpy as np
+import pytest
+from gen.constants import (
+    ALL_ACTIVITIES,
+    COLUMN_CHOICE_COUNTS,
+    FACILITATOR_COLUMN,
+    FACILITATOR_INDEX,
+    UNASSIGNED
+)
+from gen.fitness_evaluator import (
+    _FACILITATOR_LOAD_SCORES,
+    VIOLATION_TYPES,
+    FitnessCalculator,
+    evaluate_genome,
+    evaluate_population
+)
+from gen.models import ActivityAssignment, Schedule
+from reference_scoring import genome_to_assignments, reference_fitness, reference_violations
+
+# fastmath lets LLVM reassociate the sum, so scores agree to rounding only
+TOLERANCE = 1e-9
+
+
+def random_genomes(rng, number_of_genomes, unassigned_probability=0.1):
+    """
+    Random genomes covering unassigned fields and crowded facilitators.
+
+    Every other genome only uses the first four facilitators, so overload and
+    same-time conflicts are common, and each field is UNASSIGNED with
+    unassigned_probability.
+    """
+    genomes = rng.integers(0, COLUMN_CHOICE_COUNTS, size=(number_of_genomes, len(ALL_ACTIVITIES), 3),
+                           dtype=np.int32)
+    genomes[1::2, :, FACILITATOR_COLUMN] %= 4
+    genomes[rng.random(genomes.shape) < unassigned_probability] = UNASSIGNED
+    return genomes
+
+
+def test_kernel_matches_reference_on_random_schedules():
+    genomes = random_genomes(np.random.default_rng(2024), 3000)
+
+    for genome in genomes:
+        assert evaluate_genome(genome) == pytest.approx(
+            reference_fitness(genome_to_assignments(genome)), abs=TOLERANCE
+        )
+
+
+def test_kernel_matches_reference_on_fully_assigned_schedules():
+    genomes = random_genomes(np.random.default_rng(7), 1000, unassigned_probability=0.0)
+
+    for genome in genomes:
+        assert evaluate_genome(genome) == pytest.approx(
+            reference_fitness(genome_to_assignments(genome)), abs=TOLERANCE
+        )
+
+
+def test_fully_unassigned_schedule_scores_zero():
+    genome = np.full((len(ALL_ACTIVITIES), 3), UNASSIGNED, dtype=np.int32)
+
+    assert evaluate_genome(genome) == 0.0
+    assert reference_fitness(genome_to_assignments(genome)) == 0.0
+
+
+@pytest.mark.parametrize("facilitator_name", ["Tyler", "Glen", "Lock"])
+@pytest.mark.parametrize("load", range(len(ALL_ACTIVITIES) + 1))
+def test_facilitator_load_rules_match_reference(facilitator_name, load):
+    # The named facilitator leads exactly `load` activities; the rest go to the others at random
+    rng = np.random.default_rng(load)
+    genome = random_genomes(rng, 1, unassigned_probability=0.0)[0]
+    facilitator = FACILITATOR_INDEX[facilitator_name]
+    others = np.array([index for index in range(len(FACILITATOR_INDEX)) if index != facilitator])
+    genome[:, FACILITATOR_COLUMN] = rng.choice(others, size=len(ALL_ACTIVITIES))
+    genome[:load, FACILITATOR_COLUMN] = facilitator
+
+    assert evaluate_genome(genome) == pytest.approx(
+        reference_fitness(genome_to_assignments(genome)), abs=TOLERANCE
+    )
+
+
+def test_load_penalties_follow_appendix_a():
+    # Per-activity load term by number of activities led: overload above 4,
+    # underload below 3, except that Dr. Tyler is only penalized at exactly 2
+    tyler_row = _FACILITATOR_LOAD_SCORES[FACILITATOR_INDEX["Tyler"]]
+    glen_row = _FACILITATOR_LOAD_SCORES[FACILITATOR_INDEX["Glen"]]
+
+    np.testing.assert_array_equal(tyler_row[1:7], [0.0, -0.4, 0.0, 0.0, -0.5, -0.5])
+    np.testing.assert_array_equal(glen_row[1:7], [-0.4, -0.4, 0.0, 0.0, -0.5, -0.5])
+
+
+def test_population_kernel_matches_per_genome_kernel():
+    genomes = random_genomes(np.random.default_rng(5), 500)
+
+    np.testing.assert_array_equal(evaluate_population(genomes),
+                                  [evaluate_genome(genome) for genome in genomes])
+
+
+def test_calculator_cache_returns_kernel_scores():
+    calculator = FitnessCalculator()
+    genomes = random_genomes(np.random.default_rng(9), 200)
+    genomes[100:] = genomes[:100]  # Every genome appears twice
+
+    first_scores = calculator.calculate_genome_fitness(genomes)
+    second_scores = calculator.calculate_genome_fitness(genomes)
+
+    np.testing.assert_array_equal(first_scores, evaluate_population(genomes))
+    np.testing.assert_array_equal(second_scores, first_scores)
+    assert calculator.genome_evaluations == 100
+    assert calculator.genome_cache_hits == 300
+
+    schedule = Schedule.from_array(genomes[0].copy())
+    assert calculator.calculate_schedule_fitness(schedule) == first_scores[0]
+    assert schedule.fitness == first_scores[0]
+
+
+# ============================================================================
+# CONSTRAINT VIOLATIONS
+# ============================================================================
+
+def test_violation_counts_match_reference_on_random_schedules():
+    calculator = FitnessCalculator()
+
+    for genome in random_genomes(np.random.default_rng(31), 2000):
+        schedule = Schedule.from_array(genome)
+        assert calculator.calculate_constraint_violations(schedule) == \
+            reference_violations(genome_to_assignments(genome))
+
+
+def test_violation_counts_of_a_known_schedule():
+    schedule = Schedule({
+        "SLA101A": ActivityAssignment("Roman 201", "10 AM", "Glen"),    # 40 seats for 40
+        "SLA101B": ActivityAssignment("Frank 119", "10 AM", "Glen"),    # >1.5x; same time as SLA101A
+        "SLA191A": ActivityAssignment("Beach 301", "11 AM", "Lock"),    # Too small
+        "SLA191B": ActivityAssignment("Beach 201", "12 PM", "Lock"),    # Too small
+        "SLA201": ActivityAssignment("Loft 206", "12 PM", "Tyler"),     # Too small
+        "SLA291": ActivityAssignment("Loft 206", "12 PM", "Tyler"),     # Shares room and Tyler with SLA201
+        "SLA303": ActivityAssignment("James 325", "1 PM", "Banks"),     # >3x
+        "SLA304": ActivityAssignment("James 325", "2 PM", "Banks"),     # >3x
+        "SLA394": ActivityAssignment("Slater 003", "2 PM", "Banks"),    # >1.5x
+        "SLA449": ActivityAssignment("Slater 003", "2 PM", "Banks"),    # Shares room with SLA394
+        "SLA451": ActivityAssignment("Frank 119", "3 PM", "Banks"),     # Banks' fifth activity
+    })
+
+    violation_counts = FitnessCalculator().calculate_constraint_violations(schedule)
+
+    assert list(violation_counts) == list(VIOLATION_TYPES)
+    assert violation_counts == {
+        "room_conflicts": 2,                  # Loft 206 at 12 PM, Slater 003 at 2 PM
+        "room_too_small": 3,
+        "room_too_big_15": 2,
+        "room_too_big_30": 2,
+        "facilitator_overload": 1,            # Banks leads 5
+        "facilitator_underload": 3,           # Glen, Lock, and Tyler lead 2 each
+        "facilitator_same_time_conflict": 4,  # Glen 10 AM, Tyler 12 PM, Banks three at 2 PM
+        "sla101_same_time": 1,
+        "sla191_same_time": 0,
+        "sla101_191_same_time": 0,
+        "sla101_191_building_mismatch": 1,    # Frank 119 next to Beach 301
+        "sla101_191_one_hour_gap": 2,         # Both SLA101 sections vs SLA191B
+        "sla101_191_consecutive_pair": 2,     # Both SLA101 sections vs SLA191A
+    }
+    assert schedule.violations == violation_counts
+    assert reference_violations({name: (a.room, a.time, a.facilitator)
+                                 for name, a in schedule.assignments.items()}) == violation_counts
+
+
+def test_tyler_underload_is_only_counted_at_two_activities():
+    base_genome = random_genomes(np.random.default_rng(13), 1, unassigned_probability=0.0)[0]
+    base_genome[:, FACILITATOR_COLUMN] = FACILITATOR_INDEX["Zeldin"]
+    calculator = FitnessCalculator()
+
+    def underloads_with_tyler_leading(load):
+        genome = base_genome.copy()
+        genome[:load, FACILITATOR_COLUMN] = FACILITATOR_INDEX["Tyler"]
+        return calculator.calculate_constraint_violations(Schedule.from_array(genome))["facilitator_underload"]
+
+    # Zeldin leads the remaining 8 or more activities, so only Tyler can be underloaded
+    assert [underloads_with_tyler_leading(load) for load in (1, 2, 3)] == [0, 1, 0]
+
+
+def test_unassigned_schedule_has_no_violations():
+    genome = np.full((len(ALL_ACTIVITIES), 3), UNASSIGNED, dtype=np.int32)
+
+    assert set(FitnessCalculator().calculate_constraint_violations(Schedule.from_array(genome)).values()) == {0}
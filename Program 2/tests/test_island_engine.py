@@ -0,0 +1,91 @@
+"""
+Tests for the island model: exact generation counts, migration timing, and
+islands evolving across periods exactly like one uninterrupted run.
+"""
+import numpy as np
+from gen import island_engine
+from gen.algorithm_engine import GeneticAlgorithmEngine, execute_genetic_algorithm
+from gen.models import Schedule
+from gen.population_manager import create_initial_population_genomes
+
+
+def spy_on_migrations(monkeypatch):
+    """Record (generations completed, length of the period just run) at every migration."""
+    migrations = []
+    migrate_around_ring = island_engine._migrate_around_ring
+
+    def recording_migrate_around_ring(islands, migrants):
+        period_history = islands[0]["history"]
+        migrations.append((period_history[-1]["generation"] + 1, len(period_history)))
+        migrate_around_ring(islands, migrants)
+
+    monkeypatch.setattr(island_engine, "_migrate_around_ring", recording_migrate_around_ring)
+    return migrations
+
+
+def test_engine_runs_exactly_maximum_generations_without_termination_checks():
+    results = GeneticAlgorithmEngine().run_optimization(
+        minimum_generations=5, maximum_generations=25, seed=3, check_termination=False
+    )
+
+    assert results["generations_run"] == 25
+    assert [record["generation"] for record in results["history"]] == list(range(25))
+
+
+def test_islands_run_exact_generations_and_migrate_every_period(monkeypatch):
+    migrations = spy_on_migrations(monkeypatch)
+
+    results = island_engine.run_islands(
+        number_of_islands=2, migration_period=7,
+        minimum_generations=30, maximum_generations=30, seed=11
+    )
+
+    assert results["generations_run"] == 30
+    assert results["number_of_islands"] == 2
+    assert [record["generation"] for record in results["history"]] == list(range(30))
+    # Full periods end at 7, 14, 21 and 28; the final 2-generation period has no migration
+    assert migrations == [(7, 7), (14, 7), (21, 7), (28, 7)]
+
+
+def test_islands_only_terminate_at_period_boundaries(monkeypatch):
+    migrations = spy_on_migrations(monkeypatch)
+
+    results = island_engine.run_islands(
+        number_of_islands=2, migration_period=6,
+        minimum_generations=12, maximum_generations=200, seed=4
+    )
+
+    generations_run = results["generations_run"]
+    assert generations_run >= 12
+    assert generations_run % 6 == 0 or generations_run == 200
+    assert [generation for generation, _ in migrations] == list(range(6, generations_run, 6))
+
+
+def test_single_island_evolves_like_one_uninterrupted_run():
+    # Mirror run_islands: spawn the island's generator, then draw its population
+    rng = np.random.default_rng(21)
+    island_rng = rng.spawn(1)[0]
+    population_genomes = create_initial_population_genomes(250, rng)
+    uninterrupted_results = GeneticAlgorithmEngine().run_optimization(
+        initial_population=[Schedule.from_array(genome) for genome in population_genomes],
+        maximum_generations=45, seed=island_rng, check_termination=False
+    )
+
+    island_results = island_engine.run_islands(
+        number_of_islands=1, migration_period=8,
+        minimum_generations=45, maximum_generations=45, seed=21
+    )
+
+    # Generator, mutation schedule and improvement window all carry over periods
+    assert island_results["history"] == uninterrupted_results["history"]
+    assert island_results["final_mutation_rate"] == uninterrupted_results["final_mutation_rate"]
+
+
+def test_execute_genetic_algorithm_dispatches_to_islands():
+    results = execute_genetic_algorithm(
+        number_of_islands=2, population_size=250,
+        minimum_generations=20, maximum_generations=20, seed=2
+    )
+
+    assert results["number_of_islands"] == 2
+    assert results["generations_run"] == 20
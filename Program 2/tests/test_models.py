@@ -0,0 +1,119 @@
+"""
+Tests for the schedule encodings the fitness cache depends on.
+"""
+import numpy as np
+from gen.constants import (
+    ALL_ACTIVITIES,
+    COLUMN_CHOICE_COUNTS,
+    FACILITATOR_COLUMN,
+    PACKED_WORDS,
+    ROOM_COLUMN,
+    TIME_COLUMN,
+    UNASSIGNED
+)
+from gen.fitness_evaluator import _genome_cache_keys
+from gen.models import Schedule, pack_genomes, unpack_genomes
+
+GENOME_SHAPE = (len(ALL_ACTIVITIES), 3)
+
+
+def random_genomes(rng, number_of_genomes, unassigned_probability=0.2):
+    """Random genomes in which each field is UNASSIGNED with unassigned_probability."""
+    genomes = rng.integers(0, COLUMN_CHOICE_COUNTS, size=(number_of_genomes,) + GENOME_SHAPE, dtype=np.int32)
+    genomes[rng.random(genomes.shape) < unassigned_probability] = UNASSIGNED
+    return genomes
+
+
+def single_field_variants(base_genome):
+    """The base genome plus every genome that differs from it in exactly one field."""
+    variants = [base_genome]
+
+    for row in range(GENOME_SHAPE[0]):
+        for column in range(GENOME_SHAPE[1]):
+            for value in range(UNASSIGNED, int(COLUMN_CHOICE_COUNTS[column])):
+                if value != base_genome[row, column]:
+                    variant = base_genome.copy()
+                    variant[row, column] = value
+                    variants.append(variant)
+
+    return np.stack(variants)
+
+
+def test_pack_round_trips_random_genomes_with_unassigned_fields():
+    genomes = random_genomes(np.random.default_rng(3), 5000)
+    genomes[0] = UNASSIGNED  # Every field unassigned
+    genomes[1] = COLUMN_CHOICE_COUNTS - 1  # Every field at its largest index
+
+    packed = pack_genomes(genomes)
+    assert packed.shape == (len(genomes), PACKED_WORDS)
+    assert packed.dtype == np.uint64
+
+    unpacked = unpack_genomes(packed)
+    np.testing.assert_array_equal(unpacked, genomes)
+    assert unpacked.dtype == np.int32 and unpacked.flags.c_contiguous
+
+
+def test_pack_keeps_leading_dimensions():
+    genomes = random_genomes(np.random.default_rng(4), 12).reshape((3, 4) + GENOME_SHAPE)
+
+    packed = pack_genomes(genomes)
+
+    assert packed.shape == (3, 4, PACKED_WORDS)
+    np.testing.assert_array_equal(packed.reshape(12, PACKED_WORDS),
+                                  pack_genomes(genomes.reshape((12,) + GENOME_SHAPE)))
+    np.testing.assert_array_equal(unpack_genomes(packed), genomes)
+
+
+def test_schedule_pack_round_trip():
+    genome = random_genomes(np.random.default_rng(5), 1)[0]
+
+    restored = Schedule.unpack(Schedule.from_array(genome).pack())
+
+    np.testing.assert_array_equal(restored.to_array(), genome)
+
+
+def test_schedule_columns_view_the_genome():
+    genome = random_genomes(np.random.default_rng(10), 1)[0]
+    schedule = Schedule.from_array(genome)
+
+    np.testing.assert_array_equal(schedule.rooms, genome[:, ROOM_COLUMN])
+    np.testing.assert_array_equal(schedule.times, genome[:, TIME_COLUMN])
+    np.testing.assert_array_equal(schedule.facilitators, genome[:, FACILITATOR_COLUMN])
+
+    schedule.times[0] = 5
+    assert genome[0, TIME_COLUMN] == 5
+    assert schedule.assignments[ALL_ACTIVITIES[0]].time == "3 PM"
+
+
+def test_dataframe_decodes_every_column():
+    genome = random_genomes(np.random.default_rng(12), 1)[0]
+    schedule = Schedule.from_array(genome)
+
+    dataframe = schedule.to_dataframe()
+
+    assert list(dataframe["Activity"]) == list(ALL_ACTIVITIES)
+    for column_name, attribute in (("Room", "room"), ("Time", "time"), ("Facilitator", "facilitator")):
+        expected = [getattr(schedule.assignments[name], attribute) for name in ALL_ACTIVITIES]
+        actual = [None if value != value else value for value in dataframe[column_name]]  # NaN is unassigned
+        assert actual == expected
+
+
+def test_cache_keys_distinguish_every_single_field_change():
+    # All-zero and all-unassigned bases cover keys whose packed bytes end in zeros
+    for base_genome in (np.zeros(GENOME_SHAPE, dtype=np.int32),
+                        np.full(GENOME_SHAPE, UNASSIGNED, dtype=np.int32),
+                        random_genomes(np.random.default_rng(6), 1)[0]):
+        variants = single_field_variants(base_genome)
+
+        assert len(set(_genome_cache_keys(variants))) == len(variants)
+
+
+def test_cache_keys_are_equal_exactly_when_genomes_are():
+    genomes = random_genomes(np.random.default_rng(8), 20000, unassigned_probability=0.5)
+    genomes[10000:15000] = genomes[:5000]  # Known duplicates
+
+    keys = _genome_cache_keys(genomes)
+    number_of_distinct_genomes = len(np.unique(genomes.reshape(len(genomes), -1), axis=0))
+
+    assert len(set(keys)) == number_of_distinct_genomes
+    assert keys[10000:15000] == keys[:5000]